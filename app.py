@@ -12,9 +12,37 @@ import python313_fix
 
 # Add project root to path
 project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
-from ui import MainWindow
+
+# Location of ffmpeg resolved on a previous launch
+FFMPEG_PATH_CACHE = Path.home() / ".transcribair" / "ffmpeg_path.txt"
+
+
+def _read_ffmpeg_cache():
+    """Return the cached ffmpeg executable path if it still exists."""
+    try:
+        cached = FFMPEG_PATH_CACHE.read_text(encoding='utf-8').strip()
+    except OSError:
+        return None
+    return cached if cached and os.path.isfile(cached) else None
+
+
+def _write_ffmpeg_cache(ffmpeg_exe):
+    """Remember where ffmpeg was found so the next launch can skip the search."""
+    try:
+        FFMPEG_PATH_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        FFMPEG_PATH_CACHE.write_text(str(ffmpeg_exe), encoding='utf-8')
+    except OSError as e:
+        print(f"Could not cache FFmpeg location: {e}")
+
+
+def _prepend_to_path(directory):
+    """Put a directory at the front of PATH unless it is already listed."""
+    current = os.environ.get("PATH", "")
+    if str(directory) not in current.split(os.pathsep):
+        os.environ["PATH"] = str(directory) + os.pathsep + current
 
 
 def setup_ffmpeg():
@@ -27,11 +55,19 @@ def setup_ffmpeg():
         # Add FFmpeg to PATH if bundled
         ffmpeg_path = application_path / "ffmpeg"
         if ffmpeg_path.exists():
-            os.environ["PATH"] = str(ffmpeg_path) + os.pathsep + os.environ["PATH"]
+            _prepend_to_path(ffmpeg_path)
             return True
 
+    # Reuse the location found on a previous launch (skips the PATH search)
+    cached_exe = _read_ffmpeg_cache()
+    if cached_exe:
+        _prepend_to_path(os.path.dirname(cached_exe))
+        return True
+
     # Check if FFmpeg is available
-    if shutil.which("ffmpeg"):
+    system_exe = shutil.which("ffmpeg")
+    if system_exe:
+        _write_ffmpeg_cache(system_exe)
         return True
 
     # Check in our install directory
@@ -39,7 +75,8 @@ def setup_ffmpeg():
     ffmpeg_exe = install_dir / ("ffmpeg.exe" if os.name == 'nt' else "ffmpeg")
 
     if ffmpeg_exe.exists():
-        os.environ["PATH"] = str(install_dir) + os.pathsep + os.environ.get("PATH", "")
+        _prepend_to_path(install_dir)
+        _write_ffmpeg_cache(ffmpeg_exe)
         return True
 
     # FFmpeg not found - try to install
@@ -48,6 +85,8 @@ def setup_ffmpeg():
         from install_ffmpeg import FFmpegInstaller
         installer = FFmpegInstaller(auto_install=True)
         if installer.install():
+            if ffmpeg_exe.exists():
+                _write_ffmpeg_cache(ffmpeg_exe)
             return True
     except Exception as e:
         print(f"Failed to install FFmpeg: {e}")
@@ -73,6 +112,9 @@ def main():
         )
         sys.exit(1)
 
+    # Import the UI only once FFmpeg is known to be available
+    from ui import MainWindow
+
     # Create and run app
     app = MainWindow()
     app.mainloop()
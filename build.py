@@ -2,6 +2,7 @@
 Build script for creating Transcribair executable.
 Handles PyInstaller build with proper configuration and FFmpeg bundling.
 """
+import re
 import subprocess
 import sys
 from pathlib import Path
@@ -47,12 +48,22 @@ def install_ffmpeg():
 
 def get_size_mb(path: Path) -> float:
     """Get file or directory size in MB."""
-    if path.is_file():
-        return path.stat().st_size / (1024 * 1024)
-    elif path.is_dir():
-        total = sum(f.stat().st_size for f in path.rglob('*') if f.is_file())
-        return total / (1024 * 1024)
-    return 0.0
+    if os.path.isfile(path):
+        return os.path.getsize(path) / (1024 * 1024)
+    if not os.path.isdir(path):
+        return 0.0
+
+    # Walk with scandir so each entry's type/size comes from the directory read
+    total = 0
+    stack = [str(path)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    total += entry.stat(follow_symlinks=False).st_size
+    return total / (1024 * 1024)
 
 
 def build_executable(ffmpeg_path: str):
@@ -80,10 +91,13 @@ def build_executable(ffmpeg_path: str):
     print("• Excluding unused packages (matplotlib, scipy, pandas, etc.)")
     print("• Enabling UPX compression")
     print("• Stripping debug symbols")
+    print("• Compiling optimized bytecode (-O, asserts removed)")
     print("")
 
+    # -O rather than -OO: cffi's pycparser (used by sounddevice/soundfile)
+    # reads its grammar from docstrings, so they must stay in the bundle
     result = subprocess.run(
-        [sys.executable, "-m", "PyInstaller", "build.spec", "--clean"],
+        [sys.executable, "-O", "-m", "PyInstaller", "build.spec", "--clean"],
         capture_output=False
     )
 
@@ -98,6 +112,7 @@ def build_executable(ffmpeg_path: str):
         print(f"Size: {exe_size:.2f} MB")
         print("\nOptimizations applied:")
         print("  [OK] Excluded unused packages")
+        print("  [OK] Optimized bytecode (-O)")
         print("  [OK] UPX compression disabled (for compatibility)")
         print("  [OK] Debug symbols preserved (for stability)")
         print("  [OK] FFmpeg bundled ({} executables)".format(
@@ -117,14 +132,19 @@ def update_spec_with_ffmpeg(ffmpeg_path: str):
     """Update build.spec to include FFmpeg binaries."""
     spec_file = Path("build.spec")
 
-    # Find FFmpeg executables
-    ffmpeg_dir = Path(ffmpeg_path)
-    ffmpeg_files = []
+    # Find FFmpeg executables with a single directory read
+    ffmpeg_exes = ['ffmpeg.exe', 'ffprobe.exe', 'ffplay.exe']
+    found = {}
+    try:
+        with os.scandir(ffmpeg_path) as entries:
+            for entry in entries:
+                if entry.name in ffmpeg_exes and entry.is_file():
+                    found[entry.name] = entry.path
+    except OSError:
+        pass
 
-    for exe in ['ffmpeg.exe', 'ffprobe.exe', 'ffplay.exe']:
-        exe_path = ffmpeg_dir / exe
-        if exe_path.exists():
-            ffmpeg_files.append((str(exe_path), 'ffmpeg'))
+    # Keep a fixed order so the generated spec is stable between builds
+    ffmpeg_files = [(found[exe], 'ffmpeg') for exe in ffmpeg_exes if exe in found]
 
     if not ffmpeg_files:
         print("[WARNING] No FFmpeg executables found to bundle")
@@ -132,18 +152,21 @@ def update_spec_with_ffmpeg(ffmpeg_path: str):
 
     # Read current spec
     with open(spec_file, 'r') as f:
-        spec_content = f.read()
+        original_content = f.read()
 
-    # Update binaries section
+    # Update binaries section (matches both the empty list and a previous build's list)
     binaries_str = str(ffmpeg_files).replace("'", '"')
-    spec_content = spec_content.replace(
-        "binaries=[],",
-        f"binaries={binaries_str},"
+    spec_content = re.sub(
+        r'binaries=\[[^\]]*\],',
+        lambda _: f"binaries={binaries_str},",
+        original_content,
+        count=1
     )
 
-    # Write updated spec
-    with open(spec_file, 'w') as f:
-        f.write(spec_content)
+    # Write updated spec only if it changed, so PyInstaller's cache stays valid
+    if spec_content != original_content:
+        with open(spec_file, 'w') as f:
+            f.write(spec_content)
 
     print(f"[OK] Bundling {len(ffmpeg_files)} FFmpeg executables")
 
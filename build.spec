@@ -37,6 +37,10 @@ a = Analysis(
         'openpyxl',
         'reportlab',
         'docx',
+        # Loaded lazily by core/__init__.py, invisible to static analysis
+        'core.transcriber',
+        'core.recorder',
+        'core.audio_utils',
     ],
     hookspath=[],
     hooksconfig={},
@@ -49,10 +53,13 @@ a = Analysis(
         'torch',
         'tensorflow',
         'jax',
-        # Test frameworks
+        # Test frameworks and bundled test suites
         'pytest',
         'unittest',
         'nose',
+        'tests',
+        'tkinter.test',
+        'numpy.tests',
         # Development tools
         'IPython',
         'jupyter',
@@ -64,10 +71,8 @@ a = Analysis(
         'pydoc',
         'pdb',
         'difflib',
-        'asyncio',
         'multiprocessing',
         'xml.dom',
-        'xml.etree',
         'xmlrpc',
     ],
     win_no_prefer_redirects=False,
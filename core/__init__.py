@@ -1,6 +1,22 @@
 """Core functionality for Transcribair."""
-from .transcriber import Transcriber
-from .recorder import AudioRecorder
-from .audio_utils import AudioUtils
+import importlib
+
+# Heavy modules (faster-whisper, sounddevice) are imported on first access
+# via PEP 562 so that importing e.g. core.rubric stays cheap.
+_LAZY_IMPORTS = {
+    'Transcriber': '.transcriber',
+    'AudioRecorder': '.recorder',
+    'AudioUtils': '.audio_utils',
+}
 
 __all__ = ['Transcriber', 'AudioRecorder', 'AudioUtils']
+
+
+def __getattr__(name):
+    """Import core classes lazily on first access."""
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,12 +1,61 @@
 """
 Audio file utilities for format conversion and validation.
-Uses pydub for handling multiple audio formats.
+Uses FFmpeg directly, with pydub as a fallback decoder.
 """
+import json
 import os
+import shutil
+import subprocess
+import sys
 from pathlib import Path
 from typing import Optional, Tuple
-from pydub import AudioSegment
-from pydub.utils import mediainfo
+
+# Resolved paths of the FFmpeg executables (set on first use)
+_FFMPEG_BIN: Optional[str] = None
+_FFPROBE_BIN: Optional[str] = None
+
+# Keep the windowed executable from flashing a console for each FFmpeg call
+_SUBPROCESS_FLAGS = subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
+
+
+def _find_ffmpeg_tool(name: str) -> str:
+    """Locate an FFmpeg tool using the same search order as app.setup_ffmpeg()."""
+    exe_name = f"{name}.exe" if os.name == 'nt' else name
+
+    # Bundled with the PyInstaller executable
+    if getattr(sys, 'frozen', False):
+        bundled = Path(sys._MEIPASS) / "ffmpeg" / exe_name
+        if bundled.exists():
+            return str(bundled)
+
+    # System PATH
+    found = shutil.which(name)
+    if found:
+        return found
+
+    # Our install directory
+    installed = Path.home() / ".transcribair" / "ffmpeg" / exe_name
+    if installed.exists():
+        return str(installed)
+
+    # Fall back to the bare name and let subprocess report it missing
+    return name
+
+
+def _get_ffmpeg_bin() -> str:
+    """Get the cached ffmpeg executable path."""
+    global _FFMPEG_BIN
+    if _FFMPEG_BIN is None:
+        _FFMPEG_BIN = _find_ffmpeg_tool("ffmpeg")
+    return _FFMPEG_BIN
+
+
+def _get_ffprobe_bin() -> str:
+    """Get the cached ffprobe executable path."""
+    global _FFPROBE_BIN
+    if _FFPROBE_BIN is None:
+        _FFPROBE_BIN = _find_ffmpeg_tool("ffprobe")
+    return _FFPROBE_BIN
 
 
 class AudioUtils:
@@ -22,6 +71,8 @@ class AudioUtils:
         '.wma': 'WMA',
         '.opus': 'OPUS'
     }
+    _SUPPORTED_EXT = frozenset(SUPPORTED_FORMATS)
+    _SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
 
     @staticmethod
     def is_supported_format(file_path: str) -> bool:
@@ -34,8 +85,7 @@ class AudioUtils:
         Returns:
             True if format is supported
         """
-        ext = Path(file_path).suffix.lower()
-        return ext in AudioUtils.SUPPORTED_FORMATS
+        return os.path.splitext(file_path)[1].lower() in AudioUtils._SUPPORTED_EXT
 
     @staticmethod
     def get_audio_info(file_path: str) -> dict:
@@ -48,31 +98,65 @@ class AudioUtils:
         Returns:
             Dictionary with audio info (duration, format, size, etc.)
         """
-        if not os.path.exists(file_path):
+        # Get file info (a single stat covers both existence and size)
+        try:
+            file_size = os.stat(file_path).st_size
+        except FileNotFoundError:
             raise FileNotFoundError(f"Audio file not found: {file_path}")
-
-        # Get file info
-        file_size = os.path.getsize(file_path)
-        ext = Path(file_path).suffix.lower()
+        ext = os.path.splitext(file_path)[1].lower()
 
         try:
-            # Load audio to get detailed info
-            audio = AudioSegment.from_file(file_path)
+            # Read container/stream headers via ffprobe instead of decoding the audio
+            result = subprocess.run(
+                [
+                    _get_ffprobe_bin(),
+                    '-v', 'error',
+                    '-select_streams', 'a:0',
+                    '-show_format', '-show_streams',
+                    '-of', 'json',
+                    file_path
+                ],
+                check=True,
+                capture_output=True,
+                text=True,
+                encoding='utf-8',
+                errors='replace',
+                creationflags=_SUBPROCESS_FLAGS
+            )
+            probe = json.loads(result.stdout)
+            fmt = probe.get('format', {})
+            stream = (probe.get('streams') or [{}])[0]
+            duration = AudioUtils._probe_number(fmt.get('duration') or stream.get('duration'))
+
+            if duration:
+                sample_rate = int(AudioUtils._probe_number(stream.get('sample_rate')))
+                channels = int(AudioUtils._probe_number(stream.get('channels')))
+                bitrate = int(AudioUtils._probe_number(fmt.get('bit_rate') or stream.get('bit_rate')))
+            else:
+                # Some containers don't report a duration - fall back to a full decode
+                from pydub import AudioSegment
+                audio = AudioSegment.from_file(file_path)
+                duration = len(audio) / 1000.0
+                sample_rate = audio.frame_rate
+                channels = audio.channels
+                bitrate = audio.frame_rate * audio.frame_width * audio.channels * 8
 
             info = {
                 'path': file_path,
                 'format': AudioUtils.SUPPORTED_FORMATS.get(ext, 'Unknown'),
-                'duration_seconds': len(audio) / 1000.0,
-                'duration_formatted': AudioUtils._format_duration(len(audio) / 1000.0),
-                'sample_rate': audio.frame_rate,
-                'channels': audio.channels,
+                'duration_seconds': duration,
+                'duration_formatted': AudioUtils._format_duration(duration),
+                'sample_rate': sample_rate,
+                'channels': channels,
                 'file_size_bytes': file_size,
                 'file_size_formatted': AudioUtils._format_file_size(file_size),
-                'bitrate': audio.frame_rate * audio.frame_width * audio.channels * 8
+                'bitrate': bitrate
             }
 
             return info
 
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(f"Error reading audio file: {e.stderr.strip() or e}")
         except Exception as e:
             raise RuntimeError(f"Error reading audio file: {str(e)}")
 
@@ -96,31 +180,62 @@ class AudioUtils:
         if not os.path.exists(input_path):
             raise FileNotFoundError(f"Input file not found: {input_path}")
 
+        # Already a mono 16-bit WAV at the target rate (e.g. our own recordings)
+        if AudioUtils._is_target_wav(input_path, sample_rate):
+            if output_path is None:
+                return input_path
+            shutil.copyfile(input_path, output_path)
+            return output_path
+
         # Determine output path
         if output_path is None:
             input_file = Path(input_path)
             output_path = str(input_file.parent / f"{input_file.stem}_converted.wav")
 
         try:
-            # Load audio file
-            audio = AudioSegment.from_file(input_path)
-
-            # Convert to mono and set sample rate
-            audio = audio.set_channels(1)
-            audio = audio.set_frame_rate(sample_rate)
-
-            # Export as WAV
-            audio.export(
-                output_path,
-                format='wav',
-                parameters=["-ac", "1"]  # Ensure mono
+            # Let ffmpeg decode, downmix and resample in a single streaming pass
+            subprocess.run(
+                [
+                    _get_ffmpeg_bin(), '-y',
+                    '-i', input_path,
+                    '-ac', '1',
+                    '-ar', str(sample_rate),
+                    '-vn', '-sn', '-dn',
+                    '-loglevel', 'error',
+                    output_path
+                ],
+                check=True,
+                capture_output=True,
+                text=True,
+                encoding='utf-8',
+                errors='replace',
+                creationflags=_SUBPROCESS_FLAGS
             )
 
             return output_path
 
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(f"Error converting audio file: {e.stderr.strip() or e}")
         except Exception as e:
             raise RuntimeError(f"Error converting audio file: {str(e)}")
 
+    @staticmethod
+    def _is_target_wav(file_path: str, sample_rate: int) -> bool:
+        """Check a WAV header for mono 16-bit PCM at the given sample rate."""
+        if not file_path.lower().endswith('.wav'):
+            return False
+
+        import wave
+        try:
+            with wave.open(file_path, 'rb') as wav:
+                return (
+                    wav.getnchannels() == 1
+                    and wav.getframerate() == sample_rate
+                    and wav.getsampwidth() == 2
+                )
+        except (wave.Error, EOFError):
+            return False
+
     @staticmethod
     def validate_audio_file(file_path: str) -> Tuple[bool, str]:
         """
@@ -136,22 +251,47 @@ class AudioUtils:
             return False, "File does not exist"
 
         if not AudioUtils.is_supported_format(file_path):
-            ext = Path(file_path).suffix.lower()
+            ext = os.path.splitext(file_path)[1].lower()
             supported = ', '.join(AudioUtils.SUPPORTED_FORMATS.keys())
             return False, f"Unsupported format '{ext}'. Supported: {supported}"
 
         try:
-            # Try to load audio
-            audio = AudioSegment.from_file(file_path)
+            # Probe the container header only - no decoding
+            result = subprocess.run(
+                [
+                    _get_ffprobe_bin(),
+                    '-v', 'error',
+                    '-show_entries', 'format=duration',
+                    '-of', 'default=nk=1:nw=1',
+                    file_path
+                ],
+                capture_output=True,
+                text=True,
+                encoding='utf-8',
+                errors='replace',
+                creationflags=_SUBPROCESS_FLAGS
+            )
+        except Exception as e:
+            return False, f"Cannot load audio file: {str(e)}"
 
-            # Check duration (at least 0.1 seconds)
-            if len(audio) < 100:
-                return False, "Audio file is too short (minimum 0.1 seconds)"
+        if result.returncode != 0:
+            return False, f"Cannot load audio file: {result.stderr.strip()}"
 
-            return True, ""
+        # Check duration (at least 0.1 seconds). Containers that don't store a
+        # duration report N/A; those are left to the decode fallback in get_audio_info.
+        duration = result.stdout.strip()
+        if duration != 'N/A' and AudioUtils._probe_number(duration) < 0.1:
+            return False, "Audio file is too short (minimum 0.1 seconds)"
 
-        except Exception as e:
-            return False, f"Cannot load audio file: {str(e)}"
+        return True, ""
+
+    @staticmethod
+    def _probe_number(value) -> float:
+        """Parse a numeric ffprobe field, treating missing or 'N/A' values as 0."""
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return 0.0
 
     @staticmethod
     def _format_duration(seconds: float) -> str:
@@ -168,8 +308,8 @@ class AudioUtils:
     @staticmethod
     def _format_file_size(bytes_size: int) -> str:
         """Format file size in human-readable format."""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if bytes_size < 1024.0:
-                return f"{bytes_size:.1f} {unit}"
-            bytes_size /= 1024.0
-        return f"{bytes_size:.1f} TB"
+        if bytes_size <= 0:
+            return "0.0 B"
+        # Each unit is 2**10 larger, so the unit index falls out of the bit length
+        unit_index = min((bytes_size.bit_length() - 1) // 10, len(AudioUtils._SIZE_UNITS) - 1)
+        return f"{bytes_size / (1 << (unit_index * 10)):.1f} {AudioUtils._SIZE_UNITS[unit_index]}"
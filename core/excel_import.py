@@ -2,8 +2,15 @@
 Excel rubric import functionality.
 Supports auto-detection of simple and analytic rubric formats.
 """
+import copy
+import importlib.util
+import os
+import re
+import zipfile
+from collections import OrderedDict
+import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import Optional, List, Tuple
+from typing import Iterator, Optional, List, Set, Tuple
 from dataclasses import dataclass
 
 from .rubric import Rubric, RubricCriterion, PerformanceLevel
@@ -14,11 +21,212 @@ class ParsedRubricData:
     """Intermediate representation of parsed Excel data."""
     rubric_name: str
     rubric_description: str
-    criteria_data: List[dict]
+    criteria_data: List[RubricCriterion]
     is_analytic: bool  # True if has performance levels
     performance_level_names: List[str]  # Column headers for performance levels
 
 
+class UncalculatedFormulasError(ValueError):
+    """The sheet's weights come from formulas that Excel never calculated and saved."""
+
+
+# Recently parsed files, keyed on (path, mtime, size), least recently used first
+_PARSE_CACHE: "OrderedDict[tuple, ParsedRubricData]" = OrderedDict()
+_PARSE_CACHE_SIZE = 8
+
+
+class _ExcelSniffer:
+    """
+    Minimal streaming reader for the active sheet of an .xlsx file.
+
+    Reads cell values straight from the zip archive with ElementTree, without
+    building openpyxl's workbook model. Anything it does not understand raises,
+    and the importer falls back to openpyxl.
+    """
+
+    _REL_ID = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id'
+
+    # Built-in number formats that display dates/times
+    _BUILTIN_DATE_FORMATS = frozenset(range(14, 23)) | frozenset(range(45, 48))
+    # Literal text, [colors/conditions] and escaped chars are ignored when spotting date codes
+    _FORMAT_LITERAL_RE = re.compile(r'"[^"]*"|\[[^\]]*\]|\\.')
+    _DATE_CODE_RE = re.compile(r'[dmyhs]', re.IGNORECASE)
+
+    def __init__(self, file_path: Path):
+        self._zip = zipfile.ZipFile(file_path)
+        # Columns holding formulas with no saved result (never calculated by Excel)
+        self.uncalculated_columns: Set[int] = set()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self._zip.close()
+
+    @staticmethod
+    def _local_name(tag: str) -> str:
+        """Strip the XML namespace from a tag."""
+        return tag.rpartition('}')[2]
+
+    @classmethod
+    def _text_of(cls, element) -> str:
+        """Join the text runs of a string item (skipping phonetic hints)."""
+        parts = []
+        for child in element:
+            name = cls._local_name(child.tag)
+            if name == 't':
+                parts.append(child.text or '')
+            elif name == 'r':
+                parts.extend(t.text or '' for t in child if cls._local_name(t.tag) == 't')
+        return ''.join(parts)
+
+    def _resolve_parts(self) -> Tuple[str, Optional[str], Optional[str]]:
+        """Find the archive paths of the active worksheet, shared strings and styles."""
+        with self._zip.open('xl/workbook.xml') as f:
+            workbook = ET.parse(f).getroot()
+
+        active_tab = None
+        sheet_rel_ids = []
+        for element in workbook.iter():
+            name = self._local_name(element.tag)
+            if name == 'workbookView' and active_tab is None:
+                active_tab = int(element.get('activeTab', 0))
+            elif name == 'sheet':
+                sheet_rel_ids.append(element.get(self._REL_ID))
+
+        with self._zip.open('xl/_rels/workbook.xml.rels') as f:
+            relationships = ET.parse(f).getroot()
+
+        targets = {}
+        shared_strings = styles = None
+        for rel in relationships:
+            target = rel.get('Target', '')
+            target = target[1:] if target.startswith('/') else f"xl/{target}"
+            targets[rel.get('Id')] = target
+            rel_type = rel.get('Type', '')
+            if rel_type.endswith('/sharedStrings'):
+                shared_strings = target
+            elif rel_type.endswith('/styles'):
+                styles = target
+
+        # Some writers only declare the shared strings in [Content_Types].xml
+        if shared_strings is None and 'xl/sharedStrings.xml' in self._zip.namelist():
+            shared_strings = 'xl/sharedStrings.xml'
+
+        return targets[sheet_rel_ids[active_tab or 0]], shared_strings, styles
+
+    def _read_date_styles(self, part: str) -> frozenset:
+        """Find the cell style indices whose number format displays a date."""
+        with self._zip.open(part) as f:
+            root = ET.parse(f).getroot()
+
+        custom_formats = {}
+        cell_formats = []
+        for element in root.iter():
+            name = self._local_name(element.tag)
+            if name == 'numFmt':
+                custom_formats[int(element.get('numFmtId'))] = element.get('formatCode', '')
+            elif name == 'cellXfs':
+                cell_formats = [xf for xf in element if self._local_name(xf.tag) == 'xf']
+
+        date_styles = set()
+        for idx, xf in enumerate(cell_formats):
+            fmt_id = int(xf.get('numFmtId', 0))
+            code = self._FORMAT_LITERAL_RE.sub('', custom_formats.get(fmt_id, ''))
+            if fmt_id in self._BUILTIN_DATE_FORMATS or self._DATE_CODE_RE.search(code):
+                date_styles.add(idx)
+        return frozenset(date_styles)
+
+    def _read_shared_strings(self, part: str) -> List[str]:
+        """Stream the shared string table into a list."""
+        strings = []
+        with self._zip.open(part) as f:
+            for _, element in ET.iterparse(f):
+                if self._local_name(element.tag) == 'si':
+                    strings.append(self._text_of(element))
+                    element.clear()
+        return strings
+
+    @staticmethod
+    def _column_index(ref: str) -> int:
+        """Convert a cell reference like 'AB12' to a 0-based column index."""
+        col = 0
+        for ch in ref:
+            if not ch.isalpha():
+                break
+            col = col * 26 + ord(ch.upper()) - 64
+        return col - 1
+
+    def _cell_value(self, cell, col: int, shared_strings: List[str], date_styles: frozenset):
+        """Decode a <c> element the way openpyxl does with data_only=True."""
+        cell_type = cell.get('t', 'n')
+        if cell_type == 'inlineStr':
+            for child in cell:
+                if self._local_name(child.tag) == 'is':
+                    return self._text_of(child)
+            return None
+
+        value = None
+        has_formula = False
+        for child in cell:
+            name = self._local_name(child.tag)
+            if name == 'v':
+                value = child.text
+            elif name == 'f':
+                has_formula = True
+        if value is None:
+            if has_formula:
+                self.uncalculated_columns.add(col)
+            return None
+
+        if cell_type == 's':
+            return shared_strings[int(value)]
+        if cell_type == 'b':
+            return value == '1'
+        if cell_type in ('str', 'e', 'd'):
+            return value
+        if date_styles and int(cell.get('s', 0)) in date_styles:
+            # Converting serial dates is openpyxl's job
+            raise ValueError("date cells need openpyxl")
+        if '.' in value or 'e' in value or 'E' in value:
+            return float(value)
+        return int(value)
+
+    def iter_rows(self, max_columns: int) -> Iterator[tuple]:
+        """Yield the active sheet's rows as value tuples (up to max_columns wide), starting from row 1."""
+        sheet_part, strings_part, styles_part = self._resolve_parts()
+        shared_strings = self._read_shared_strings(strings_part) if strings_part else []
+        date_styles = self._read_date_styles(styles_part) if styles_part else frozenset()
+
+        next_row = 1
+        with self._zip.open(sheet_part) as f:
+            for _, element in ET.iterparse(f):
+                if self._local_name(element.tag) != 'row':
+                    continue
+
+                # Rows with no cells are left out of the XML; keep the numbering intact
+                row_number = int(element.get('r', next_row))
+                while next_row < row_number:
+                    yield ()
+                    next_row += 1
+
+                values = []
+                for cell in element:
+                    if self._local_name(cell.tag) != 'c':
+                        continue
+                    ref = cell.get('r')
+                    col = self._column_index(ref) if ref else len(values)
+                    if col >= max_columns:
+                        break  # Cells are stored in column order
+                    if col > len(values):
+                        values.extend([None] * (col - len(values)))
+                    values.append(self._cell_value(cell, len(values), shared_strings, date_styles))
+
+                yield tuple(values)
+                next_row = row_number + 1
+                element.clear()
+
+
 class ExcelRubricImporter:
     """Imports rubrics from Excel files with auto-format detection."""
 
@@ -29,14 +237,30 @@ class ExcelRubricImporter:
         'proficient', 'advanced', 'beginning', 'emerging', 'meets', 'exceeds'
     ]
 
+    # Rows read per sheet. No rubric comes close, but stale formatting can
+    # stretch a sheet to hundreds of thousands of empty rows
+    MAX_ROWS = 10000
+
+    # Columns read per row; anything further right is stale formatting, not rubric data
+    MAX_COLUMNS = 50
+
+    # Share of criteria allowed to lack a weight when the weights are formulas
+    MAX_MISSING_WEIGHT_RATIO = 0.3
+
+    # Compiled once so each header is scanned a single time for all keywords
+    _PL_KEYWORD_RE = re.compile('|'.join(map(re.escape, PERFORMANCE_LEVEL_KEYWORDS)))
+    _HEADER_ROW_RE = re.compile(r'criterion|name|weight|%|description|poor|good')
+
+    # Weights written as text: 5, 0.05, 5%, 12.5 %
+    _WEIGHT_RE = re.compile(r'^\s*([-+]?(?:\d+(?:\.\d*)?|\.\d+))\s*%?\s*$')
+
+    # Score ranges in headers: 40-50%, <40%, 40%, >80%
+    _SCORE_RE = re.compile(r'\d+\s*-\s*\d+%|[<>]?\s*\d+%')
+
     @staticmethod
     def is_available() -> bool:
-        """Check if openpyxl is available."""
-        try:
-            import openpyxl
-            return True
-        except ImportError:
-            return False
+        """Check if openpyxl is available (without importing it)."""
+        return importlib.util.find_spec("openpyxl") is not None
 
     @staticmethod
     def _normalize_header(header: str) -> str:
@@ -45,30 +269,26 @@ class ExcelRubricImporter:
             return ""
         return str(header).strip().lower()
 
-    @staticmethod
-    def _is_performance_level_column(header: str) -> bool:
-        """Check if column header looks like a performance level."""
-        normalized = ExcelRubricImporter._normalize_header(header)
-        return any(keyword in normalized for keyword in ExcelRubricImporter.PERFORMANCE_LEVEL_KEYWORDS)
-
     @staticmethod
     def _extract_percentage_weight(value) -> float:
         """Extract numeric weight from various formats (5%, 0.05, 5, etc.)."""
         if value is None:
             return 1.0
 
-        # Convert to string and clean
-        str_value = str(value).strip().replace('%', '')
-
-        try:
-            numeric_value = float(str_value)
-            # If value is >= 1, assume it's a percentage (5 means 5%, not 500%)
-            if numeric_value >= 1:
-                return numeric_value / 100.0
-            # If < 1, assume it's already a decimal
-            return numeric_value
-        except ValueError:
-            return 1.0
+        # Numeric cells (the usual case with data_only) need no string parsing
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            numeric_value = float(value)
+        else:
+            match = ExcelRubricImporter._WEIGHT_RE.match(str(value))
+            if not match:
+                return 1.0
+            numeric_value = float(match.group(1))
+
+        # If value is >= 1, assume it's a percentage (5 means 5%, not 500%)
+        if numeric_value >= 1:
+            return numeric_value / 100.0
+        # If < 1, assume it's already a decimal
+        return numeric_value
 
     @classmethod
     def parse_excel(cls, file_path: Path) -> Optional[ParsedRubricData]:
@@ -83,30 +303,68 @@ class ExcelRubricImporter:
         - First cell (A1)
         - A cell labeled "Rubric Name:" or similar
         - Filename as fallback
+
+        Raises:
+            UncalculatedFormulasError: If the weight column holds formulas with
+                no saved results; the message tells the user how to fix the file
         """
-        # Dynamic import to allow installation at runtime
         try:
-            from openpyxl import load_workbook
-        except ImportError:
-            raise ImportError("openpyxl is required for Excel import. Install with: pip install openpyxl")
+            stat = os.stat(file_path)
+        except OSError as e:
+            print(f"Error parsing Excel file: {e}")
+            return None
 
+        # The file's mtime and size are part of the key, so edited files are re-parsed
+        key = (str(file_path), stat.st_mtime_ns, stat.st_size)
+        parsed = _PARSE_CACHE.get(key)
+        if parsed is None:
+            parsed = cls._parse_workbook(file_path)
+            if parsed is None:
+                return None
+            _PARSE_CACHE[key] = parsed
+            if len(_PARSE_CACHE) > _PARSE_CACHE_SIZE:
+                _PARSE_CACHE.popitem(last=False)
+        else:
+            _PARSE_CACHE.move_to_end(key)
+
+        # Callers edit the result (the preview dialog renames it), so hand out copies
+        return copy.deepcopy(parsed)
+
+    @classmethod
+    def _parse_workbook(cls, file_path: Path) -> Optional[ParsedRubricData]:
+        """Parse the active sheet of an Excel file (uncached)."""
         try:
-            wb = load_workbook(file_path, data_only=True)
-            ws = wb.active
+            # Read the sheet XML directly; openpyxl handles anything the sniffer can't
+            sniffed = cls._sniff_rows(file_path)
+            if sniffed is not None:
+                rows, uncalculated_columns = sniffed
+            else:
+                # openpyxl's data_only mode can't tell an unsaved formula result from an empty cell
+                rows, uncalculated_columns = cls._load_rows(file_path), set()
+
+            # Pad ragged rows (unsized sheets) so every column index is valid
+            width = max((len(row) for row in rows), default=0)
+            rows = [row if len(row) == width else row + (None,) * (width - len(row)) for row in rows]
 
             # Extract rubric name and description
-            rubric_name, rubric_description = cls._extract_metadata(ws, file_path)
+            rubric_name, rubric_description = cls._extract_metadata(rows, file_path)
 
             # Find header row (first row with column headers)
-            header_row, headers = cls._find_header_row(ws)
+            header_row, headers = cls._find_header_row(rows)
             if not header_row or not headers:
                 raise ValueError("Could not find column headers in Excel file")
 
+            # Normalize headers once for all the keyword matching below
+            normalized_headers = [cls._normalize_header(h) for h in headers]
+
             # Detect rubric format
-            is_analytic, performance_level_columns = cls._detect_format(headers)
+            is_analytic, performance_level_columns = cls._detect_format(normalized_headers)
 
             # Parse criteria data
-            criteria_data = cls._parse_criteria(ws, header_row, headers, is_analytic, performance_level_columns)
+            criteria_data = cls._parse_criteria(
+                rows, header_row, headers, normalized_headers, is_analytic, performance_level_columns,
+                uncalculated_columns
+            )
 
             return ParsedRubricData(
                 rubric_name=rubric_name,
@@ -116,55 +374,111 @@ class ExcelRubricImporter:
                 performance_level_names=[headers[idx] for idx in performance_level_columns]
             )
 
+        except (ImportError, UncalculatedFormulasError):
+            raise
         except Exception as e:
             print(f"Error parsing Excel file: {e}")
             return None
 
     @classmethod
-    def _extract_metadata(cls, worksheet, file_path: Path) -> Tuple[str, str]:
-        """Extract rubric name and description from worksheet."""
+    def _sniff_rows(cls, file_path: Path) -> Optional[Tuple[List[tuple], Set[int]]]:
+        """
+        Read the active sheet's rows without openpyxl.
+
+        Returns:
+            (rows, columns with uncalculated formulas), or None if the file needs openpyxl
+        """
+        try:
+            with _ExcelSniffer(file_path) as sniffer:
+                rows = cls._read_rows(sniffer.iter_rows(cls.MAX_COLUMNS))
+                return rows, sniffer.uncalculated_columns
+        except (zipfile.BadZipFile, ET.ParseError, KeyError, IndexError, ValueError, TypeError):
+            return None
+
+    @classmethod
+    def _load_rows(cls, file_path: Path) -> List[tuple]:
+        """Read the active sheet's rows with openpyxl."""
+        # Dynamic import to allow installation at runtime
+        try:
+            from openpyxl import load_workbook
+        except ImportError:
+            raise ImportError("openpyxl is required for Excel import. Install with: pip install openpyxl")
+
+        # Read-only mode streams the sheet XML instead of building every Cell object
+        wb = load_workbook(file_path, data_only=True, read_only=True)
+        try:
+            ws = wb.active
+
+            # Some writers store a bogus "A1:A1" dimension; forget it so every row is read
+            try:
+                if ws.calculate_dimension() == 'A1:A1':
+                    ws.reset_dimensions()
+            except ValueError:
+                pass  # Unsized sheet - iter_rows already reads to the end
+
+            # Read-only cells are not randomly accessible, so take one pass over the rows
+            max_col = min(ws.max_column or cls.MAX_COLUMNS, cls.MAX_COLUMNS)
+            return cls._read_rows(ws.iter_rows(max_col=max_col, values_only=True))
+        finally:
+            wb.close()
+
+    @classmethod
+    def _read_rows(cls, row_iter) -> List[tuple]:
+        """Collect row tuples, leaving out trailing blank rows."""
+        rows = []
+        blank_rows = []  # Blank rows not (yet) followed by more data
+        for row_number, row in enumerate(row_iter, 1):
+            if row_number > cls.MAX_ROWS:
+                print(f"Warning: only the first {cls.MAX_ROWS} rows of the sheet were read")
+                break
+            if any(v is not None and v != '' for v in row):
+                rows.extend(blank_rows)
+                blank_rows.clear()
+                rows.append(row)
+            else:
+                blank_rows.append(row)
+        return rows
+
+    @classmethod
+    def _extract_metadata(cls, rows: List[tuple], file_path: Path) -> Tuple[str, str]:
+        """Extract rubric name and description from the sheet rows."""
         rubric_name = file_path.stem  # Default to filename
         rubric_description = ""
 
         # Check first few cells for rubric name
-        for row in range(1, 5):
-            for col in range(1, 3):
-                cell_value = worksheet.cell(row, col).value
+        for row in rows[:4]:
+            for col, cell_value in enumerate(row[:2]):
                 if cell_value:
                     cell_str = str(cell_value).strip()
                     # Look for metadata labels
                     normalized = cls._normalize_header(cell_str)
+                    next_cell = row[col + 1] if col + 1 < len(row) else None
                     if 'rubric name' in normalized or 'rubric:' in normalized:
                         # Name should be in next cell or after colon
                         if ':' in cell_str:
                             rubric_name = cell_str.split(':', 1)[1].strip()
-                        else:
-                            next_cell = worksheet.cell(row, col + 1).value
-                            if next_cell:
-                                rubric_name = str(next_cell).strip()
+                        elif next_cell:
+                            rubric_name = str(next_cell).strip()
                     elif 'description' in normalized:
                         if ':' in cell_str:
                             rubric_description = cell_str.split(':', 1)[1].strip()
-                        else:
-                            next_cell = worksheet.cell(row, col + 1).value
-                            if next_cell:
-                                rubric_description = str(next_cell).strip()
+                        elif next_cell:
+                            rubric_description = str(next_cell).strip()
 
         return rubric_name, rubric_description
 
     @classmethod
-    def _find_header_row(cls, worksheet) -> Tuple[Optional[int], Optional[List[str]]]:
+    def _find_header_row(cls, rows: List[tuple]) -> Tuple[Optional[int], Optional[List[str]]]:
         """Find the row containing column headers."""
         # Look for a row with multiple non-empty cells that look like headers
-        for row_idx in range(1, min(20, worksheet.max_row + 1)):
-            row_values = [worksheet.cell(row_idx, col).value for col in range(1, worksheet.max_column + 1)]
+        for row_idx, row_values in enumerate(rows[:19], 1):
             non_empty = [v for v in row_values if v is not None and str(v).strip()]
 
             # Need at least 2 columns (name + something else)
             if len(non_empty) >= 2:
                 # Check if this looks like a header row (contains common keywords)
                 row_text = ' '.join([str(v).lower() for v in non_empty])
-                if any(keyword in row_text for keyword in ['criterion', 'name', 'weight', '%', 'description', 'poor', 'good']):
+                if cls._HEADER_ROW_RE.search(row_text):
                     # Found header row
                     headers = [str(v).strip() if v is not None else "" for v in row_values]
                     return row_idx, headers
@@ -172,18 +486,15 @@ class ExcelRubricImporter:
         return None, None
 
     @classmethod
-    def _detect_format(cls, headers: List[str]) -> Tuple[bool, List[int]]:
+    def _detect_format(cls, normalized_headers: List[str]) -> Tuple[bool, List[int]]:
         """
         Detect if rubric is analytic (has performance levels).
 
         Returns:
             (is_analytic, performance_level_column_indices)
         """
-        performance_level_cols = []
-
-        for idx, header in enumerate(headers):
-            if cls._is_performance_level_column(header):
-                performance_level_cols.append(idx)
+        search = cls._PL_KEYWORD_RE.search
+        performance_level_cols = [idx for idx, header in enumerate(normalized_headers) if search(header)]
 
         # If we have 3+ performance level columns, it's likely analytic
         is_analytic = len(performance_level_cols) >= 3
@@ -191,68 +502,80 @@ class ExcelRubricImporter:
         return is_analytic, performance_level_cols
 
     @classmethod
-    def _parse_criteria(cls, worksheet, header_row: int, headers: List[str],
-                       is_analytic: bool, perf_level_cols: List[int]) -> List[dict]:
-        """Parse criteria rows from the worksheet."""
+    def _parse_criteria(cls, rows: List[tuple], header_row: int, headers: List[str],
+                       normalized_headers: List[str], is_analytic: bool,
+                       perf_level_cols: List[int],
+                       uncalculated_columns: Set[int] = frozenset()) -> List[RubricCriterion]:
+        """Parse criteria rows from the sheet rows."""
         criteria_data = []
 
         # Identify key columns
-        name_col = cls._find_column_index(headers, ['criterion', 'name', 'criteria'])
-        weight_col = cls._find_column_index(headers, ['weight', '%', 'percent'])
-        description_col = cls._find_column_index(headers, ['description', 'desc']) if not is_analytic else None
+        name_col = cls._find_column_index(normalized_headers, ['criterion', 'name', 'criteria'])
+        weight_col = cls._find_column_index(normalized_headers, ['weight', '%', 'percent'])
+        description_col = cls._find_column_index(normalized_headers, ['description', 'desc']) if not is_analytic else None
 
         if name_col is None:
             # Default to first column if not found
             name_col = 0
 
+        # Resolve the per-column work once, so the row loop has no format branches
+        extract_weight = cls._extract_percentage_weight
+        if weight_col is not None:
+            get_weight = lambda row: extract_weight(row[weight_col])
+        else:
+            get_weight = lambda row: 1.0
+
+        if is_analytic:
+            # Score ranges depend only on the header
+            level_columns = [
+                (idx, headers[idx], cls._extract_score_range(headers[idx]))
+                for idx in perf_level_cols
+            ]
+
+            def get_levels(row):
+                levels = [
+                    PerformanceLevel(name=header, score_range=score_range, description=str(row[idx]).strip())
+                    for idx, header, score_range in level_columns
+                    if row[idx] and str(row[idx]).strip()
+                ]
+                return levels or None
+        else:
+            get_levels = lambda row: None
+
+        if description_col is not None:
+            get_description = lambda row: str(row[description_col]).strip() if row[description_col] else ''
+        else:
+            get_description = lambda row: ''
+
         # Parse data rows (after header)
-        for row_idx in range(header_row + 1, worksheet.max_row + 1):
-            name = worksheet.cell(row_idx, name_col + 1).value
+        for row in rows[header_row:]:
+            name = row[name_col]
             if not name or not str(name).strip():
                 continue  # Skip empty rows
 
-            criterion = {
-                'name': str(name).strip(),
-                'weight': 1.0,
-                'description': '',
-                'performance_levels': []
-            }
-
-            # Extract weight
-            if weight_col is not None:
-                weight_value = worksheet.cell(row_idx, weight_col + 1).value
-                criterion['weight'] = cls._extract_percentage_weight(weight_value)
-
-            if is_analytic:
-                # Parse performance levels
-                for pl_col_idx in perf_level_cols:
-                    pl_value = worksheet.cell(row_idx, pl_col_idx + 1).value
-                    if pl_value and str(pl_value).strip():
-                        # Try to extract score range from header
-                        header = headers[pl_col_idx]
-                        score_range = cls._extract_score_range(header)
-
-                        criterion['performance_levels'].append({
-                            'name': headers[pl_col_idx],
-                            'score_range': score_range,
-                            'description': str(pl_value).strip()
-                        })
-            else:
-                # Parse simple description
-                if description_col is not None:
-                    desc_value = worksheet.cell(row_idx, description_col + 1).value
-                    if desc_value:
-                        criterion['description'] = str(desc_value).strip()
-
-            criteria_data.append(criterion)
+            criteria_data.append(RubricCriterion(
+                name=str(name).strip(),
+                description=get_description(row),
+                weight=get_weight(row),
+                performance_levels=get_levels(row)
+            ))
+
+        # Weights computed by formulas that were never calculated would all silently become 1.0
+        if weight_col in uncalculated_columns and criteria_data:
+            data_rows = [row for row in rows[header_row:] if row[name_col] and str(row[name_col]).strip()]
+            missing = sum(1 for row in data_rows if row[weight_col] is None)
+            if missing / len(data_rows) > cls.MAX_MISSING_WEIGHT_RATIO:
+                raise UncalculatedFormulasError(
+                    "The weights in this Excel file are formulas that have never been calculated.\n\n"
+                    "Open the file in Excel, save it, and import it again."
+                )
 
         return criteria_data
 
     @staticmethod
-    def _find_column_index(headers: List[str], keywords: List[str]) -> Optional[int]:
-        """Find column index by matching keywords in header."""
-        for idx, header in enumerate(headers):
-            normalized = ExcelRubricImporter._normalize_header(header)
+    def _find_column_index(normalized_headers: List[str], keywords: List[str]) -> Optional[int]:
+        """Find column index by matching keywords in a normalized header."""
+        for idx, normalized in enumerate(normalized_headers):
             if any(keyword in normalized for keyword in keywords):
                 return idx
         return None
@@ -260,18 +583,9 @@ class ExcelRubricImporter:
     @staticmethod
     def _extract_score_range(header: str) -> str:
         """Extract score range from header like 'Poor <40%' or 'Good 60-70%'."""
-        import re
-
-        # Look for patterns like <40%, 40-50%, >80%, etc.
-        patterns = [
-            r'[<>]?\s*\d+%',  # <40%, 40%, >80%
-            r'\d+\s*-\s*\d+%',  # 40-50%
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, header)
-            if match:
-                return match.group().strip()
+        match = ExcelRubricImporter._SCORE_RE.search(header)
+        if match:
+            return match.group().strip()
 
         # If no range found, return empty string
         return ""
@@ -286,41 +600,16 @@ class ExcelRubricImporter:
 
         Returns:
             Rubric object or None if import fails
+
+        Raises:
+            UncalculatedFormulasError: See parse_excel
         """
         parsed_data = cls.parse_excel(file_path)
         if not parsed_data:
             return None
 
-        # Convert parsed data to Rubric object
-        criteria = []
-        for crit_data in parsed_data.criteria_data:
-            if parsed_data.is_analytic and crit_data['performance_levels']:
-                # Create criterion with performance levels
-                perf_levels = [
-                    PerformanceLevel(
-                        name=pl['name'],
-                        score_range=pl['score_range'],
-                        description=pl['description']
-                    )
-                    for pl in crit_data['performance_levels']
-                ]
-                criterion = RubricCriterion(
-                    name=crit_data['name'],
-                    weight=crit_data['weight'],
-                    performance_levels=perf_levels
-                )
-            else:
-                # Simple criterion
-                criterion = RubricCriterion(
-                    name=crit_data['name'],
-                    description=crit_data['description'],
-                    weight=crit_data['weight']
-                )
-
-            criteria.append(criterion)
-
         return Rubric(
             name=parsed_data.rubric_name,
             description=parsed_data.rubric_description,
-            criteria=criteria
+            criteria=parsed_data.criteria_data
         )
@@ -2,16 +2,81 @@
 Export functionality for organized feedback.
 Supports clipboard, text, PDF, and Word document formats.
 """
+import gc
+import importlib.util
+import io
+import re
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional, Tuple
 from datetime import datetime
 
 from core.feedback import OrganizedFeedback
 
+# Hidden Tk root kept for clipboard access when no application window exists
+_CLIPBOARD_ROOT = None
+_CLIPBOARD_LOCK = threading.Lock()
+
+
+def _get_clipboard_root():
+    """Get a Tk root for clipboard access, creating a hidden one only once."""
+    global _CLIPBOARD_ROOT
+    import tkinter as tk
+
+    # Inside the app, reuse its main window rather than starting another interpreter
+    if tk._default_root is not None:
+        return tk._default_root
+
+    if _CLIPBOARD_ROOT is None:
+        _CLIPBOARD_ROOT = tk.Tk()
+        _CLIPBOARD_ROOT.withdraw()
+    return _CLIPBOARD_ROOT
+
+
+# Last rendered (plain, markdown) pair and the feedback contents it came from
+_RENDER_CACHE: Optional[tuple] = None
+
+
+def _render_both(feedback) -> Tuple[str, str]:
+    """Render plain text and markdown together, reusing the result while the feedback is unchanged."""
+    global _RENDER_CACHE
+    key = (type(feedback), tuple(
+        tuple(value.items()) if isinstance(value, dict) else value
+        for value in vars(feedback).values()
+    ))
+    if _RENDER_CACHE is None or _RENDER_CACHE[0] != key:
+        _RENDER_CACHE = (key, feedback.render_both())
+    return _RENDER_CACHE[1]
+
+
+# Stylesheet for PDF exports (built on first use)
+_PDF_STYLES = None
+
+
+def _get_pdf_styles():
+    """Get the shared reportlab stylesheet, building it on first use."""
+    global _PDF_STYLES
+    if _PDF_STYLES is None:
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.lib.enums import TA_JUSTIFY
+
+        styles = getSampleStyleSheet()
+        styles.add(ParagraphStyle(
+            name='Justify',
+            parent=styles['Normal'],
+            alignment=TA_JUSTIFY,
+            spaceAfter=12
+        ))
+        _PDF_STYLES = styles
+    return _PDF_STYLES
+
 
 class FeedbackExporter:
     """Handles exporting organized feedback to various formats."""
 
+    # Longest transcript chunk laid out as a single PDF paragraph
+    TRANSCRIPT_CHUNK_CHARS = 3000
+
     @staticmethod
     def to_clipboard(feedback: OrganizedFeedback, format: str = "plain") -> bool:
         """
@@ -25,20 +90,15 @@ class FeedbackExporter:
             True if successful
         """
         try:
-            import tkinter as tk
-            root = tk.Tk()
-            root.withdraw()
-
-            text = (
-                feedback.to_plain_text()
-                if format == "plain"
-                else feedback.to_markdown()
-            )
+            plain_text, markdown = _render_both(feedback)
+            text = plain_text if format == "plain" else markdown
 
-            root.clipboard_clear()
-            root.clipboard_append(text)
-            root.update()
-            root.destroy()
+            # Tk is not thread-safe; serialize clipboard access
+            with _CLIPBOARD_LOCK:
+                root = _get_clipboard_root()
+                root.clipboard_clear()
+                root.clipboard_append(text)
+                root.update()
 
             return True
         except Exception as e:
@@ -58,8 +118,7 @@ class FeedbackExporter:
             True if successful
         """
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(feedback.to_plain_text())
+            Path(file_path).write_bytes(_render_both(feedback)[0].encode('utf-8'))
             return True
         except Exception as e:
             print(f"Error exporting to text file: {e}")
@@ -78,31 +137,33 @@ class FeedbackExporter:
             True if successful
         """
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(feedback.to_markdown())
+            Path(file_path).write_bytes(_render_both(feedback)[1].encode('utf-8'))
             return True
         except Exception as e:
             print(f"Error exporting to markdown file: {e}")
             return False
 
     @staticmethod
-    def to_pdf(feedback: OrganizedFeedback, file_path: Path) -> bool:
+    def to_pdf(feedback: OrganizedFeedback, file_path: Path, rich: bool = True) -> bool:
         """
         Export feedback to PDF file.
 
         Args:
             feedback: OrganizedFeedback object
             file_path: Path to save the file
+            rich: Lay out with reportlab when it is installed; otherwise (or if
+                False) use the built-in plain text PDF writer
 
         Returns:
             True if successful
         """
+        if not rich or importlib.util.find_spec('reportlab') is None:
+            return FeedbackExporter._to_pdf_lite(feedback, file_path)
+
         try:
             from reportlab.lib.pagesizes import letter
-            from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
             from reportlab.lib.units import inch
             from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
-            from reportlab.lib.enums import TA_LEFT, TA_JUSTIFY
 
             doc = SimpleDocTemplate(
                 str(file_path),
@@ -113,13 +174,7 @@ class FeedbackExporter:
                 bottomMargin=18,
             )
 
-            styles = getSampleStyleSheet()
-            styles.add(ParagraphStyle(
-                name='Justify',
-                parent=styles['Normal'],
-                alignment=TA_JUSTIFY,
-                spaceAfter=12
-            ))
+            styles = _get_pdf_styles()
 
             story = []
 
@@ -167,10 +222,15 @@ class FeedbackExporter:
                 story.append(transcript_heading)
                 story.append(Spacer(1, 0.1 * inch))
 
-                transcript_text = Paragraph(feedback.raw_transcript, styles['Normal'])
-                story.append(transcript_text)
+                # One flowable per chunk so reportlab can split pages between them
+                for chunk in FeedbackExporter._transcript_chunks(feedback.raw_transcript):
+                    story.append(Paragraph(chunk, styles['Normal']))
 
             doc.build(story)
+
+            # Release the laid-out paragraph tree now rather than at the next GC pass
+            del story, doc
+            gc.collect()
             return True
 
         except ImportError:
@@ -180,6 +240,53 @@ class FeedbackExporter:
             print(f"Error exporting to PDF: {e}")
             return False
 
+    @staticmethod
+    def _to_pdf_lite(feedback: OrganizedFeedback, file_path: Path) -> bool:
+        """Export feedback to PDF with the dependency-free writer in core.pdf_lite."""
+        try:
+            from core.pdf_lite import write_pdf
+
+            blocks = [
+                ('title', f"Feedback: {feedback.rubric_name}"),
+                ('small', f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}"),
+            ]
+
+            if feedback.summary:
+                blocks.append(('heading', "Summary"))
+                blocks.append(('body', feedback.summary))
+
+            blocks.append(('heading', "Detailed Feedback"))
+            for criterion, text in feedback.criterion_feedback.items():
+                blocks.append(('subheading', criterion))
+                blocks.append(('body', text))
+
+            if feedback.raw_transcript:
+                blocks.append(('pagebreak', ''))
+                blocks.append(('heading', "Raw Transcript"))
+                blocks.append(('body', feedback.raw_transcript))
+
+            write_pdf(file_path, blocks)
+            return True
+
+        except Exception as e:
+            print(f"Error exporting to PDF: {e}")
+            return False
+
+    @staticmethod
+    def _transcript_chunks(text: str) -> Iterator[str]:
+        """Split a transcript into paragraphs, breaking long ones at word boundaries."""
+        limit = FeedbackExporter.TRANSCRIPT_CHUNK_CHARS
+        for paragraph in re.split(r'\n\s*\n', text):
+            paragraph = paragraph.strip()
+            while len(paragraph) > limit:
+                cut = paragraph.rfind(' ', 0, limit)
+                if cut <= 0:
+                    cut = limit
+                yield paragraph[:cut]
+                paragraph = paragraph[cut:].lstrip()
+            if paragraph:
+                yield paragraph
+
     @staticmethod
     def to_word(feedback: OrganizedFeedback, file_path: Path) -> bool:
         """
@@ -208,15 +315,15 @@ class FeedbackExporter:
                 f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}"
             )
             date_para.runs[0].font.size = Pt(10)
-
-            doc.add_paragraph()  # Spacing
+            # Space with paragraph formatting rather than empty <w:p> elements
+            date_para.paragraph_format.space_after = Pt(12)
 
             # Summary
             if feedback.summary:
                 doc.add_heading("Summary", level=2)
                 summary_para = doc.add_paragraph(feedback.summary)
                 summary_para.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-                doc.add_paragraph()  # Spacing
+                summary_para.paragraph_format.space_after = Pt(12)
 
             # Detailed Feedback
             doc.add_heading("Detailed Feedback", level=2)
@@ -225,15 +332,18 @@ class FeedbackExporter:
                 doc.add_heading(criterion, level=3)
                 feedback_para = doc.add_paragraph(text)
                 feedback_para.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-                doc.add_paragraph()  # Spacing
+                feedback_para.paragraph_format.space_after = Pt(12)
 
             # Raw Transcript (if included)
             if feedback.raw_transcript:
                 doc.add_page_break()
                 doc.add_heading("Raw Transcript", level=2)
-                transcript_para = doc.add_paragraph(feedback.raw_transcript)
+                doc.add_paragraph(feedback.raw_transcript)
 
-            doc.save(str(file_path))
+            # Zip the document in memory and write it with a single call
+            buffer = io.BytesIO()
+            doc.save(buffer)
+            Path(file_path).write_bytes(buffer.getvalue())
             return True
 
         except ImportError:
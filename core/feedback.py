@@ -2,13 +2,153 @@
 Feedback organization system using LLM providers.
 Handles organizing transcripts according to rubric criteria.
 """
+import hashlib
+import os
+import shutil
+import string
+import threading
+import time
+import zlib
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, List
-from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Iterable, Optional, Dict, List, Tuple
+from dataclasses import asdict, dataclass
 
+from core import jsonfile
 from core.rubric import Rubric
 from core.settings import LLMSettings
 
+# On-disk cache of organized feedback, so re-running an unchanged transcript
+# and rubric (e.g. while tweaking export settings) doesn't call the LLM again.
+# Each entry is a JSON file holding a student's transcript and its feedback;
+# entries expire after RESPONSE_CACHE_MAX_AGE_DAYS and only the newest
+# RESPONSE_CACHE_MAX_ENTRIES are kept. It can be switched off in Settings (or
+# with TRANSCRIBAIR_NO_LLM_CACHE=1) and emptied with clear_response_cache().
+RESPONSE_CACHE_DIR = Path.home() / ".transcribair" / "cache" / "llm"
+RESPONSE_CACHE_MAX_AGE_DAYS = 30
+RESPONSE_CACHE_MAX_ENTRIES = 500
+_RESPONSE_CACHE_LOCK = threading.Lock()
+# Shelve database used by earlier versions, which never expired anything
+_LEGACY_RESPONSE_CACHE_GLOB = "llm_responses*"
+_legacy_response_cache_removed = False
+
+
+def _response_cache_enabled() -> bool:
+    """Whether the response cache is enabled (not switched off in the environment)."""
+    return os.environ.get("TRANSCRIBAIR_NO_LLM_CACHE", "") in ("", "0")
+
+
+def _response_cache_key(provider_name: str, model: str, prompt: str) -> str:
+    """Cache key for one request: provider, model and the exact prompt text."""
+    return hashlib.blake2b(
+        f"{provider_name}|{model}|{prompt}".encode("utf-8"), digest_size=20
+    ).hexdigest()
+
+
+def _response_cache_file(key: str) -> Path:
+    """File holding one cache entry."""
+    return RESPONSE_CACHE_DIR / (key + ".json")
+
+
+def _response_cache_expired(mtime: float, now: float) -> bool:
+    """Whether an entry last written at mtime is past the maximum age."""
+    return now - mtime > RESPONSE_CACHE_MAX_AGE_DAYS * 86400
+
+
+def _response_cache_get(key: str):
+    """Look up a cached response; expired entries and cache errors are treated as a miss."""
+    path = _response_cache_file(key)
+    try:
+        with _RESPONSE_CACHE_LOCK:
+            if _response_cache_expired(path.stat().st_mtime, time.time()):
+                return None
+            return jsonfile.loads(path.read_bytes())
+    except Exception:
+        return None
+
+
+def _response_cache_put(key: str, value) -> None:
+    """Store a response and prune old entries; failing to cache never fails the request."""
+    try:
+        with _RESPONSE_CACHE_LOCK:
+            RESPONSE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            jsonfile.write_atomic(_response_cache_file(key), jsonfile.dumps(value))
+            _prune_response_cache()
+    except Exception as e:
+        print(f"Error caching LLM response: {e}")
+
+
+def _prune_response_cache() -> None:
+    """Delete expired entries, then the oldest ones beyond the entry limit (lock held)."""
+    global _legacy_response_cache_removed
+    if not _legacy_response_cache_removed:
+        for legacy_path in RESPONSE_CACHE_DIR.parent.glob(_LEGACY_RESPONSE_CACHE_GLOB):
+            legacy_path.unlink()
+        _legacy_response_cache_removed = True
+
+    now = time.time()
+    entries = []
+    with os.scandir(RESPONSE_CACHE_DIR) as it:
+        for entry in it:
+            if not entry.name.endswith(".json"):
+                continue
+            mtime = entry.stat().st_mtime
+            if _response_cache_expired(mtime, now):
+                os.remove(entry.path)
+            else:
+                entries.append((mtime, entry.path))
+
+    if len(entries) > RESPONSE_CACHE_MAX_ENTRIES:
+        entries.sort()
+        for _, path in entries[:len(entries) - RESPONSE_CACHE_MAX_ENTRIES]:
+            os.remove(path)
+
+
+def clear_response_cache() -> bool:
+    """
+    Delete every cached LLM response, including an old-style cache database.
+
+    Returns:
+        True if cleared successfully
+    """
+    try:
+        with _RESPONSE_CACHE_LOCK:
+            if RESPONSE_CACHE_DIR.exists():
+                shutil.rmtree(RESPONSE_CACHE_DIR)
+            if RESPONSE_CACHE_DIR.parent.exists():
+                for legacy_path in RESPONSE_CACHE_DIR.parent.glob(_LEGACY_RESPONSE_CACHE_GLOB):
+                    legacy_path.unlink()
+        return True
+    except OSError as e:
+        print(f"Error clearing LLM response cache: {e}")
+        return False
+
+
+# SDK clients shared by every provider instance with the same credentials, so
+# each keeps one HTTP connection pool (keep-alive, TLS session reuse) for the
+# life of the app instead of one per FeedbackOrganizer.
+
+@lru_cache(maxsize=4)
+def _ollama_client(host: str):
+    """Shared Ollama client for a server."""
+    import ollama
+    return ollama.Client(host=host)
+
+
+@lru_cache(maxsize=8)
+def _openai_client(api_key: str, base_url: Optional[str] = None):
+    """Shared OpenAI (or OpenAI-compatible) client."""
+    from openai import OpenAI
+    return OpenAI(api_key=api_key, base_url=base_url)
+
+
+@lru_cache(maxsize=8)
+def _anthropic_client(api_key: str):
+    """Shared Anthropic client."""
+    from anthropic import Anthropic
+    return Anthropic(api_key=api_key)
+
 
 @dataclass
 class OrganizedFeedback:
@@ -20,42 +160,33 @@ class OrganizedFeedback:
 
     def to_markdown(self) -> str:
         """Convert organized feedback to markdown format."""
-        lines = [f"# Feedback: {self.rubric_name}", ""]
-
-        if self.summary:
-            lines.extend(["## Summary", self.summary, ""])
-
-        lines.append("## Detailed Feedback")
-        lines.append("")
-
-        for criterion, feedback in self.criterion_feedback.items():
-            lines.append(f"### {criterion}")
-            lines.append(feedback)
-            lines.append("")
-
-        if self.raw_transcript:
-            lines.extend(["---", "## Raw Transcript", self.raw_transcript])
-
-        return "\n".join(lines)
+        return self.render_both()[1]
 
     def to_plain_text(self) -> str:
         """Convert organized feedback to plain text format."""
-        lines = [f"FEEDBACK: {self.rubric_name}", "=" * 60, ""]
+        return self.render_both()[0]
+
+    def render_both(self) -> Tuple[str, str]:
+        """Render plain text and markdown in a single pass over the feedback."""
+        plain = [f"FEEDBACK: {self.rubric_name}", "=" * 60, ""]
+        markdown = [f"# Feedback: {self.rubric_name}", ""]
 
         if self.summary:
-            lines.extend(["SUMMARY:", self.summary, ""])
+            plain.extend(["SUMMARY:", self.summary, ""])
+            markdown.extend(["## Summary", self.summary, ""])
 
-        lines.append("DETAILED FEEDBACK:")
-        lines.append("-" * 60)
+        plain.extend(["DETAILED FEEDBACK:", "-" * 60])
+        markdown.extend(["## Detailed Feedback", ""])
 
         for criterion, feedback in self.criterion_feedback.items():
-            lines.append(f"\n{criterion}:")
-            lines.append(feedback)
+            plain.extend([f"\n{criterion}:", feedback])
+            markdown.extend([f"### {criterion}", feedback, ""])
 
         if self.raw_transcript:
-            lines.extend(["", "=" * 60, "RAW TRANSCRIPT:", self.raw_transcript])
+            plain.extend(["", "=" * 60, "RAW TRANSCRIPT:", self.raw_transcript])
+            markdown.extend(["---", "## Raw Transcript", self.raw_transcript])
 
-        return "\n".join(lines)
+        return "\n".join(plain), "\n".join(markdown)
 
 
 @dataclass
@@ -67,34 +198,158 @@ class StructuredFeedback:
 
     def to_markdown(self) -> str:
         """Convert structured feedback to markdown format."""
-        lines = [f"# Feedback: {self.rubric_name}", ""]
-        lines.append(self.feedback_text)
-
-        if self.raw_transcript:
-            lines.extend(["", "---", "## Raw Transcript", self.raw_transcript])
-
-        return "\n".join(lines)
+        return self.render_both()[1]
 
     def to_plain_text(self) -> str:
         """Convert structured feedback to plain text format."""
-        lines = [f"FEEDBACK: {self.rubric_name}", "=" * 60, ""]
-        lines.append(self.feedback_text)
+        return self.render_both()[0]
 
-        if self.raw_transcript:
-            lines.extend(["", "=" * 60, "RAW TRANSCRIPT:", self.raw_transcript])
+    def render_both(self) -> Tuple[str, str]:
+        """Render plain text and markdown in a single pass over the feedback."""
+        plain = [f"FEEDBACK: {self.rubric_name}", "=" * 60, "", self.feedback_text]
+        markdown = [f"# Feedback: {self.rubric_name}", "", self.feedback_text]
 
-        return "\n".join(lines)
+        if self.raw_transcript:
+            plain.extend(["", "=" * 60, "RAW TRANSCRIPT:", self.raw_transcript])
+            markdown.extend(["", "---", "## Raw Transcript", self.raw_transcript])
+
+        return "\n".join(plain), "\n".join(markdown)
+
+
+class _CriterionStreamParser:
+    """
+    Incremental scanner for a streamed feedback JSON object.
+
+    Fed the response text as it arrives, it reports each complete
+    "criterion_feedback" entry as soon as its closing quote is seen, without
+    waiting for (or re-parsing) the rest of the document. Entries may be an
+    object keyed by criterion name or a list of {criterion, feedback} pairs.
+    """
+
+    def __init__(self, on_criterion: Callable[[str, str], None]):
+        self.on_criterion = on_criterion
+        self._stack = []  # [container char, current key] per open object/array
+        self._in_string = False
+        self._escape = False
+        self._chars = []
+        self._pair = {}  # Fields seen so far of the current {criterion, feedback} pair
+
+    def feed(self, text: str) -> None:
+        """Scan the next piece of response text."""
+        for ch in text:
+            if self._in_string:
+                if self._escape:
+                    self._chars.append(ch)
+                    self._escape = False
+                elif ch == '\\':
+                    self._chars.append(ch)
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    self._on_string(''.join(self._chars))
+                else:
+                    self._chars.append(ch)
+            elif ch == '"':
+                self._in_string = True
+                self._chars = []
+            elif ch in '{[':
+                self._stack.append([ch, None])
+                if len(self._stack) == 3:
+                    self._pair = {}
+            elif ch in '}]':
+                if self._stack:
+                    self._stack.pop()
+            elif ch == ',' and self._stack:
+                self._stack[-1][1] = None
+
+    def _on_string(self, raw: str) -> None:
+        """Handle a completed string token (object key or value)."""
+        if not self._stack or self._stack[-1][0] != '{':
+            return
+
+        import json
+        try:
+            value = json.loads(f'"{raw}"', strict=False)
+        except ValueError:
+            return
+
+        frame = self._stack[-1]
+        if frame[1] is None:
+            frame[1] = value
+        elif self._stack[0][1] != 'criterion_feedback':
+            return
+        elif len(self._stack) == 2:
+            self.on_criterion(frame[1], value)
+        elif len(self._stack) == 3 and self._stack[1][0] == '[':
+            self._pair[frame[1]] = value
+            if 'criterion' in self._pair and 'feedback' in self._pair:
+                self.on_criterion(self._pair.pop('criterion'), self._pair.pop('feedback'))
 
 
 class BaseLLMProvider(ABC):
     """Abstract base class for LLM providers."""
 
+    # Prompt templates, compiled once. Each prompt is a static prefix (rubric,
+    # instructions, output format) followed by the per-request transcript tail.
+    PROMPT_PREFIX = string.Template("""\
+You are organizing verbal feedback that a teacher has recorded. Your task is to organize this feedback according to the provided rubric criteria.
+
+The feedback should be written in FIRST PERSON, as if the teacher is speaking directly to the student (use "I", "my observations", "I noticed", etc.).
+
+RUBRIC: $rubric_name
+$rubric_description
+
+CRITERIA:
+$criteria_list
+
+INSTRUCTIONS:
+1. Analyze the transcript at the end of this message and identify feedback related to each rubric criterion
+2. $detail_instruction
+3. If the teacher didn't mention a specific criterion, note that it wasn't addressed
+4. Write in FIRST PERSON perspective - as if the teacher is speaking directly ("I think...", "I noticed...", "In my view...")
+5. Maintain the teacher's conversational tone and specific comments
+6. Provide a brief overall summary (2-3 sentences) in first person
+
+OUTPUT FORMAT:
+Return your response in the following JSON format:
+{
+    "summary": "Brief overall summary in first person (e.g., 'I found your work...')",
+    "criterion_feedback": {
+        "Criterion Name 1": "Feedback in first person for this criterion",
+        "Criterion Name 2": "Feedback in first person for this criterion",
+        ...
+    }
+}
+
+Ensure all criterion names from the rubric are included in your response, even if the teacher didn't explicitly address them (in which case note "I didn't address this in my feedback" or similar).
+
+""")
+    PROMPT_TAIL = string.Template("""\
+TEACHER'S VERBAL FEEDBACK (TRANSCRIPT):
+$transcript
+""")
+
+    STRUCTURED_PROMPT_PREFIX = string.Template("""\
+$instruction_prompt
+
+---
+
+RUBRIC:
+$rubric_text
+
+""")
+    STRUCTURED_PROMPT_TAIL = string.Template("""\
+TRANSCRIPT:
+$transcript
+""")
+
     @abstractmethod
     def organize_feedback(
         self,
         transcript: str,
         rubric: Rubric,
-        detail_level: str = "detailed"
+        detail_level: str = "detailed",
+        on_criterion: Optional[Callable[[str, str], None]] = None
     ) -> Optional[OrganizedFeedback]:
         """
         Organize transcript feedback according to rubric criteria.
@@ -103,6 +358,8 @@ class BaseLLMProvider(ABC):
             transcript: Raw transcript text
             rubric: Rubric to organize feedback by
             detail_level: "brief" or "detailed"
+            on_criterion: Optional callback receiving (criterion name, feedback text)
+                for each criterion as the response streams in
 
         Returns:
             OrganizedFeedback object or None if failed
@@ -134,95 +391,147 @@ class BaseLLMProvider(ABC):
         """Check if this provider is available and configured."""
         pass
 
-    def _build_prompt(self, transcript: str, rubric: Rubric, detail_level: str) -> str:
-        """Build the prompt for organizing feedback."""
-        # Build criteria list with performance levels if available
-        criteria_parts = []
-        for c in rubric.criteria:
-            if c.performance_levels:
-                # Format criterion with performance levels
-                criterion_text = f"- {c.name}:\n"
-                for pl in c.performance_levels:
-                    range_text = f" ({pl.score_range})" if pl.score_range else ""
-                    criterion_text += f"  • {pl.name}{range_text}: {pl.description}\n"
-                criteria_parts.append(criterion_text.rstrip())
-            else:
-                # Simple criterion
-                criteria_parts.append(f"- {c.name}: {c.description}")
+    def _request_json(
+        self,
+        prompt: str,
+        cached_prefix: str = "",
+        on_criterion: Optional[Callable[[str, str], None]] = None,
+        schema: Optional[dict] = None
+    ) -> Optional[dict]:
+        """
+        Send a prompt and parse the JSON object in the reply.
 
-        criteria_list = "\n".join(criteria_parts)
+        Args:
+            prompt: Per-request prompt text
+            cached_prefix: Static text sent ahead of the prompt (cacheable by the provider)
+            on_criterion: If given, stream the reply and call this with each
+                (criterion name, feedback text) pair as soon as it is complete
+            schema: JSON schema the reply must follow, for providers that can enforce one
 
-        detail_instruction = (
+        Returns:
+            Parsed JSON object, or None if the provider is unavailable or the reply had no JSON
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def _collect_stream(pieces: Iterable[Optional[str]], on_criterion: Callable[[str, str], None]) -> str:
+        """Join streamed text pieces, reporting criteria to on_criterion as they complete."""
+        parser = _CriterionStreamParser(on_criterion)
+        parts = []
+        for piece in pieces:
+            if piece:
+                parts.append(piece)
+                parser.feed(piece)
+        return "".join(parts)
+
+    @staticmethod
+    def _loads_json(text: str) -> dict:
+        """Parse a JSON reply, repairing minor syntax slips if json_repair is installed."""
+        import json
+        try:
+            return json.loads(text)
+        except ValueError as e:
+            try:
+                from json_repair import loads as repair_loads
+            except ImportError:
+                raise e
+            result = repair_loads(text)
+            if not isinstance(result, dict):
+                raise e
+            return result
+
+    # JSON schema for an organize reply, enforced by providers that support one.
+    # Criteria are a list of {criterion, feedback} pairs rather than an object
+    # keyed by name, since tool and strict schemas only accept simple property
+    # names and rubric criteria are free text ("Grammar & Mechanics").
+    FEEDBACK_SCHEMA = {
+        "type": "object",
+        "properties": {
+            "summary": {"type": "string"},
+            "criterion_feedback": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "criterion": {"type": "string"},
+                        "feedback": {"type": "string"}
+                    },
+                    "required": ["criterion", "feedback"],
+                    "additionalProperties": False
+                }
+            }
+        },
+        "required": ["summary", "criterion_feedback"],
+        "additionalProperties": False
+    }
+
+    @staticmethod
+    def _feedback_from_result(result: dict, rubric: Rubric, transcript: str) -> OrganizedFeedback:
+        """Build OrganizedFeedback from a parsed JSON response."""
+        criterion_feedback = result.get('criterion_feedback', {})
+        if isinstance(criterion_feedback, list):
+            # Schema-constrained replies list the criteria as pairs
+            criterion_feedback = {item['criterion']: item['feedback'] for item in criterion_feedback}
+
+        return OrganizedFeedback(
+            rubric_name=rubric.name,
+            criterion_feedback=criterion_feedback,
+            summary=result.get('summary', ''),
+            raw_transcript=transcript
+        )
+
+    def _criteria_list(self, rubric: Rubric) -> str:
+        """Render the rubric criteria (with performance levels if available) for the prompt."""
+        return rubric.rendered_criteria
+
+    @staticmethod
+    def _detail_instruction(detail_level: str) -> str:
+        """Get the instruction line for the requested detail level."""
+        return (
             "Provide concise, actionable feedback for each criterion."
             if detail_level == "brief"
             else "Provide detailed, constructive feedback for each criterion with specific examples from the transcript."
         )
 
-        prompt = f"""You are organizing verbal feedback that a teacher has recorded. Your task is to organize this feedback according to the provided rubric criteria.
-
-The feedback should be written in FIRST PERSON, as if the teacher is speaking directly to the student (use "I", "my observations", "I noticed", etc.).
-
-RUBRIC: {rubric.name}
-{rubric.description}
-
-CRITERIA:
-{criteria_list}
-
-TEACHER'S VERBAL FEEDBACK (TRANSCRIPT):
-{transcript}
-
-INSTRUCTIONS:
-1. Analyze the transcript and identify feedback related to each rubric criterion
-2. {detail_instruction}
-3. If the teacher didn't mention a specific criterion, note that it wasn't addressed
-4. Write in FIRST PERSON perspective - as if the teacher is speaking directly ("I think...", "I noticed...", "In my view...")
-5. Maintain the teacher's conversational tone and specific comments
-6. Provide a brief overall summary (2-3 sentences) in first person
-
-OUTPUT FORMAT:
-Return your response in the following JSON format:
-{{
-    "summary": "Brief overall summary in first person (e.g., 'I found your work...')",
-    "criterion_feedback": {{
-        "Criterion Name 1": "Feedback in first person for this criterion",
-        "Criterion Name 2": "Feedback in first person for this criterion",
-        ...
-    }}
-}}
+    def _build_prompt(self, transcript: str, rubric: Rubric, detail_level: str) -> str:
+        """Build the prompt for organizing feedback."""
+        return "".join(self._build_prompt_parts(transcript, rubric, detail_level))
 
-IMPORTANT: All feedback must be written in first person, as if the teacher is speaking directly to the student.
+    def _build_prompt_parts(self, transcript: str, rubric: Rubric, detail_level: str) -> Tuple[str, str]:
+        """
+        Build the organizing prompt as (static prefix, transcript section).
 
-Ensure all criterion names from the rubric are included in your response, even if the teacher didn't explicitly address them (in which case note "I didn't address this in my feedback" or similar).
-"""
-        return prompt
+        The rubric, instructions and output format come first and are identical
+        for every transcript graded with the same rubric, so providers can
+        cache that prefix server-side and only process the transcript anew.
+        """
+        prefix = self.PROMPT_PREFIX.substitute(
+            rubric_name=rubric.name,
+            rubric_description=rubric.description,
+            criteria_list=self._criteria_list(rubric),
+            detail_instruction=self._detail_instruction(detail_level)
+        )
+        return prefix, self.PROMPT_TAIL.substitute(transcript=transcript)
 
     def _build_structured_prompt(self, transcript: str, rubric: Rubric, instruction_prompt: str) -> str:
         """Build the prompt for structured feedback conversion."""
-        # Build rubric text
-        rubric_text = f"{rubric.name}\n{rubric.description}\n\nCriteria:\n"
-        for criterion in rubric.criteria:
-            if criterion.performance_levels:
-                # Format criterion with performance levels
-                rubric_text += f"- **{criterion.name}**:\n"
-                for pl in criterion.performance_levels:
-                    range_text = f" ({pl.score_range})" if pl.score_range else ""
-                    rubric_text += f"  • {pl.name}{range_text}: {pl.description}\n"
-            else:
-                # Simple criterion
-                rubric_text += f"- **{criterion.name}**: {criterion.description}\n"
-
-        # Combine instruction prompt with inputs
-        full_prompt = f"""{instruction_prompt}
-
----
+        return "".join(self._build_structured_prompt_parts(transcript, rubric, instruction_prompt))
 
-RUBRIC:
-{rubric_text}
-
-TRANSCRIPT:
-{transcript}
-"""
-        return full_prompt
+    def _build_structured_prompt_parts(
+        self,
+        transcript: str,
+        rubric: Rubric,
+        instruction_prompt: str
+    ) -> Tuple[str, str]:
+        """Build the structured prompt as (instructions and rubric prefix, transcript section)."""
+        criteria = rubric.rendered_criteria_markdown
+        rubric_text = f"{rubric.name}\n{rubric.description}\n\nCriteria:\n" + (criteria + "\n" if criteria else "")
+
+        prefix = self.STRUCTURED_PROMPT_PREFIX.substitute(
+            instruction_prompt=instruction_prompt,
+            rubric_text=rubric_text
+        )
+        return prefix, self.STRUCTURED_PROMPT_TAIL.substitute(transcript=transcript)
 
 
 class OllamaProvider(BaseLLMProvider):
@@ -237,8 +546,7 @@ class OllamaProvider(BaseLLMProvider):
         """Lazy load Ollama client."""
         if self._client is None:
             try:
-                import ollama
-                self._client = ollama.Client(host=self.base_url)
+                self._client = _ollama_client(self.base_url)
             except ImportError:
                 print("Ollama package not installed. Install with: pip install ollama")
                 return None
@@ -258,11 +566,36 @@ class OllamaProvider(BaseLLMProvider):
             print(f"Ollama not available: {e}")
             return False
 
+    def _request_json(
+        self,
+        prompt: str,
+        cached_prefix: str = "",
+        on_criterion: Optional[Callable[[str, str], None]] = None,
+        schema: Optional[dict] = None
+    ) -> Optional[dict]:
+        """Send a prompt to Ollama in JSON mode."""
+        client = self._get_client()
+        if not client:
+            return None
+
+        messages = [{"role": "user", "content": cached_prefix + prompt}]
+
+        # A stable leading prefix lets the server reuse its KV cache between requests
+        if on_criterion:
+            stream = client.chat(model=self.model, messages=messages, format="json", stream=True)
+            content = self._collect_stream((chunk['message']['content'] for chunk in stream), on_criterion)
+        else:
+            response = client.chat(model=self.model, messages=messages, format="json")
+            content = response['message']['content']
+
+        return self._loads_json(content)
+
     def organize_feedback(
         self,
         transcript: str,
         rubric: Rubric,
-        detail_level: str = "detailed"
+        detail_level: str = "detailed",
+        on_criterion: Optional[Callable[[str, str], None]] = None
     ) -> Optional[OrganizedFeedback]:
         """Organize feedback using Ollama."""
         client = self._get_client()
@@ -270,23 +603,15 @@ class OllamaProvider(BaseLLMProvider):
             return None
 
         try:
-            prompt = self._build_prompt(transcript, rubric, detail_level)
-
-            response = client.chat(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                format="json"
+            prefix, tail = self._build_prompt_parts(transcript, rubric, detail_level)
+            result = self._request_json(
+                tail, cached_prefix=prefix, on_criterion=on_criterion,
+                schema=self.FEEDBACK_SCHEMA
             )
+            if result is None:
+                return None
 
-            import json
-            result = json.loads(response['message']['content'])
-
-            return OrganizedFeedback(
-                rubric_name=rubric.name,
-                criterion_feedback=result.get('criterion_feedback', {}),
-                summary=result.get('summary', ''),
-                raw_transcript=transcript
-            )
+            return self._feedback_from_result(result, rubric, transcript)
 
         except Exception as e:
             print(f"Error organizing feedback with Ollama: {e}")
@@ -328,6 +653,9 @@ class OllamaProvider(BaseLLMProvider):
 class OpenAIProvider(BaseLLMProvider):
     """OpenAI API provider."""
 
+    # Model families that support strict json_schema structured outputs
+    STRUCTURED_OUTPUT_MODELS = ("gpt-4o", "gpt-4.1", "gpt-5", "o1", "o3", "o4")
+
     def __init__(self, settings: LLMSettings):
         self.api_key = settings.openai_api_key
         self.model = settings.openai_model
@@ -337,8 +665,7 @@ class OpenAIProvider(BaseLLMProvider):
         """Lazy load OpenAI client."""
         if self._client is None:
             try:
-                from openai import OpenAI
-                self._client = OpenAI(api_key=self.api_key)
+                self._client = _openai_client(self.api_key)
             except ImportError:
                 print("OpenAI package not installed. Install with: pip install openai")
                 return None
@@ -348,11 +675,57 @@ class OpenAIProvider(BaseLLMProvider):
         """Check if OpenAI is configured."""
         return bool(self.api_key) and self._get_client() is not None
 
+    def _response_format(self, schema: Optional[dict]) -> dict:
+        """Use a strict JSON schema where the model supports it, else plain JSON mode."""
+        if schema is not None and self.model.startswith(self.STRUCTURED_OUTPUT_MODELS):
+            return {
+                "type": "json_schema",
+                "json_schema": {"name": "feedback", "schema": schema, "strict": True}
+            }
+        return {"type": "json_object"}
+
+    def _request_json(
+        self,
+        prompt: str,
+        cached_prefix: str = "",
+        on_criterion: Optional[Callable[[str, str], None]] = None,
+        schema: Optional[dict] = None
+    ) -> Optional[dict]:
+        """Send a prompt to OpenAI in JSON mode."""
+        client = self._get_client()
+        if not client:
+            return None
+
+        messages = [{"role": "user", "content": cached_prefix + prompt}]
+
+        # Prompts sharing a long leading prefix are cached automatically by the API
+        if on_criterion:
+            stream = client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                response_format=self._response_format(schema),
+                stream=True
+            )
+            content = self._collect_stream(
+                (chunk.choices[0].delta.content for chunk in stream if chunk.choices),
+                on_criterion
+            )
+        else:
+            response = client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                response_format=self._response_format(schema)
+            )
+            content = response.choices[0].message.content
+
+        return self._loads_json(content)
+
     def organize_feedback(
         self,
         transcript: str,
         rubric: Rubric,
-        detail_level: str = "detailed"
+        detail_level: str = "detailed",
+        on_criterion: Optional[Callable[[str, str], None]] = None
     ) -> Optional[OrganizedFeedback]:
         """Organize feedback using OpenAI."""
         client = self._get_client()
@@ -360,23 +733,15 @@ class OpenAIProvider(BaseLLMProvider):
             return None
 
         try:
-            prompt = self._build_prompt(transcript, rubric, detail_level)
-
-            response = client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                response_format={"type": "json_object"}
+            prefix, tail = self._build_prompt_parts(transcript, rubric, detail_level)
+            result = self._request_json(
+                tail, cached_prefix=prefix, on_criterion=on_criterion,
+                schema=self.FEEDBACK_SCHEMA
             )
+            if result is None:
+                return None
 
-            import json
-            result = json.loads(response.choices[0].message.content)
-
-            return OrganizedFeedback(
-                rubric_name=rubric.name,
-                criterion_feedback=result.get('criterion_feedback', {}),
-                summary=result.get('summary', ''),
-                raw_transcript=transcript
-            )
+            return self._feedback_from_result(result, rubric, transcript)
 
         except Exception as e:
             print(f"Error organizing feedback with OpenAI: {e}")
@@ -418,6 +783,9 @@ class OpenAIProvider(BaseLLMProvider):
 class AnthropicProvider(BaseLLMProvider):
     """Anthropic Claude API provider."""
 
+    # Tool Claude is required to call; its input is the feedback JSON
+    FEEDBACK_TOOL = "emit_feedback"
+
     def __init__(self, settings: LLMSettings):
         self.api_key = settings.anthropic_api_key
         self.model = settings.anthropic_model
@@ -427,8 +795,7 @@ class AnthropicProvider(BaseLLMProvider):
         """Lazy load Anthropic client."""
         if self._client is None:
             try:
-                from anthropic import Anthropic
-                self._client = Anthropic(api_key=self.api_key)
+                self._client = _anthropic_client(self.api_key)
             except ImportError:
                 print("Anthropic package not installed. Install with: pip install anthropic")
                 return None
@@ -438,11 +805,82 @@ class AnthropicProvider(BaseLLMProvider):
         """Check if Anthropic is configured."""
         return bool(self.api_key) and self._get_client() is not None
 
+    @staticmethod
+    def _user_message(prompt: str, cached_prefix: str = "") -> dict:
+        """Build a user message, marking the static prefix for prompt caching."""
+        if not cached_prefix:
+            return {"role": "user", "content": prompt}
+        return {
+            "role": "user",
+            "content": [
+                {"type": "text", "text": cached_prefix, "cache_control": {"type": "ephemeral"}},
+                {"type": "text", "text": prompt},
+            ]
+        }
+
+    def _request_json(
+        self,
+        prompt: str,
+        cached_prefix: str = "",
+        on_criterion: Optional[Callable[[str, str], None]] = None,
+        schema: Optional[dict] = None
+    ) -> Optional[dict]:
+        """Send a prompt to Claude and extract the JSON object from its reply."""
+        client = self._get_client()
+        if not client:
+            return None
+
+        request = {
+            "model": self.model,
+            "max_tokens": 4096,
+            "messages": [self._user_message(prompt, cached_prefix)],
+            **self._tool_options(schema)
+        }
+
+        if on_criterion:
+            with client.messages.stream(**request) as stream:
+                if schema is not None:
+                    # Forced tool input arrives as partial JSON deltas rather than text
+                    self._collect_stream((
+                        event.delta.partial_json for event in stream
+                        if event.type == "content_block_delta" and event.delta.type == "input_json_delta"
+                    ), on_criterion)
+                else:
+                    self._collect_stream(stream.text_stream, on_criterion)
+                response = stream.get_final_message()
+        else:
+            response = client.messages.create(**request)
+
+        return self._result_from_message(response)
+
+    def _tool_options(self, schema: Optional[dict]) -> dict:
+        """Request arguments that force Claude to answer through the feedback tool."""
+        if schema is None:
+            return {}
+        return {
+            "tools": [{
+                "name": self.FEEDBACK_TOOL,
+                "description": "Return the organized feedback.",
+                "input_schema": schema
+            }],
+            "tool_choice": {"type": "tool", "name": self.FEEDBACK_TOOL}
+        }
+
+    def _result_from_message(self, response) -> Optional[dict]:
+        """Get the feedback JSON from a tool call, or failing that from the reply text."""
+        for block in response.content:
+            if block.type == "tool_use":
+                return block.input
+
+        text = "".join(block.text for block in response.content if block.type == "text")
+        return self._extract_json(text)
+
     def organize_feedback(
         self,
         transcript: str,
         rubric: Rubric,
-        detail_level: str = "detailed"
+        detail_level: str = "detailed",
+        on_criterion: Optional[Callable[[str, str], None]] = None
     ) -> Optional[OrganizedFeedback]:
         """Organize feedback using Anthropic Claude."""
         client = self._get_client()
@@ -450,41 +888,46 @@ class AnthropicProvider(BaseLLMProvider):
             return None
 
         try:
-            prompt = self._build_prompt(transcript, rubric, detail_level)
-
-            # Claude doesn't have native JSON mode, so we'll parse the response
-            response = client.messages.create(
-                model=self.model,
-                max_tokens=4096,
-                messages=[{"role": "user", "content": prompt}]
+            prefix, tail = self._build_prompt_parts(transcript, rubric, detail_level)
+            result = self._request_json(
+                tail, cached_prefix=prefix, on_criterion=on_criterion,
+                schema=self.FEEDBACK_SCHEMA
             )
-
-            import json
-            # Extract JSON from response
-            content = response.content[0].text
-
-            # Try to find JSON in the response
-            start = content.find('{')
-            end = content.rfind('}') + 1
-            if start >= 0 and end > start:
-                json_str = content[start:end]
-                result = json.loads(json_str)
-            else:
-                print("Could not parse JSON from Claude response")
+            if result is None:
                 return None
 
-            return OrganizedFeedback(
-                rubric_name=rubric.name,
-                criterion_feedback=result.get('criterion_feedback', {}),
-                summary=result.get('summary', ''),
-                raw_transcript=transcript
-            )
+            return self._feedback_from_result(result, rubric, transcript)
 
         except Exception as e:
             print(f"Error organizing feedback with Anthropic: {e}")
             # Re-raise to let UI handle the error display
             raise
 
+    def _extract_json(self, content: str) -> Optional[dict]:
+        """Extract the JSON object from a Claude response."""
+        import json
+
+        # Try to find JSON in the response
+        start = content.find('{')
+        if start >= 0:
+            # Decode the first complete object in one pass; unlike slicing to the
+            # last '}', this ignores any prose (or braces) after the object
+            try:
+                result, _ = json.JSONDecoder().raw_decode(content, start)
+                if isinstance(result, dict):
+                    return result
+            except ValueError:
+                pass
+
+        # Malformed object: fall back to the outermost braces (and json_repair if installed)
+        end = content.rfind('}') + 1
+        if start >= 0 and end > start:
+            json_str = content[start:end]
+            return self._loads_json(json_str)
+
+        print("Could not parse JSON from Claude response")
+        return None
+
     def organize_structured_feedback(
         self,
         transcript: str,
@@ -497,12 +940,12 @@ class AnthropicProvider(BaseLLMProvider):
             return None
 
         try:
-            prompt = self._build_structured_prompt(transcript, rubric, instruction_prompt)
+            prefix, tail = self._build_structured_prompt_parts(transcript, rubric, instruction_prompt)
 
             response = client.messages.create(
                 model=self.model,
                 max_tokens=4096,
-                messages=[{"role": "user", "content": prompt}]
+                messages=[self._user_message(tail, prefix)]
             )
 
             feedback_text = response.content[0].text
@@ -530,12 +973,8 @@ class OpenRouterProvider(BaseLLMProvider):
         """Lazy load OpenAI-compatible client for OpenRouter."""
         if self._client is None:
             try:
-                from openai import OpenAI
                 # OpenRouter uses OpenAI-compatible API
-                self._client = OpenAI(
-                    api_key=self.api_key,
-                    base_url="https://openrouter.ai/api/v1"
-                )
+                self._client = _openai_client(self.api_key, "https://openrouter.ai/api/v1")
             except ImportError:
                 print("OpenAI package not installed. Install with: pip install openai")
                 return None
@@ -545,11 +984,48 @@ class OpenRouterProvider(BaseLLMProvider):
         """Check if OpenRouter is configured."""
         return bool(self.api_key) and self._get_client() is not None
 
+    def _request_json(
+        self,
+        prompt: str,
+        cached_prefix: str = "",
+        on_criterion: Optional[Callable[[str, str], None]] = None,
+        schema: Optional[dict] = None
+    ) -> Optional[dict]:
+        """Send a prompt to OpenRouter in JSON mode."""
+        client = self._get_client()
+        if not client:
+            return None
+
+        messages = [{"role": "user", "content": cached_prefix + prompt}]
+
+        # Prompts sharing a long leading prefix are cached automatically by the API
+        if on_criterion:
+            stream = client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                response_format={"type": "json_object"},
+                stream=True
+            )
+            content = self._collect_stream(
+                (chunk.choices[0].delta.content for chunk in stream if chunk.choices),
+                on_criterion
+            )
+        else:
+            response = client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                response_format={"type": "json_object"}
+            )
+            content = response.choices[0].message.content
+
+        return self._loads_json(content)
+
     def organize_feedback(
         self,
         transcript: str,
         rubric: Rubric,
-        detail_level: str = "detailed"
+        detail_level: str = "detailed",
+        on_criterion: Optional[Callable[[str, str], None]] = None
     ) -> Optional[OrganizedFeedback]:
         """Organize feedback using OpenRouter."""
         client = self._get_client()
@@ -557,26 +1033,164 @@ class OpenRouterProvider(BaseLLMProvider):
             return None
 
         try:
-            prompt = self._build_prompt(transcript, rubric, detail_level)
+            prefix, tail = self._build_prompt_parts(transcript, rubric, detail_level)
+            result = self._request_json(
+                tail, cached_prefix=prefix, on_criterion=on_criterion,
+                schema=self.FEEDBACK_SCHEMA
+            )
+            if result is None:
+                return None
+
+            return self._feedback_from_result(result, rubric, transcript)
+
+        except Exception as e:
+            print(f"Error organizing feedback with OpenRouter: {e}")
+            # Re-raise to let UI handle the error display
+            raise
+
+    def organize_structured_feedback(
+        self,
+        transcript: str,
+        rubric: Rubric,
+        instruction_prompt: str
+    ) -> Optional[StructuredFeedback]:
+        """Convert transcript to structured feedback using OpenRouter."""
+        client = self._get_client()
+        if not client:
+            return None
+
+        try:
+            prompt = self._build_structured_prompt(transcript, rubric, instruction_prompt)
 
             response = client.chat.completions.create(
                 model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                response_format={"type": "json_object"}
+                messages=[{"role": "user", "content": prompt}]
             )
 
-            import json
-            result = json.loads(response.choices[0].message.content)
+            feedback_text = response.choices[0].message.content
 
-            return OrganizedFeedback(
+            return StructuredFeedback(
                 rubric_name=rubric.name,
-                criterion_feedback=result.get('criterion_feedback', {}),
-                summary=result.get('summary', ''),
+                feedback_text=feedback_text,
                 raw_transcript=transcript
             )
 
         except Exception as e:
-            print(f"Error organizing feedback with OpenRouter: {e}")
+            print(f"Error organizing structured feedback with OpenRouter: {e}")
+            raise
+
+
+class LlamaCppProvider(BaseLLMProvider):
+    """
+    llama.cpp llama-server provider (OpenAI-compatible API).
+
+    Requests ask the server to keep the prompt's KV cache and pin each rubric
+    to a fixed slot, so the rubric prefix is only processed once per slot.
+    Start the server with parallel slots and cache reuse enabled, e.g.:
+
+        llama-server -m model.gguf -np 4 --cache-reuse 256
+    """
+
+    def __init__(self, settings: LLMSettings):
+        self.model = settings.llamacpp_model
+        self.base_url = settings.llamacpp_base_url
+        self.n_slots = max(1, settings.llamacpp_slots)
+        self._client = None
+
+    def _get_client(self):
+        """Lazy load OpenAI-compatible client for llama-server."""
+        if self._client is None:
+            try:
+                # llama-server doesn't check the key, but the SDK requires one
+                self._client = _openai_client("sk-no-key-required", self.base_url)
+            except ImportError:
+                print("OpenAI package not installed. Install with: pip install openai")
+                return None
+        return self._client
+
+    def is_available(self) -> bool:
+        """Check if llama-server is reachable."""
+        client = self._get_client()
+        if not client:
+            return False
+
+        try:
+            client.models.list()
+            return True
+        except Exception as e:
+            print(f"llama.cpp server not available: {e}")
+            return False
+
+    def _extra_body(self, cached_prefix: str) -> dict:
+        """Server options that keep the prompt cache and pin a prefix to one slot."""
+        extra = {"cache_prompt": True}
+        if cached_prefix:
+            # crc32 rather than hash() so the slot is stable across app restarts
+            extra["id_slot"] = zlib.crc32(cached_prefix.encode('utf-8')) % self.n_slots
+        return extra
+
+    def _request_json(
+        self,
+        prompt: str,
+        cached_prefix: str = "",
+        on_criterion: Optional[Callable[[str, str], None]] = None,
+        schema: Optional[dict] = None
+    ) -> Optional[dict]:
+        """Send a prompt to llama-server in JSON mode."""
+        client = self._get_client()
+        if not client:
+            return None
+
+        messages = [{"role": "user", "content": cached_prefix + prompt}]
+
+        if on_criterion:
+            stream = client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                response_format={"type": "json_object"},
+                extra_body=self._extra_body(cached_prefix),
+                stream=True
+            )
+            content = self._collect_stream(
+                (chunk.choices[0].delta.content for chunk in stream if chunk.choices),
+                on_criterion
+            )
+        else:
+            response = client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                response_format={"type": "json_object"},
+                extra_body=self._extra_body(cached_prefix)
+            )
+            content = response.choices[0].message.content
+
+        return self._loads_json(content)
+
+    def organize_feedback(
+        self,
+        transcript: str,
+        rubric: Rubric,
+        detail_level: str = "detailed",
+        on_criterion: Optional[Callable[[str, str], None]] = None
+    ) -> Optional[OrganizedFeedback]:
+        """Organize feedback using llama-server."""
+        client = self._get_client()
+        if not client:
+            return None
+
+        try:
+            prefix, tail = self._build_prompt_parts(transcript, rubric, detail_level)
+            result = self._request_json(
+                tail, cached_prefix=prefix, on_criterion=on_criterion,
+                schema=self.FEEDBACK_SCHEMA
+            )
+            if result is None:
+                return None
+
+            return self._feedback_from_result(result, rubric, transcript)
+
+        except Exception as e:
+            print(f"Error organizing feedback with llama.cpp: {e}")
             # Re-raise to let UI handle the error display
             raise
 
@@ -586,17 +1200,18 @@ class OpenRouterProvider(BaseLLMProvider):
         rubric: Rubric,
         instruction_prompt: str
     ) -> Optional[StructuredFeedback]:
-        """Convert transcript to structured feedback using OpenRouter."""
+        """Convert transcript to structured feedback using llama-server."""
         client = self._get_client()
         if not client:
             return None
 
         try:
-            prompt = self._build_structured_prompt(transcript, rubric, instruction_prompt)
+            prefix, tail = self._build_structured_prompt_parts(transcript, rubric, instruction_prompt)
 
             response = client.chat.completions.create(
                 model=self.model,
-                messages=[{"role": "user", "content": prompt}]
+                messages=[{"role": "user", "content": prefix + tail}],
+                extra_body=self._extra_body(prefix)
             )
 
             feedback_text = response.choices[0].message.content
@@ -608,33 +1223,50 @@ class OpenRouterProvider(BaseLLMProvider):
             )
 
         except Exception as e:
-            print(f"Error organizing structured feedback with OpenRouter: {e}")
+            print(f"Error organizing structured feedback with llama.cpp: {e}")
             raise
 
 
 class FeedbackOrganizer:
     """Main feedback organization coordinator."""
 
+    # Provider name -> class; instances (and their SDK imports) are created on first use
+    PROVIDER_CLASSES = {
+        "ollama": OllamaProvider,
+        "openai": OpenAIProvider,
+        "anthropic": AnthropicProvider,
+        "openrouter": OpenRouterProvider,
+        "llamacpp": LlamaCppProvider
+    }
+
     def __init__(self, settings: LLMSettings):
         self.settings = settings
-        self.providers = {
-            "ollama": OllamaProvider(settings),
-            "openai": OpenAIProvider(settings),
-            "anthropic": AnthropicProvider(settings),
-            "openrouter": OpenRouterProvider(settings)
-        }
+        self._providers: Dict[str, BaseLLMProvider] = {}
+
+    @property
+    def providers(self) -> Dict[str, BaseLLMProvider]:
+        """All providers, building any that haven't been used yet."""
+        return {name: self.get_provider(name) for name in self.PROVIDER_CLASSES}
 
     def get_provider(self, provider_name: Optional[str] = None) -> Optional[BaseLLMProvider]:
-        """Get the specified provider or the configured default."""
+        """Get the specified provider or the configured default, building it on first use."""
         provider_name = provider_name or self.settings.provider
-        return self.providers.get(provider_name)
+        provider = self._providers.get(provider_name)
+        if provider is None:
+            provider_class = self.PROVIDER_CLASSES.get(provider_name)
+            if provider_class is None:
+                return None
+            provider = self._providers[provider_name] = provider_class(self.settings)
+        return provider
 
     def organize_feedback(
         self,
         transcript: str,
         rubric: Rubric,
         detail_level: str = "detailed",
-        provider_name: Optional[str] = None
+        provider_name: Optional[str] = None,
+        on_criterion: Optional[Callable[[str, str], None]] = None,
+        use_cache: bool = True
     ) -> Optional[OrganizedFeedback]:
         """
         Organize feedback using the specified or default provider.
@@ -644,20 +1276,43 @@ class FeedbackOrganizer:
             rubric: Rubric to organize feedback by
             detail_level: "brief" or "detailed"
             provider_name: Optional override for provider
+            on_criterion: Optional callback receiving (criterion name, feedback text)
+                for each criterion as the response streams in (called from the
+                request thread)
+            use_cache: Reuse the stored result of an identical earlier request
+                (provider, model and prompt) instead of calling the LLM
 
         Returns:
             OrganizedFeedback or None if failed
         """
+        provider_name = provider_name or self.settings.provider
         provider = self.get_provider(provider_name)
         if not provider:
-            print(f"Provider '{provider_name or self.settings.provider}' not available")
+            print(f"Provider '{provider_name}' not available")
             return None
 
+        cache_key = None
+        if use_cache and self.settings.cache_responses and _response_cache_enabled():
+            model = getattr(provider, "model", "")
+            prefix, tail = provider._build_prompt_parts(transcript, rubric, detail_level)
+            cache_key = _response_cache_key(provider_name, model, prefix + tail)
+            cached = _response_cache_get(cache_key)
+
+            if cached is not None:
+                feedback = OrganizedFeedback(**cached)
+                if on_criterion:
+                    for criterion, text in feedback.criterion_feedback.items():
+                        on_criterion(criterion, text)
+                return feedback
+
         if not provider.is_available():
-            print(f"Provider '{provider_name or self.settings.provider}' is not available or configured")
+            print(f"Provider '{provider_name}' is not available or configured")
             return None
 
-        return provider.organize_feedback(transcript, rubric, detail_level)
+        feedback = provider.organize_feedback(transcript, rubric, detail_level, on_criterion)
+        if feedback is not None and cache_key is not None:
+            _response_cache_put(cache_key, asdict(feedback))
+        return feedback
 
     def organize_structured_feedback(
         self,
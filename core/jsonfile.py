@@ -0,0 +1,50 @@
+"""
+JSON encoding and file writing for the settings and rubric files.
+Uses orjson when it is installed and falls back to the standard library.
+"""
+import json
+import os
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to json
+    orjson = None
+
+
+def dumps(data) -> bytes:
+    """Serialize data as UTF-8 JSON indented by two spaces."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def loads(data: bytes):
+    """Parse JSON from UTF-8 bytes (or str)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """
+    Replace a file's contents without ever leaving it half-written.
+
+    The data is written and fsynced to a sibling temporary file, which is
+    then renamed over the target; if anything fails, the original file is
+    left as it was.
+    """
+    path = Path(path)
+    temp_path = path.with_name(path.name + '.tmp')
+    try:
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,142 @@
+"""
+Minimal PDF writer for plain text documents.
+Produces single-column PDF 1.4 files using the built-in Helvetica fonts,
+so exports work without reportlab.
+"""
+import textwrap
+from io import BytesIO
+from pathlib import Path
+from typing import Iterable, Iterator, List, Tuple
+
+PAGE_WIDTH = 612  # US Letter, in points
+PAGE_HEIGHT = 792
+MARGIN = 72
+
+# Block style -> (font resource, font size, space before, space after)
+STYLES = {
+    'title': ('F2', 18, 0, 12),
+    'heading': ('F2', 14, 12, 6),
+    'subheading': ('F2', 12, 8, 4),
+    'body': ('F1', 11, 0, 8),
+    'small': ('F1', 9, 0, 12),
+}
+
+# Average Helvetica glyph width as a fraction of the font size (used for wrapping)
+_AVG_CHAR_WIDTH = 0.5
+
+# A laid-out line: (font resource, font size, baseline y, text)
+Line = Tuple[str, int, float, str]
+
+
+def write_pdf(file_path: Path, blocks: Iterable[Tuple[str, str]]) -> None:
+    """
+    Write text blocks to a PDF file.
+
+    Args:
+        file_path: Path to save the file
+        blocks: (style, text) pairs; style is a key of STYLES, or 'pagebreak'
+    """
+    Path(file_path).write_bytes(render_pdf(blocks))
+
+
+def render_pdf(blocks: Iterable[Tuple[str, str]]) -> bytes:
+    """Lay out text blocks and return the PDF file contents."""
+    return _serialize(_layout(blocks))
+
+
+def _wrap(text: str, width: int) -> Iterator[str]:
+    """Wrap text to a character width, keeping explicit line breaks."""
+    for paragraph in text.split('\n'):
+        if paragraph.strip():
+            yield from textwrap.wrap(paragraph, width)
+        else:
+            yield ''
+
+
+def _layout(blocks: Iterable[Tuple[str, str]]) -> List[List[Line]]:
+    """Flow the blocks onto pages, top to bottom."""
+    top = PAGE_HEIGHT - MARGIN
+    usable_width = PAGE_WIDTH - 2 * MARGIN
+
+    pages: List[List[Line]] = [[]]
+    y = top
+    for style, text in blocks:
+        if style == 'pagebreak':
+            if pages[-1]:
+                pages.append([])
+                y = top
+            continue
+
+        font, size, space_before, space_after = STYLES[style]
+        leading = size * 1.2
+        chars_per_line = max(20, int(usable_width / (size * _AVG_CHAR_WIDTH)))
+
+        if pages[-1]:
+            y -= space_before
+        for line in _wrap(text, chars_per_line):
+            if y - leading < MARGIN:
+                pages.append([])
+                y = top
+            y -= leading
+            if line:
+                pages[-1].append((font, size, y, line))
+        y -= space_after
+
+    return pages
+
+
+def _pdf_string(text: str) -> bytes:
+    """Encode text as a PDF literal string (WinAnsi, unsupported characters as '?')."""
+    data = text.encode('cp1252', errors='replace')
+    return b'(' + data.replace(b'\\', b'\\\\').replace(b'(', b'\\(').replace(b')', b'\\)') + b')'
+
+
+def _content_stream(lines: List[Line]) -> bytes:
+    """Build a page's content stream: one positioned text run per line."""
+    ops = [b'BT']
+    for font, size, y, text in lines:
+        ops.append(b'/%s %d Tf 1 0 0 1 %d %.2f Tm %s Tj' % (
+            font.encode('ascii'), size, MARGIN, y, _pdf_string(text)
+        ))
+    ops.append(b'ET')
+    return b'\n'.join(ops)
+
+
+def _serialize(pages: List[List[Line]]) -> bytes:
+    """Serialize laid-out pages as a PDF 1.4 file."""
+    out = BytesIO()
+    offsets = []
+
+    def add_object(body: bytes) -> None:
+        offsets.append(out.tell())
+        out.write(b'%d 0 obj\n%s\nendobj\n' % (len(offsets), body))
+
+    out.write(b'%PDF-1.4\n%\xe2\xe3\xcf\xd3\n')
+
+    # Objects 1-4 are fixed; each page then takes a page object and a content stream
+    page_ids = [5 + 2 * i for i in range(len(pages))]
+    add_object(b'<< /Type /Catalog /Pages 2 0 R >>')
+    add_object(b'<< /Type /Pages /Kids [%s] /Count %d >>' % (
+        b' '.join(b'%d 0 R' % page_id for page_id in page_ids), len(pages)
+    ))
+    add_object(b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>')
+    add_object(b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold /Encoding /WinAnsiEncoding >>')
+
+    for page_id, lines in zip(page_ids, pages):
+        add_object(
+            b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] '
+            b'/Resources << /Font << /F1 3 0 R /F2 4 0 R >> >> /Contents %d 0 R >>'
+            % (PAGE_WIDTH, PAGE_HEIGHT, page_id + 1)
+        )
+        stream = _content_stream(lines)
+        add_object(b'<< /Length %d >>\nstream\n%s\nendstream' % (len(stream), stream))
+
+    xref_offset = out.tell()
+    out.write(b'xref\n0 %d\n0000000000 65535 f \n' % (len(offsets) + 1))
+    for offset in offsets:
+        out.write(b'%010d 00000 n \n' % offset)
+    out.write(b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (
+        len(offsets) + 1, xref_offset
+    ))
+
+    return out.getvalue()
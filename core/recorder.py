@@ -2,7 +2,9 @@
 Audio recording functionality using sounddevice.
 Handles microphone input and WAV file generation.
 """
-import queue
+import os
+import shutil
+import tempfile
 import threading
 from pathlib import Path
 from typing import Optional, Callable
@@ -10,25 +12,97 @@ import numpy as np
 import sounddevice as sd
 import soundfile as sf
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to NumPy
+    njit = None
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _mean_abs(block, scale):
+        """Mean absolute sample value in one fused pass, without temporaries."""
+        total = 0.0
+        for x in block.ravel():
+            total += abs(float(x))
+        return total / (block.size * scale)
+else:
+    _mean_abs = None
+
 
 class AudioRecorder:
     """Manages audio recording from microphone."""
 
-    def __init__(self, sample_rate: int = 16000):
+    # Frames delivered per audio callback
+    BLOCKSIZE = 1024
+
+    # Audio held in memory between the callback and the file writer
+    RING_SECONDS = 10
+
+    # How often the writer thread checks for captured audio
+    WRITE_INTERVAL = 0.1
+
+    # Blocks gathered before a write (about half a second at 16 kHz), so the
+    # file sees a few large writes instead of one per callback
+    WRITE_BATCH_BLOCKS = 8
+
+    # Audio blocks averaged into each level_callback update (~8 updates/s at
+    # 16 kHz), so the UI isn't woken for every callback
+    LEVEL_EVERY_BLOCKS = 2
+
+    # Full-scale value per capture dtype, for normalizing the level meter
+    FULL_SCALE = {'int16': 32768.0, 'float32': 1.0}
+
+    def __init__(self, sample_rate: int = 16000, dtype: str = 'int16'):
         """
         Initialize recorder.
 
         Args:
             sample_rate: Sample rate in Hz (16000 is optimal for Whisper)
+            dtype: Sample format captured from the device; 'int16' matches the
+                16-bit WAV output, so samples are written without conversion
         """
+        if dtype not in self.FULL_SCALE:
+            raise ValueError(f"Unsupported dtype: {dtype}")
         self.sample_rate = sample_rate
         self.channels = 1  # Mono audio
+        self.dtype = dtype
+        self._full_scale = self.FULL_SCALE[dtype]
         self.is_recording = False
         self.is_paused = False
-        self.audio_queue = queue.Queue()
-        self.recorded_frames = []
         self.stream: Optional[sd.InputStream] = None
-        self.record_thread: Optional[threading.Thread] = None
+
+        # Single-producer/single-consumer ring of audio blocks: the callback fills
+        # slots and advances _blocks_written, the writer thread drains them and
+        # advances _blocks_read. Each counter has exactly one writer, so no lock
+        # is needed and the callback never allocates or blocks.
+        self._ring: Optional[np.ndarray] = None
+        self._slot_frames: Optional[np.ndarray] = None
+        self._blocks_written = 0
+        self._blocks_read = 0
+        self._overruns = 0
+
+        # Exact count of captured frames (blocks may be short), kept by the callback
+        self._total_frames = 0
+
+        self._sfile: Optional[sf.SoundFile] = None
+        self._temp_path: Optional[str] = None
+        self._writer_thread: Optional[threading.Thread] = None
+        self._writer_stop = threading.Event()
+
+        # Scratch space for the NumPy level fallback, so the audio thread doesn't allocate
+        self._level_scratch = np.empty((self.BLOCKSIZE, self.channels), dtype=np.float32)
+        if _mean_abs is not None:
+            # Compile (or load from cache) now rather than on the first audio callback
+            _mean_abs(np.zeros((self.BLOCKSIZE, self.channels), dtype=self.dtype), self._full_scale)
+
+    def _block_level(self, indata: np.ndarray) -> float:
+        """Mean absolute amplitude of one audio block (0.0 to 1.0)."""
+        if _mean_abs is not None:
+            return _mean_abs(indata, self._full_scale)
+        if indata.shape != self._level_scratch.shape:
+            return float(np.abs(indata, dtype=np.float32).mean()) / self._full_scale
+        return float(np.abs(indata, out=self._level_scratch, dtype=np.float32).mean()) / self._full_scale
 
     def get_available_devices(self) -> list[dict]:
         """
@@ -66,10 +140,25 @@ class AudioRecorder:
         if self.is_recording:
             raise RuntimeError("Already recording")
 
+        # Stream to a temporary WAV file; stop_recording moves it into place
+        fd, self._temp_path = tempfile.mkstemp(prefix="transcribair_", suffix=".wav")
+        os.close(fd)
+        self._sfile = sf.SoundFile(
+            self._temp_path, mode='w',
+            samplerate=self.sample_rate, channels=self.channels, subtype='PCM_16'
+        )
+
         self.is_recording = True
         self.is_paused = False
-        self.recorded_frames = []
-        self.audio_queue = queue.Queue()
+        n_slots = max(2, self.sample_rate * self.RING_SECONDS // self.BLOCKSIZE)
+        self._ring = np.empty((n_slots, self.BLOCKSIZE, self.channels), dtype=self.dtype)
+        self._slot_frames = np.zeros(n_slots, dtype=np.int64)
+        self._blocks_written = 0
+        self._blocks_read = 0
+        self._overruns = 0
+        self._total_frames = 0
+        self._level_accum = 0.0
+        self._level_count = 0
 
         def audio_callback(indata, frames, time, status):
             """Callback for audio stream."""
@@ -77,27 +166,100 @@ class AudioRecorder:
                 print(f"Audio callback status: {status}")
 
             if not self.is_paused:
-                # Add to queue for processing
-                self.audio_queue.put(indata.copy())
-
-                # Calculate audio level for visualization
+                written = self._blocks_written
+                if written - self._blocks_read >= len(self._ring):
+                    # Writer hasn't freed a slot; drop the block rather than block the audio thread
+                    self._overruns += 1
+                else:
+                    slot = written % len(self._ring)
+                    self._ring[slot, :frames] = indata
+                    self._slot_frames[slot] = frames
+                    self._total_frames += frames
+                    # Publish only after the block is in place
+                    self._blocks_written = written + 1
+
+                # Calculate audio level for visualization, averaged over a few blocks
                 if level_callback:
-                    level = np.abs(indata).mean()
-                    level_callback(float(level))
+                    self._level_accum += self._block_level(indata)
+                    self._level_count += 1
+                    if self._level_count >= self.LEVEL_EVERY_BLOCKS:
+                        level_callback(self._level_accum / self._level_count)
+                        self._level_accum = 0.0
+                        self._level_count = 0
 
         # Start audio stream
-        self.stream = sd.InputStream(
-            device=device_index,
-            channels=self.channels,
-            samplerate=self.sample_rate,
-            callback=audio_callback,
-            blocksize=1024
-        )
-        self.stream.start()
+        try:
+            self.stream = sd.InputStream(
+                device=device_index,
+                channels=self.channels,
+                samplerate=self.sample_rate,
+                dtype=self.dtype,
+                callback=audio_callback,
+                blocksize=self.BLOCKSIZE
+            )
+            self.stream.start()
+        except Exception:
+            self.cancel_recording()
+            raise
+
+        # Start writer thread
+        self._writer_stop.clear()
+        self._writer_thread = threading.Thread(target=self._write_audio, daemon=True)
+        self._writer_thread.start()
+
+    def _write_audio(self) -> None:
+        """Flush captured audio to the WAV file (runs in background thread)."""
+        # Never wait for more than half the ring, or the callback could run out of slots
+        batch = max(1, min(self.WRITE_BATCH_BLOCKS, len(self._ring) // 2))
+        while not self._writer_stop.wait(self.WRITE_INTERVAL):
+            if self._blocks_written - self._blocks_read >= batch:
+                self._flush()
+        # Drain whatever is left, however little
+        self._flush()
+
+    def _flush(self) -> None:
+        """Write every block the callback has published since the last flush."""
+        n_slots = len(self._ring)
+        written = self._blocks_written
+        read = self._blocks_read
+
+        while read < written:
+            # Contiguous run of slots up to the end of the ring
+            first = read % n_slots
+            last = min(n_slots, first + (written - read))
+            frames = self._slot_frames[first:last]
+            if (frames == self.BLOCKSIZE).all():
+                self._sfile.write(self._ring[first:last].reshape(-1, self.channels))
+            else:
+                for slot, count in zip(range(first, last), frames):
+                    self._sfile.write(self._ring[slot, :count])
+            read += last - first
+            # Hand the slots back to the callback
+            self._blocks_read = read
+
+        if self._overruns:
+            print(f"Audio writer fell behind; dropped {self._overruns} blocks")
+            self._overruns = 0
+
+    def _close_stream_and_writer(self) -> None:
+        """Stop the input stream, let the writer drain the ring, and close the file."""
+        if self.stream:
+            self.stream.stop()
+            self.stream.close()
+            self.stream = None
+
+        self._writer_stop.set()
+        if self._writer_thread:
+            # No timeout: the final drain is bounded by the ring size, and the
+            # file and ring must not be released while the writer still uses them
+            self._writer_thread.join()
+            self._writer_thread = None
 
-        # Start processing thread
-        self.record_thread = threading.Thread(target=self._process_audio, daemon=True)
-        self.record_thread.start()
+        if self._sfile is not None:
+            self._sfile.close()
+            self._sfile = None
+        self._ring = None
+        self._slot_frames = None
 
     def pause_recording(self) -> None:
         """Pause recording (can be resumed)."""
@@ -126,47 +288,23 @@ class AudioRecorder:
 
         # Signal stop
         self.is_recording = False
+        self._close_stream_and_writer()
 
-        # Stop stream
-        if self.stream:
-            self.stream.stop()
-            self.stream.close()
-            self.stream = None
-
-        # Wait for processing thread
-        if self.record_thread:
-            self.record_thread.join(timeout=2.0)
-
-        # Combine all recorded frames
-        if not self.recorded_frames:
+        temp_path, self._temp_path = self._temp_path, None
+        if self._blocks_written == 0:
+            os.remove(temp_path)
             raise RuntimeError("No audio data recorded")
 
-        audio_data = np.concatenate(self.recorded_frames, axis=0)
-
         # Ensure output directory exists
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Save to WAV file
-        sf.write(
-            str(output_path),
-            audio_data,
-            self.sample_rate,
-            subtype='PCM_16'
-        )
+        # The WAV file is already complete; just move it into place
+        shutil.move(temp_path, str(output_path))
+        self._total_frames = 0
 
         return str(output_path)
 
-    def _process_audio(self) -> None:
-        """Process audio from queue (runs in background thread)."""
-        while self.is_recording:
-            try:
-                # Get audio data from queue with timeout
-                data = self.audio_queue.get(timeout=0.1)
-                self.recorded_frames.append(data)
-            except queue.Empty:
-                continue
-
     def get_duration(self) -> float:
         """
         Get current recording duration in seconds.
@@ -174,11 +312,7 @@ class AudioRecorder:
         Returns:
             Duration in seconds
         """
-        if not self.recorded_frames:
-            return 0.0
-
-        total_frames = sum(len(frame) for frame in self.recorded_frames)
-        return total_frames / self.sample_rate
+        return self._total_frames / self.sample_rate
 
     def cancel_recording(self) -> None:
         """Cancel recording without saving."""
@@ -186,13 +320,13 @@ class AudioRecorder:
             return
 
         self.is_recording = False
+        self._close_stream_and_writer()
 
-        if self.stream:
-            self.stream.stop()
-            self.stream.close()
-            self.stream = None
-
-        if self.record_thread:
-            self.record_thread.join(timeout=2.0)
-
-        self.recorded_frames = []
+        if self._temp_path:
+            try:
+                os.remove(self._temp_path)
+            except OSError:
+                pass
+            self._temp_path = None
+        self._blocks_written = 0
+        self._total_frames = 0
@@ -2,14 +2,23 @@
 Rubric management system for organizing feedback.
 Handles creation, storage, and retrieval of assessment rubrics.
 """
-import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Optional
 from dataclasses import dataclass, asdict
 from datetime import datetime
+from functools import cached_property, lru_cache
 
+from core import jsonfile
 
-@dataclass
+
+# __slots__ storage for the per-criterion dataclasses (slots=True needs Python 3.10+)
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class PerformanceLevel:
     """A performance level descriptor for a rubric criterion."""
     name: str  # e.g., "Poor", "Below Standard", "Excellent"
@@ -24,7 +33,7 @@ class PerformanceLevel:
         return cls(**data)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class RubricCriterion:
     """A single criterion in a rubric."""
     name: str
@@ -44,15 +53,16 @@ class RubricCriterion:
 
     @classmethod
     def from_dict(cls, data: dict) -> 'RubricCriterion':
-        # Handle performance levels if present
-        performance_levels = None
-        if 'performance_levels' in data and data['performance_levels']:
-            performance_levels = [PerformanceLevel.from_dict(pl) for pl in data['performance_levels']]
+        get = data.get
+
+        # Handle performance levels if present (missing, null and [] all mean none)
+        levels_data = get('performance_levels')
+        performance_levels = [PerformanceLevel.from_dict(pl) for pl in levels_data] if levels_data else None
 
         return cls(
             name=data['name'],
-            description=data.get('description', ''),
-            weight=data.get('weight', 1.0),
+            description=get('description', ''),
+            weight=get('weight', 1.0),
             performance_levels=performance_levels
         )
 
@@ -60,6 +70,7 @@ class RubricCriterion:
 @dataclass
 class Rubric:
     """A complete rubric with multiple criteria."""
+    # No slots here: the rendered criteria are cached in the instance __dict__
     name: str
     criteria: List[RubricCriterion]
     description: str = ""
@@ -67,10 +78,11 @@ class Rubric:
     modified_at: str = ""
 
     def __post_init__(self):
-        if not self.created_at:
-            self.created_at = datetime.now().isoformat()
-        if not self.modified_at:
-            self.modified_at = datetime.now().isoformat()
+        # Loaded rubrics carry both timestamps; new ones get a single shared "now"
+        if not self.created_at or not self.modified_at:
+            now = datetime.now().isoformat()
+            self.created_at = self.created_at or now
+            self.modified_at = self.modified_at or now
 
     def to_dict(self) -> dict:
         return {
@@ -83,19 +95,68 @@ class Rubric:
 
     @classmethod
     def from_dict(cls, data: dict) -> 'Rubric':
-        criteria = [RubricCriterion.from_dict(c) for c in data['criteria']]
+        criterion_from_dict = RubricCriterion.from_dict
+        get = data.get
         return cls(
             name=data['name'],
-            criteria=criteria,
-            description=data.get('description', ''),
-            created_at=data.get('created_at', ''),
-            modified_at=data.get('modified_at', '')
+            criteria=[criterion_from_dict(c) for c in data['criteria']],
+            description=get('description', ''),
+            created_at=get('created_at', ''),
+            modified_at=get('modified_at', '')
         )
 
     def update_modified(self):
         """Update the modified timestamp."""
         self.modified_at = datetime.now().isoformat()
 
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        # Replacing the criteria or marking the rubric modified drops the rendered text
+        if name in ('criteria', 'modified_at'):
+            self.__dict__.pop('rendered_criteria', None)
+            self.__dict__.pop('rendered_criteria_markdown', None)
+
+    @cached_property
+    def rendered_criteria(self) -> str:
+        """Criteria as a prompt list, one "- name: description" entry (or level list) per criterion."""
+        return self._render_criteria(bold=False)
+
+    @cached_property
+    def rendered_criteria_markdown(self) -> str:
+        """Criteria as a prompt list with bold criterion names."""
+        return self._render_criteria(bold=True)
+
+    def _render_criteria(self, bold: bool) -> str:
+        """Render the criteria, with performance levels where a criterion has them."""
+        lines = []
+        for c in self.criteria:
+            name = f"**{c.name}**" if bold else c.name
+            if c.performance_levels:
+                lines.append(f"- {name}:")
+                for pl in c.performance_levels:
+                    range_text = f" ({pl.score_range})" if pl.score_range else ""
+                    lines.append(f"  • {pl.name}{range_text}: {pl.description}")
+            else:
+                lines.append(f"- {name}: {c.description}")
+        return "\n".join(lines)
+
+
+# Deletes every ASCII character that isn't allowed in a rubric filename
+_UNSAFE_ASCII = str.maketrans('', '', ''.join(
+    chr(c) for c in range(128) if not (chr(c).isalnum() or chr(c) in ' -_')
+))
+
+
+@lru_cache(maxsize=256)
+def _sanitize_filename(rubric_name: str) -> str:
+    """Reduce a rubric name to letters, digits, spaces, '-' and '_' for use as a filename."""
+    if rubric_name.isascii():
+        safe_name = rubric_name.translate(_UNSAFE_ASCII)
+    else:
+        # Non-ASCII letters are kept, non-ASCII symbols dropped
+        safe_name = "".join(c for c in rubric_name if c.isalnum() or c in (' ', '-', '_'))
+    return safe_name.strip()
+
 
 class RubricManager:
     """Manages rubric storage and retrieval."""
@@ -110,17 +171,14 @@ class RubricManager:
 
     def _get_rubric_path(self, rubric_name: str) -> Path:
         """Get the file path for a rubric."""
-        # Sanitize filename
-        safe_name = "".join(c for c in rubric_name if c.isalnum() or c in (' ', '-', '_')).strip()
-        return self.storage_dir / f"{safe_name}.json"
+        return self.storage_dir / f"{_sanitize_filename(rubric_name)}.json"
 
     def save_rubric(self, rubric: Rubric) -> bool:
         """Save a rubric to storage."""
         try:
             rubric.update_modified()
             path = self._get_rubric_path(rubric.name)
-            with open(path, 'w', encoding='utf-8') as f:
-                json.dump(rubric.to_dict(), f, indent=2, ensure_ascii=False)
+            jsonfile.write_atomic(path, jsonfile.dumps(rubric.to_dict()))
             return True
         except Exception as e:
             print(f"Error saving rubric: {e}")
@@ -130,13 +188,10 @@ class RubricManager:
         """Load a rubric from storage."""
         try:
             path = self._get_rubric_path(rubric_name)
-            if not path.exists():
-                return None
-
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
+            data = jsonfile.loads(path.read_bytes())
             return Rubric.from_dict(data)
+        except FileNotFoundError:
+            return None
         except Exception as e:
             print(f"Error loading rubric: {e}")
             return None
@@ -144,12 +199,48 @@ class RubricManager:
     def list_rubrics(self) -> List[str]:
         """List all available rubric names."""
         try:
-            rubric_files = self.storage_dir.glob("*.json")
-            return sorted([f.stem for f in rubric_files])
+            # scandir's cached entry type avoids a stat() per file
+            with os.scandir(self.storage_dir) as entries:
+                return sorted(
+                    entry.name[:-5] for entry in entries
+                    if entry.name.endswith('.json') and entry.is_file()
+                )
+        except Exception as e:
+            print(f"Error listing rubrics: {e}")
+            return []
+
+    def load_all_rubrics(self) -> List[Rubric]:
+        """
+        Load every stored rubric, ordered by name.
+
+        The directory is read once and the files are read and parsed on a
+        small thread pool. Files that fail to load are skipped.
+        """
+        try:
+            with os.scandir(self.storage_dir) as entries:
+                paths = sorted(
+                    (Path(entry.path) for entry in entries
+                     if entry.name.endswith('.json') and entry.is_file()),
+                    key=lambda path: path.stem
+                )
         except Exception as e:
             print(f"Error listing rubrics: {e}")
             return []
 
+        def load(path: Path) -> Optional[Rubric]:
+            try:
+                return Rubric.from_dict(jsonfile.loads(path.read_bytes()))
+            except Exception as e:
+                print(f"Error loading rubric {path.name}: {e}")
+                return None
+
+        if len(paths) <= 1:
+            rubrics = [load(path) for path in paths]
+        else:
+            with ThreadPoolExecutor(max_workers=min(8, len(paths), os.cpu_count() or 1)) as executor:
+                rubrics = list(executor.map(load, paths))
+        return [rubric for rubric in rubrics if rubric is not None]
+
     def delete_rubric(self, rubric_name: str) -> bool:
         """Delete a rubric from storage."""
         try:
@@ -165,8 +256,7 @@ class RubricManager:
     def export_rubric(self, rubric: Rubric, export_path: Path) -> bool:
         """Export a rubric to a specific file path."""
         try:
-            with open(export_path, 'w', encoding='utf-8') as f:
-                json.dump(rubric.to_dict(), f, indent=2, ensure_ascii=False)
+            jsonfile.write_atomic(export_path, jsonfile.dumps(rubric.to_dict()))
             return True
         except Exception as e:
             print(f"Error exporting rubric: {e}")
@@ -175,8 +265,7 @@ class RubricManager:
     def import_rubric(self, import_path: Path) -> Optional[Rubric]:
         """Import a rubric from a file."""
         try:
-            with open(import_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = jsonfile.loads(Path(import_path).read_bytes())
 
             rubric = Rubric.from_dict(data)
 
@@ -193,34 +282,38 @@ class RubricManager:
         return self._get_rubric_path(rubric_name).exists()
 
 
-# Example rubric templates
+# Example rubric templates, kept as plain data; each factory call builds a
+# fresh Rubric from them, since callers are free to edit what they get back
+_ESSAY_TEMPLATE = {
+    'name': "Essay Rubric",
+    'description': "General rubric for essay assignments",
+    'criteria': [
+        {'name': "Content", 'description': "Quality and relevance of ideas, arguments, and evidence", 'weight': 2.0},
+        {'name': "Organization", 'description': "Structure, flow, and logical progression of ideas", 'weight': 1.5},
+        {'name': "Grammar & Mechanics", 'description': "Spelling, punctuation, and sentence structure", 'weight': 1.0},
+        {'name': "Style & Clarity", 'description': "Writing clarity, word choice, and tone", 'weight': 1.0},
+        {'name': "Research & Citations", 'description': "Use of sources and proper citation format", 'weight': 1.5},
+    ]
+}
+
+_PRESENTATION_TEMPLATE = {
+    'name': "Presentation Rubric",
+    'description': "General rubric for oral presentations",
+    'criteria': [
+        {'name': "Content Knowledge", 'description': "Depth and accuracy of subject matter", 'weight': 2.0},
+        {'name': "Organization", 'description': "Clear structure with intro, body, and conclusion", 'weight': 1.5},
+        {'name': "Delivery", 'description': "Voice, pace, eye contact, and body language", 'weight': 1.5},
+        {'name': "Visual Aids", 'description': "Quality and effectiveness of slides/materials", 'weight': 1.0},
+        {'name': "Engagement", 'description': "Ability to engage audience and handle questions", 'weight': 1.0},
+    ]
+}
+
+
 def create_essay_rubric() -> Rubric:
     """Create a sample essay rubric template."""
-    criteria = [
-        RubricCriterion("Content", "Quality and relevance of ideas, arguments, and evidence", 2.0),
-        RubricCriterion("Organization", "Structure, flow, and logical progression of ideas", 1.5),
-        RubricCriterion("Grammar & Mechanics", "Spelling, punctuation, and sentence structure", 1.0),
-        RubricCriterion("Style & Clarity", "Writing clarity, word choice, and tone", 1.0),
-        RubricCriterion("Research & Citations", "Use of sources and proper citation format", 1.5),
-    ]
-    return Rubric(
-        name="Essay Rubric",
-        description="General rubric for essay assignments",
-        criteria=criteria
-    )
+    return Rubric.from_dict(_ESSAY_TEMPLATE)
 
 
 def create_presentation_rubric() -> Rubric:
     """Create a sample presentation rubric template."""
-    criteria = [
-        RubricCriterion("Content Knowledge", "Depth and accuracy of subject matter", 2.0),
-        RubricCriterion("Organization", "Clear structure with intro, body, and conclusion", 1.5),
-        RubricCriterion("Delivery", "Voice, pace, eye contact, and body language", 1.5),
-        RubricCriterion("Visual Aids", "Quality and effectiveness of slides/materials", 1.0),
-        RubricCriterion("Engagement", "Ability to engage audience and handle questions", 1.0),
-    ]
-    return Rubric(
-        name="Presentation Rubric",
-        description="General rubric for oral presentations",
-        criteria=criteria
-    )
+    return Rubric.from_dict(_PRESENTATION_TEMPLATE)
@@ -2,12 +2,18 @@
 Application settings management.
 Handles user preferences and configuration.
 """
-import json
+import sys
 from pathlib import Path
 from typing import Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields, replace
 from enum import Enum
 
+from core import jsonfile
+
+
+# __slots__ storage for the settings dataclasses (slots=True needs Python 3.10+)
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 
 class LLMProvider(Enum):
     """Available LLM providers."""
@@ -15,9 +21,10 @@ class LLMProvider(Enum):
     OPENAI = "openai"
     ANTHROPIC = "anthropic"
     OPENROUTER = "openrouter"
+    LLAMACPP = "llamacpp"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class LLMSettings:
     """Settings for LLM integration."""
     provider: str = LLMProvider.OLLAMA.value
@@ -29,16 +36,20 @@ class LLMSettings:
     anthropic_model: str = "claude-3-haiku-20240307"
     openrouter_api_key: str = ""
     openrouter_model: str = "qwen/qwen-2.5-7b-instruct:free"  # More reliable free model
+    llamacpp_base_url: str = "http://localhost:8080/v1"
+    llamacpp_model: str = "local"  # llama-server serves whichever model it was started with
+    llamacpp_slots: int = 4  # Must match llama-server -np
+    cache_responses: bool = True  # Keep organized feedback on disk to skip repeat LLM calls
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        return {name: getattr(self, name) for name in self._FIELDS}
 
     @classmethod
     def from_dict(cls, data: dict) -> 'LLMSettings':
-        return cls(**{k: v for k, v in data.items() if k in cls.__annotations__})
+        return cls(**{k: v for k, v in data.items() if k in cls._FIELD_NAMES})
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class FeedbackSettings:
     """Settings for feedback organization."""
     auto_organize: bool = False
@@ -50,28 +61,37 @@ class FeedbackSettings:
     instruction_prompt: str = ""  # Custom instruction prompt for structured feedback
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        return {name: getattr(self, name) for name in self._FIELDS}
 
     @classmethod
     def from_dict(cls, data: dict) -> 'FeedbackSettings':
-        return cls(**{k: v for k, v in data.items() if k in cls.__annotations__})
+        return cls(**{k: v for k, v in data.items() if k in cls._FIELD_NAMES})
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class UISettings:
     """Settings for UI preferences."""
     minimize_while_recording: bool = True
     show_transcript_by_default: bool = False
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        return {name: getattr(self, name) for name in self._FIELDS}
 
     @classmethod
     def from_dict(cls, data: dict) -> 'UISettings':
-        return cls(**{k: v for k, v in data.items() if k in cls.__annotations__})
+        return cls(**{k: v for k, v in data.items() if k in cls._FIELD_NAMES})
+
+
+# Field names of the flat settings sections, so to_dict can copy the values
+# directly (every field is an atom, so asdict's deep copy is unnecessary) and
+# from_dict can drop unknown keys with one set lookup each
+for _section in (LLMSettings, FeedbackSettings, UISettings):
+    _section._FIELDS = tuple(f.name for f in fields(_section))
+    _section._FIELD_NAMES = frozenset(_section._FIELDS)
+del _section
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class AppSettings:
     """Complete application settings."""
     llm: LLMSettings
@@ -93,6 +113,14 @@ class AppSettings:
             ui=UISettings.from_dict(data.get('ui', {}))
         )
 
+    def copy(self) -> 'AppSettings':
+        """Independent copy (every section field is an atom, so shallow section copies suffice)."""
+        return AppSettings(
+            llm=replace(self.llm),
+            feedback=replace(self.feedback),
+            ui=replace(self.ui)
+        )
+
     @classmethod
     def default(cls) -> 'AppSettings':
         """Create default settings."""
@@ -115,32 +143,59 @@ class SettingsManager:
         self.config_dir.mkdir(parents=True, exist_ok=True)
         self.config_file = self.config_dir / "settings.json"
 
+        # Last settings loaded or saved, so updates don't re-read the file
+        self._cached_settings: Optional[AppSettings] = None
+        self._cached_default_prompt: Optional[str] = None
+
+        # Bumped on every successful save, so holders of a settings snapshot
+        # can tell when it has gone stale
+        self.revision = 0
+
     def _load_default_instruction_prompt(self) -> str:
-        """Load default instruction prompt from InstructionPrompt.txt."""
+        """Load default instruction prompt from InstructionPrompt.txt (read once)."""
+        if self._cached_default_prompt is None:
+            self._cached_default_prompt = self._read_default_instruction_prompt()
+        return self._cached_default_prompt
+
+    @staticmethod
+    def _read_default_instruction_prompt() -> str:
+        """Read the default instruction prompt file."""
         try:
             # Look for InstructionPrompt.txt in project root
             prompt_file = Path(__file__).parent.parent / "InstructionPrompt.txt"
-            if prompt_file.exists():
-                with open(prompt_file, 'r', encoding='utf-8') as f:
-                    return f.read()
+            return prompt_file.read_text(encoding='utf-8')
+        except FileNotFoundError:
+            pass
         except Exception as e:
             print(f"Error loading default instruction prompt: {e}")
 
         return ""
 
     def load_settings(self) -> AppSettings:
-        """Load settings from disk, or return defaults if not found."""
+        """
+        Load settings from disk, or return defaults if not found.
+
+        The file is only read the first time; later calls return a copy of
+        the cached settings, which callers are free to modify.
+        """
+        if self._cached_settings is None:
+            self._cached_settings = self._read_settings()
+        return self._cached_settings.copy()
+
+    def _read_settings(self) -> AppSettings:
+        """Read settings from disk, or build defaults if not found."""
         try:
-            if self.config_file.exists():
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                settings = AppSettings.from_dict(data)
+            # One sized read of the whole file, parsed straight from bytes
+            data = jsonfile.loads(self.config_file.read_bytes())
+            settings = AppSettings.from_dict(data)
 
-                # Load default instruction prompt if not set
-                if not settings.feedback.instruction_prompt:
-                    settings.feedback.instruction_prompt = self._load_default_instruction_prompt()
+            # Load default instruction prompt if not set
+            if not settings.feedback.instruction_prompt:
+                settings.feedback.instruction_prompt = self._load_default_instruction_prompt()
 
-                return settings
+            return settings
+        except FileNotFoundError:
+            pass
         except Exception as e:
             print(f"Error loading settings: {e}")
 
@@ -151,8 +206,13 @@ class SettingsManager:
     def save_settings(self, settings: AppSettings) -> bool:
         """Save settings to disk."""
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(settings.to_dict(), f, indent=2, ensure_ascii=False)
+            jsonfile.write_atomic(self.config_file, jsonfile.dumps(settings.to_dict()))
+            # Cache what a fresh load of this file would return
+            cached = settings.copy()
+            if not cached.feedback.instruction_prompt:
+                cached.feedback.instruction_prompt = self._load_default_instruction_prompt()
+            self._cached_settings = cached
+            self.revision += 1
             return True
         except Exception as e:
             print(f"Error saving settings: {e}")
@@ -2,12 +2,18 @@
 Whisper transcription engine using faster-whisper.
 Handles model management, downloads, and transcription.
 """
+import io
 import os
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Callable, Iterator
+from typing import Optional, Callable, Iterator, Tuple
 from faster_whisper import WhisperModel
 
 
+# Zero-padded "00".."99" for timestamp formatting
+_TWO_DIGITS = [f"{i:02d}" for i in range(100)]
+
+
 class Transcriber:
     """Manages Whisper model and transcription operations."""
 
@@ -20,6 +26,23 @@ class Transcriber:
         "large": "~2.9 GB"
     }
 
+    # Transcriptions that can run in parallel on one loaded model; the record
+    # and upload tabs can each start one
+    NUM_WORKERS = 2
+
+    # CTranslate2 compute threads per worker, split so that both workers busy
+    # together don't oversubscribe the machine's logical cores
+    CPU_THREADS = max(1, (os.cpu_count() or 4) // NUM_WORKERS)
+
+    # Temperatures retried in order when a segment fails the quality checks
+    TEMPERATURES = (0.0, 0.2, 0.4)
+
+    # Segments between progress updates during transcribe()
+    PROGRESS_EVERY_SEGMENTS = 5
+
+    # Loaded models kept in memory, so switching back to a recent one is instant
+    MODEL_CACHE_SIZE = 2
+
     def __init__(self, model_dir: Optional[str] = None):
         """
         Initialize transcriber.
@@ -36,11 +59,16 @@ class Transcriber:
         os.makedirs(self.model_dir, exist_ok=True)
         self.model: Optional[WhisperModel] = None
         self.current_model_size: Optional[str] = None
+        self.current_compute_type: Optional[str] = None
+
+        # (model size, compute type) -> loaded model, least recently used first
+        self._model_cache: "OrderedDict[Tuple[str, str], WhisperModel]" = OrderedDict()
 
     def load_model(
         self,
         model_size: str = "base",
-        progress_callback: Optional[Callable[[str], None]] = None
+        progress_callback: Optional[Callable[[str], None]] = None,
+        compute_type: str = "int8"
     ) -> None:
         """
         Load or download a Whisper model.
@@ -48,30 +76,48 @@ class Transcriber:
         Args:
             model_size: One of "tiny", "base", "small", "medium", "large"
             progress_callback: Optional callback for progress updates
+            compute_type: CTranslate2 weight type; "int8" is fastest on CPUs
+                (and uses VNNI instructions where available), "float32" is exact
         """
         if model_size not in self.MODEL_SIZES:
             raise ValueError(f"Invalid model size. Choose from: {list(self.MODEL_SIZES.keys())}")
 
         # Don't reload if already loaded
-        if self.model and self.current_model_size == model_size:
+        if (self.model and self.current_model_size == model_size
+                and self.current_compute_type == compute_type):
             if progress_callback:
                 progress_callback(f"Model '{model_size}' already loaded")
             return
 
+        key = (model_size, compute_type)
+        if key in self._model_cache:
+            self._model_cache.move_to_end(key)
+            self.model = self._model_cache[key]
+            self.current_model_size = model_size
+            self.current_compute_type = compute_type
+            if progress_callback:
+                progress_callback(f"Model '{model_size}' loaded successfully")
+            return
+
         if progress_callback:
             progress_callback(f"Loading model '{model_size}'...")
 
         try:
             # faster-whisper downloads to cache automatically
             # device="cpu" for CPU-only processing
-            # compute_type="int8" for better CPU performance
             self.model = WhisperModel(
                 model_size,
                 device="cpu",
-                compute_type="int8",
+                compute_type=compute_type,
+                cpu_threads=self.CPU_THREADS,
+                num_workers=self.NUM_WORKERS,
                 download_root=self.model_dir
             )
+            self._model_cache[key] = self.model
+            while len(self._model_cache) > self.MODEL_CACHE_SIZE:
+                self._model_cache.popitem(last=False)
             self.current_model_size = model_size
+            self.current_compute_type = compute_type
 
             if progress_callback:
                 progress_callback(f"Model '{model_size}' loaded successfully")
@@ -85,7 +131,8 @@ class Transcriber:
         self,
         audio_path: str,
         include_timestamps: bool = False,
-        progress_callback: Optional[Callable[[str], None]] = None
+        progress_callback: Optional[Callable[[str], None]] = None,
+        beam_size: int = 1
     ) -> str:
         """
         Transcribe an audio file.
@@ -94,6 +141,8 @@ class Transcriber:
             audio_path: Path to audio file
             include_timestamps: Whether to include timestamps in output
             progress_callback: Optional callback for progress updates
+            beam_size: Decoder beam width; 1 (greedy) is several times faster
+                than 5 for a small accuracy cost
 
         Returns:
             Transcribed text
@@ -108,26 +157,23 @@ class Transcriber:
             progress_callback("Transcribing audio...")
 
         try:
-            # Transcribe with English language
-            segments, info = self.model.transcribe(
-                audio_path,
-                language="en",
-                beam_size=5,
-                vad_filter=True,  # Voice activity detection
-            )
+            segments = self._segments(audio_path, beam_size)
 
-            # Build transcript
-            transcript_parts = []
+            # Build transcript as segments are decoded
+            transcript_buffer = io.StringIO()
 
-            for segment in segments:
+            for index, segment in enumerate(segments, 1):
+                if index > 1:
+                    transcript_buffer.write("\n")
                 if include_timestamps:
                     # Format: [HH:MM:SS] text
-                    start_time = self._format_timestamp(segment.start)
-                    transcript_parts.append(f"[{start_time}] {segment.text.strip()}")
-                else:
-                    transcript_parts.append(segment.text.strip())
+                    transcript_buffer.write(f"[{self._format_timestamp(segment.start)}] ")
+                transcript_buffer.write(segment.text.strip())
+
+                if progress_callback and index % self.PROGRESS_EVERY_SEGMENTS == 0:
+                    progress_callback(f"Transcribing audio... {self._format_timestamp(segment.end)} done")
 
-            transcript = "\n".join(transcript_parts)
+            transcript = transcript_buffer.getvalue()
 
             if progress_callback:
                 progress_callback("Transcription complete!")
@@ -142,7 +188,8 @@ class Transcriber:
     def transcribe_streaming(
         self,
         audio_path: str,
-        include_timestamps: bool = False
+        include_timestamps: bool = False,
+        beam_size: int = 1
     ) -> Iterator[str]:
         """
         Transcribe audio with streaming results (yields segments as they complete).
@@ -150,6 +197,7 @@ class Transcriber:
         Args:
             audio_path: Path to audio file
             include_timestamps: Whether to include timestamps
+            beam_size: Decoder beam width
 
         Yields:
             Transcribed text segments
@@ -157,27 +205,36 @@ class Transcriber:
         if self.model is None:
             raise RuntimeError("No model loaded. Call load_model() first.")
 
-        segments, info = self.model.transcribe(
-            audio_path,
-            language="en",
-            beam_size=5,
-            vad_filter=True,
-        )
-
-        for segment in segments:
+        for segment in self._segments(audio_path, beam_size):
             if include_timestamps:
                 start_time = self._format_timestamp(segment.start)
                 yield f"[{start_time}] {segment.text.strip()}\n"
             else:
                 yield f"{segment.text.strip()}\n"
 
+    def _segments(self, audio_path: str, beam_size: int):
+        """Start decoding an audio file; segments are produced lazily as they are iterated."""
+        segments, info = self.model.transcribe(
+            audio_path,
+            language="en",
+            beam_size=beam_size,
+            temperature=list(self.TEMPERATURES),
+            # Decode each window independently so one misheard phrase can't
+            # cascade into repetition loops
+            condition_on_previous_text=False,
+            no_speech_threshold=0.6,
+            compression_ratio_threshold=2.4,
+            vad_filter=True,  # Voice activity detection
+        )
+        return segments
+
     @staticmethod
     def _format_timestamp(seconds: float) -> str:
         """Format seconds as HH:MM:SS."""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+        minutes, secs = divmod(int(seconds), 60)
+        hours, minutes = divmod(minutes, 60)
+        hours_text = _TWO_DIGITS[hours] if hours < 100 else str(hours)
+        return f"{hours_text}:{_TWO_DIGITS[minutes]}:{_TWO_DIGITS[secs]}"
 
     def get_available_models(self) -> dict[str, str]:
         """Get dictionary of available models with their sizes."""
@@ -2,15 +2,127 @@
 Automated FFmpeg installer for Transcribair.
 Downloads and installs FFmpeg automatically on Windows.
 """
+import hashlib
+import json
 import os
 import sys
 import zipfile
+import http.client
+import io
 import shutil
+import tempfile
+import time
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import platform
 
 
+class _DownloadRestart(IOError):
+    """The download dropped and can't be resumed; it must start again from byte 0."""
+
+
+class _Download:
+    """
+    File-like view of an HTTP download that prints a progress bar as it is read.
+
+    If the connection drops part way through, the download is reopened with
+    a Range request and continues from the last byte received. The request
+    carries If-Range, so if the file changed on the server in the meantime
+    (the URLs point at rolling "latest" builds) _DownloadRestart is raised
+    instead of splicing two different files together.
+    """
+
+    # Minimum seconds between progress bar redraws
+    PROGRESS_INTERVAL = 0.05
+
+    # Width of the progress bar in characters
+    BAR_LENGTH = 40
+
+    # Reconnection attempts before giving up
+    MAX_RETRIES = 3
+
+    def __init__(self, url: str):
+        self.url = url
+        self.response = urllib.request.urlopen(url)
+        self.total_size = int(self.response.headers.get('Content-Length') or 0)
+        self.etag = self.response.headers.get('ETag')
+        # If-Range needs a strong validator; weak ETags never match
+        if self.etag and not self.etag.startswith('W/'):
+            self.validator = self.etag
+        else:
+            self.validator = self.response.headers.get('Last-Modified')
+        self.downloaded = 0
+        self.retries = 0
+        self._last_report_time = 0.0
+        self._last_line = ''
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.response.close()
+
+    def read(self, size: int = -1) -> bytes:
+        while True:
+            try:
+                data = self.response.read(size)
+            except (OSError, http.client.HTTPException):
+                if self.retries >= self.MAX_RETRIES:
+                    raise
+            else:
+                if data or not self.total_size or self.downloaded >= self.total_size:
+                    break
+                # Server closed the connection before sending everything
+                if self.retries >= self.MAX_RETRIES:
+                    raise IOError("Download interrupted")
+            self.retries += 1
+            self._resume()
+
+        self.downloaded += len(data)
+        now = time.monotonic()
+        finished = not data or self.downloaded >= self.total_size
+        if finished or now - self._last_report_time >= self.PROGRESS_INTERVAL:
+            self._last_report_time = now
+            self._print_progress()
+        return data
+
+    def _resume(self):
+        """Reopen the download from the first byte not yet received."""
+        self.response.close()
+        if not self.validator:
+            raise _DownloadRestart("Download interrupted and the server gave no way to resume it safely")
+
+        request = urllib.request.Request(self.url, headers={
+            'Range': f'bytes={self.downloaded}-',
+            'If-Range': self.validator
+        })
+        response = urllib.request.urlopen(request)
+        content_range = response.headers.get('Content-Range') or ''
+        if getattr(response, 'status', None) != 206 or not content_range.startswith(f'bytes {self.downloaded}-'):
+            # The file changed since the first request (or Range isn't supported)
+            response.close()
+            raise _DownloadRestart("The file changed on the server while downloading")
+        self.response = response
+
+    def _print_progress(self):
+        if self.total_size > 0:
+            percent = min(self.downloaded * 100 / self.total_size, 100)
+            filled = int(self.BAR_LENGTH * percent / 100)
+            bar = '=' * filled + '-' * (self.BAR_LENGTH - filled)
+            mb_downloaded = self.downloaded / (1024 * 1024)
+            mb_total = self.total_size / (1024 * 1024)
+            line = f'\r[{bar}] {percent:.1f}% ({mb_downloaded:.1f}/{mb_total:.1f} MB)'
+            # Only touch the terminal when the displayed text actually changes
+            if line != self._last_line:
+                self._last_line = line
+                sys.stdout.write(line)
+                sys.stdout.flush()
+
+
 class FFmpegInstaller:
     """Handles FFmpeg installation across platforms."""
 
@@ -21,6 +133,20 @@ class FFmpegInstaller:
         'Darwin': 'https://evermeet.cx/ffmpeg/getrelease/ffmpeg/zip'  # macOS
     }
 
+    # Executables taken from each platform's build
+    BINARIES = {
+        'Windows': {'ffmpeg.exe', 'ffprobe.exe', 'ffplay.exe'},
+        'Linux': {'ffmpeg', 'ffprobe'},
+        'Darwin': {'ffmpeg'}
+    }
+
+    # Records the size, mtime and SHA-256 of each installed binary
+    MANIFEST_NAME = ".manifest.json"
+
+    # ZIP archives need random access, so they are held in memory; archives
+    # larger than this (or of unknown size) go to a temporary file on disk
+    SPOOL_MAX_BYTES = 64 * 1024 * 1024
+
     def __init__(self, auto_install=False):
         self.system = platform.system()
         self.install_dir = Path.home() / ".transcribair" / "ffmpeg"
@@ -37,6 +163,9 @@ class FFmpegInstaller:
         # Check in our install directory
         ffmpeg_exe = self.install_dir / ("ffmpeg.exe" if self.system == "Windows" else "ffmpeg")
         if ffmpeg_exe.exists():
+            if not self._manifest_matches():
+                print(f"[WARNING] FFmpeg in {self.install_dir} appears damaged")
+                return False
             print(f"[OK] FFmpeg found in {self.install_dir}")
             self._add_to_path()
             return True
@@ -59,21 +188,23 @@ class FFmpegInstaller:
 
         try:
             url = self.FFMPEG_URLS[self.system]
-            download_path = self.install_dir / "ffmpeg_download.zip"
 
-            # Download
+            # Download and extract in one pass; the archive is never saved as-is
             print(f"Downloading FFmpeg from {url[:50]}...")
-            self._download_with_progress(url, download_path)
-
-            # Extract
-            print("\nExtracting FFmpeg...")
-            self._extract_ffmpeg(download_path)
-
-            # Cleanup
-            download_path.unlink()
+            for attempt in range(_Download.MAX_RETRIES + 1):
+                try:
+                    with _Download(url) as download:
+                        self._extract_ffmpeg(download)
+                    break
+                except _DownloadRestart as e:
+                    if attempt == _Download.MAX_RETRIES:
+                        raise
+                    print(f"\n  {e}; starting again from the beginning")
+            print()  # New line after progress bar
 
             # Verify
             if self._verify_installation():
+                self._write_manifest(url, download)
                 print("\n[OK] FFmpeg installed successfully!")
                 self._add_to_path()
                 return True
@@ -85,79 +216,159 @@ class FFmpegInstaller:
             print(f"\n[ERROR] Installation failed: {str(e)}")
             return False
 
-    def _download_with_progress(self, url: str, output_path: Path):
-        """Download file with progress bar."""
-        def progress_hook(block_num, block_size, total_size):
-            downloaded = block_num * block_size
-            if total_size > 0:
-                percent = min(downloaded * 100 / total_size, 100)
-                bar_length = 40
-                filled = int(bar_length * percent / 100)
-                bar = '=' * filled + '-' * (bar_length - filled)
-                mb_downloaded = downloaded / (1024 * 1024)
-                mb_total = total_size / (1024 * 1024)
-                print(f'\r[{bar}] {percent:.1f}% ({mb_downloaded:.1f}/{mb_total:.1f} MB)', end='')
-
-        urllib.request.urlretrieve(url, output_path, progress_hook)
-        print()  # New line after progress bar
-
-    def _extract_ffmpeg(self, archive_path: Path):
-        """Extract FFmpeg from downloaded archive."""
-        if self.system == "Windows":
-            with zipfile.ZipFile(archive_path, 'r') as zip_ref:
-                # Extract all files
-                temp_extract = self.install_dir / "temp"
-                zip_ref.extractall(temp_extract)
-
-                # Find and move ffmpeg executables
-                for root, dirs, files in os.walk(temp_extract):
-                    for file in files:
-                        if file in ['ffmpeg.exe', 'ffprobe.exe', 'ffplay.exe']:
-                            src = Path(root) / file
-                            dst = self.install_dir / file
-                            shutil.move(str(src), str(dst))
-                            print(f"  Extracted: {file}")
-
-                # Cleanup temp directory
-                shutil.rmtree(temp_extract)
-
-        elif self.system == "Linux":
+    def _extract_ffmpeg(self, stream):
+        """Extract FFmpeg from the archive being downloaded."""
+        if self.system == "Linux":
             import tarfile
-            with tarfile.open(archive_path, 'r:xz') as tar_ref:
-                temp_extract = self.install_dir / "temp"
-                tar_ref.extractall(temp_extract)
-
-                # Find and move ffmpeg executables
-                for root, dirs, files in os.walk(temp_extract):
-                    for file in files:
-                        if file in ['ffmpeg', 'ffprobe']:
-                            src = Path(root) / file
-                            dst = self.install_dir / file
-                            shutil.move(str(src), str(dst))
-                            # Make executable
-                            os.chmod(dst, 0o755)
-                            print(f"  Extracted: {file}")
-
-                shutil.rmtree(temp_extract)
-
-        elif self.system == "Darwin":  # macOS
-            with zipfile.ZipFile(archive_path, 'r') as zip_ref:
-                zip_ref.extractall(self.install_dir)
+            wanted = set(self.BINARIES[self.system])
+            # Streaming mode reads the archive front to back without seeking,
+            # so members are unpacked while the rest is still downloading
+            with tarfile.open(fileobj=stream, mode='r|xz', bufsize=1024 * 1024) as tar_ref:
+                for member in tar_ref:
+                    name = os.path.basename(member.name)
+                    if name not in wanted or not member.isfile():
+                        continue
+
+                    with tar_ref.extractfile(member) as src:
+                        self._write_binary(src, name)
+                    print(f"\n  Extracted: {name}")
+
+                    wanted.discard(name)
+                    if not wanted:
+                        # Nothing else in the archive is needed; stop downloading
+                        break
+            return
+
+        # SpooledTemporaryFile isn't seekable() before Python 3.11, which zipfile
+        # needs, so choose memory or a real temporary file up front
+        if 0 < stream.total_size <= self.SPOOL_MAX_BYTES:
+            archive = io.BytesIO()
+        else:
+            archive = tempfile.TemporaryFile()
+        with archive:
+            shutil.copyfileobj(stream, archive, 1024 * 1024)
+            archive.seek(0)
+            print("\nExtracting FFmpeg...")
+            self._extract_zip(archive)
+
+    def _extract_zip(self, archive):
+        """Extract FFmpeg from a downloaded ZIP archive (Windows and macOS builds)."""
+        wanted = self.BINARIES[self.system]
+        with zipfile.ZipFile(archive, 'r') as zip_ref:
+            # Only the executables are unpacked; docs and presets are skipped
+            members = list({
+                os.path.basename(name): name for name in zip_ref.namelist()
+                if os.path.basename(name) in wanted
+            }.values())
+
+            # Members decompress independently: ZipFile serializes the raw
+            # reads and zlib releases the GIL while inflating
+            with ThreadPoolExecutor(max_workers=max(1, min(4, len(members)))) as executor:
+                for name in executor.map(lambda member: self._extract_member(zip_ref, member), members):
+                    print(f"  Extracted: {name}")
+
+    def _extract_member(self, zip_ref: zipfile.ZipFile, member: str) -> str:
+        """Write one archive member into install_dir, dropping its folder prefix."""
+        name = os.path.basename(member)
+        with zip_ref.open(member) as src:
+            self._write_binary(src, name)
+        return name
+
+    def _write_binary(self, src, name: str):
+        """
+        Stream an executable from the archive to its final path in install_dir.
+
+        The data goes to a .part file that is renamed into place once complete,
+        so an interrupted install never leaves a truncated binary behind.
+        """
+        dst = self.install_dir / name
+        part = self.install_dir / (name + ".part")
+        try:
+            with open(part, 'wb') as out:
+                shutil.copyfileobj(src, out, 1024 * 1024)
+            if self.system != "Windows":
                 # Make executable
-                ffmpeg_path = self.install_dir / "ffmpeg"
-                os.chmod(ffmpeg_path, 0o755)
-                print("  Extracted: ffmpeg")
+                os.chmod(part, 0o755)
+            os.replace(part, dst)
+        except BaseException:
+            try:
+                os.remove(part)
+            except OSError:
+                pass
+            raise
 
     def _verify_installation(self) -> bool:
         """Verify FFmpeg was installed correctly."""
         ffmpeg_exe = self.install_dir / ("ffmpeg.exe" if self.system == "Windows" else "ffmpeg")
         return ffmpeg_exe.exists()
 
+    @staticmethod
+    def _file_sha256(path: Path) -> str:
+        """SHA-256 of a file, read in large chunks."""
+        with open(path, 'rb') as f:
+            if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+                return hashlib.file_digest(f, 'sha256').hexdigest()
+            digest = hashlib.sha256()
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+            return digest.hexdigest()
+
+    def _write_manifest(self, url: str, download: "_Download"):
+        """Record what was installed, so later runs can spot damaged binaries."""
+        files = {}
+        for name in self.BINARIES[self.system]:
+            path = self.install_dir / name
+            if path.exists():
+                stat = path.stat()
+                files[name] = {
+                    'size': stat.st_size,
+                    'mtime_ns': stat.st_mtime_ns,
+                    'sha256': self._file_sha256(path)
+                }
+
+        manifest = {
+            'url': url,
+            'etag': download.etag,
+            'size': download.total_size,
+            'files': files
+        }
+        try:
+            (self.install_dir / self.MANIFEST_NAME).write_text(json.dumps(manifest, indent=2), encoding='utf-8')
+        except OSError as e:
+            print(f"  Could not write install manifest: {e}")
+
+    def _manifest_matches(self) -> bool:
+        """
+        Check the installed binaries against the manifest.
+
+        Unchanged size and mtime are trusted as-is; a binary is only hashed if
+        its mtime has changed. Installs without a (readable) manifest are
+        trusted, as before.
+        """
+        try:
+            manifest = json.loads((self.install_dir / self.MANIFEST_NAME).read_text(encoding='utf-8'))
+            files = manifest['files']
+        except (OSError, ValueError, KeyError, TypeError):
+            return True
+
+        for name, expected in files.items():
+            path = self.install_dir / name
+            try:
+                stat = path.stat()
+            except OSError:
+                return False
+            if stat.st_size != expected['size']:
+                return False
+            if stat.st_mtime_ns != expected['mtime_ns'] and self._file_sha256(path) != expected['sha256']:
+                return False
+        return True
+
     def _add_to_path(self):
         """Add FFmpeg directory to PATH for current session."""
         ffmpeg_dir = str(self.install_dir)
-        if ffmpeg_dir not in os.environ.get("PATH", ""):
-            os.environ["PATH"] = ffmpeg_dir + os.pathsep + os.environ.get("PATH", "")
+        current = os.environ.get("PATH", "")
+        if ffmpeg_dir not in current.split(os.pathsep):
+            os.environ["PATH"] = ffmpeg_dir + os.pathsep + current
             print(f"  Added {ffmpeg_dir} to PATH for this session")
 
     def get_ffmpeg_path(self) -> str:
@@ -1,9 +1,12 @@
 """
 Automatic openpyxl installer for Excel import functionality.
 """
+import importlib
+import importlib.util
 import subprocess
 import sys
 from pathlib import Path
+from typing import Optional
 
 
 class OpenpyxlInstaller:
@@ -12,14 +15,13 @@ class OpenpyxlInstaller:
     def __init__(self):
         self.package_name = "openpyxl"
         self.min_version = "3.0.0"
+        self._installed: Optional[bool] = None
 
     def is_installed(self) -> bool:
-        """Check if openpyxl is already installed."""
-        try:
-            import openpyxl
-            return True
-        except ImportError:
-            return False
+        """Check if openpyxl is already installed (without importing it)."""
+        if self._installed is None:
+            self._installed = importlib.util.find_spec(self.package_name) is not None
+        return self._installed
 
     def install(self) -> bool:
         """
@@ -47,6 +49,9 @@ class OpenpyxlInstaller:
             )
 
             if result.returncode == 0:
+                # Make the new package visible to this process's import finders
+                importlib.invalidate_caches()
+                self._installed = None
                 print(f"Successfully installed {self.package_name}")
                 return True
             else:
@@ -6,12 +6,30 @@ This module provides a minimal compatibility layer.
 import sys
 
 if sys.version_info >= (3, 13):
-    # Install stub audioop module for Python 3.13+
-    try:
-        import audioop
-    except ModuleNotFoundError:
-        # Create a minimal audioop stub
-        # pydub will fall back to ffmpeg for operations
-        import types
-        audioop = types.ModuleType('audioop')
-        sys.modules['audioop'] = audioop
+    import importlib.machinery
+
+    class _AudioopStubFinder:
+        """
+        Import hook that supplies an empty audioop module on demand.
+
+        It sits at the end of sys.meta_path, so a real audioop (such as the
+        audioop-lts backport) still wins, and nothing is looked up or created
+        at startup unless something actually imports audioop. pydub will
+        fall back to ffmpeg for operations.
+        """
+
+        @classmethod
+        def find_spec(cls, fullname, path=None, target=None):
+            if fullname != 'audioop':
+                return None
+            return importlib.machinery.ModuleSpec(fullname, cls)
+
+        @staticmethod
+        def create_module(spec):
+            return None  # Default module creation
+
+        @staticmethod
+        def exec_module(module):
+            pass  # Minimal audioop stub
+
+    sys.meta_path.append(_AudioopStubFinder)
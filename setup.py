@@ -178,13 +178,30 @@ def main():
     ]
 
     print("Testing imports...")
+    # Import everything in one interpreter rather than starting one per module
+    import_check = (
+        "import importlib\n"
+        f"for module in {test_imports!r}:\n"
+        "    try:\n"
+        "        importlib.import_module(module)\n"
+        "        print('OK', module, flush=True)\n"
+        "    except Exception:\n"
+        "        print('FAIL', module, flush=True)\n"
+    )
+    result = subprocess.run(
+        [str(venv_python), "-c", import_check],
+        capture_output=True,
+        text=True
+    )
+    imported = {
+        line.split()[1] for line in result.stdout.splitlines()
+        if line.startswith("OK ")
+    }
+
     all_ok = True
     for module in test_imports:
-        result = subprocess.run(
-            [str(venv_python), "-c", f"import {module}"],
-            capture_output=True
-        )
-        if result.returncode == 0:
+        # A module missing from the output (e.g. the interpreter crashed) counts as failed
+        if module in imported:
             print(f"  ✓ {module}")
         else:
             print(f"  ✗ {module} - FAILED")
@@ -5,12 +5,23 @@ Shows parsed rubric data before final import.
 import customtkinter as ctk
 from typing import Optional, Callable
 from core.excel_import import ParsedRubricData
-from core.rubric import Rubric
+from core.rubric import Rubric, RubricCriterion
 
 
 class ExcelPreviewDialog(ctk.CTkToplevel):
     """Dialog to preview and confirm Excel rubric import."""
 
+    # Criterion previews built at a time; more are added as the list is scrolled
+    CRITERIA_BATCH = 10
+
+    # Scroll position (fraction of the list) past which the next batch is built
+    RENDER_AHEAD = 0.9
+
+    # Approximate line height (px) and characters per wrapped line in a
+    # criterion's performance-level textbox, used to size it to its text
+    LEVEL_LINE_HEIGHT = 17
+    LEVEL_WRAP_CHARS = 110
+
     def __init__(self, parent, parsed_data: ParsedRubricData, on_confirm: Optional[Callable[[Rubric], None]] = None):
         super().__init__(parent)
 
@@ -18,6 +29,10 @@ class ExcelPreviewDialog(ctk.CTkToplevel):
         self.on_confirm_callback = on_confirm
         self.confirmed = False
 
+        # Criterion previews built so far, and whether another batch is scheduled
+        self._rendered_count = 0
+        self._render_pending = False
+
         # Window setup
         self.title("Preview Excel Import")
         self.geometry("800x700")
@@ -28,6 +43,13 @@ class ExcelPreviewDialog(ctk.CTkToplevel):
 
     def _create_ui(self):
         """Create preview dialog UI."""
+        # Fonts shared by all labels of a kind, rather than one Tk font per label
+        label_font = ctk.CTkFont(weight="bold")
+        self._font_criterion = ctk.CTkFont(size=13, weight="bold")
+        self._font_detail = ctk.CTkFont(size=11)
+        self._font_level = ctk.CTkFont(size=11, weight="bold")
+        self._font_level_desc = ctk.CTkFont(size=10)
+
         # Main container
         container = ctk.CTkFrame(self)
         container.pack(fill="both", expand=True, padx=10, pady=10)
@@ -47,7 +69,7 @@ class ExcelPreviewDialog(ctk.CTkToplevel):
         # Rubric name (editable)
         name_row = ctk.CTkFrame(metadata_frame)
         name_row.pack(fill="x", padx=10, pady=5)
-        ctk.CTkLabel(name_row, text="Rubric Name:", font=ctk.CTkFont(weight="bold"), width=120, anchor="w").pack(side="left")
+        ctk.CTkLabel(name_row, text="Rubric Name:", font=label_font, width=120, anchor="w").pack(side="left")
         self.name_entry = ctk.CTkEntry(name_row, width=400)
         self.name_entry.pack(side="left", padx=5)
         self.name_entry.insert(0, self.parsed_data.rubric_name)
@@ -55,7 +77,7 @@ class ExcelPreviewDialog(ctk.CTkToplevel):
         # Rubric description (editable)
         desc_row = ctk.CTkFrame(metadata_frame)
         desc_row.pack(fill="x", padx=10, pady=5)
-        ctk.CTkLabel(desc_row, text="Description:", font=ctk.CTkFont(weight="bold"), width=120, anchor="w").pack(side="left")
+        ctk.CTkLabel(desc_row, text="Description:", font=label_font, width=120, anchor="w").pack(side="left")
         self.desc_entry = ctk.CTkEntry(desc_row, width=400)
         self.desc_entry.pack(side="left", padx=5)
         self.desc_entry.insert(0, self.parsed_data.rubric_description)
@@ -63,7 +85,7 @@ class ExcelPreviewDialog(ctk.CTkToplevel):
         # Rubric type
         type_row = ctk.CTkFrame(metadata_frame)
         type_row.pack(fill="x", padx=10, pady=5)
-        ctk.CTkLabel(type_row, text="Rubric Type:", font=ctk.CTkFont(weight="bold"), width=120, anchor="w").pack(side="left")
+        ctk.CTkLabel(type_row, text="Rubric Type:", font=label_font, width=120, anchor="w").pack(side="left")
         type_text = "Analytic (with performance levels)" if self.parsed_data.is_analytic else "Simple"
         ctk.CTkLabel(type_row, text=type_text, anchor="w").pack(side="left", padx=5)
 
@@ -71,14 +93,14 @@ class ExcelPreviewDialog(ctk.CTkToplevel):
         if self.parsed_data.is_analytic:
             levels_row = ctk.CTkFrame(metadata_frame)
             levels_row.pack(fill="x", padx=10, pady=5)
-            ctk.CTkLabel(levels_row, text="Performance Levels:", font=ctk.CTkFont(weight="bold"), width=120, anchor="w").pack(side="left")
+            ctk.CTkLabel(levels_row, text="Performance Levels:", font=label_font, width=120, anchor="w").pack(side="left")
             levels_text = ", ".join(self.parsed_data.performance_level_names)
             ctk.CTkLabel(levels_row, text=levels_text, anchor="w", wraplength=500).pack(side="left", padx=5)
 
         # Criteria count
         count_row = ctk.CTkFrame(metadata_frame)
         count_row.pack(fill="x", padx=10, pady=5)
-        ctk.CTkLabel(count_row, text="Criteria Count:", font=ctk.CTkFont(weight="bold"), width=120, anchor="w").pack(side="left")
+        ctk.CTkLabel(count_row, text="Criteria Count:", font=label_font, width=120, anchor="w").pack(side="left")
         ctk.CTkLabel(count_row, text=str(len(self.parsed_data.criteria_data)), anchor="w").pack(side="left", padx=5)
 
         # Criteria details section
@@ -93,9 +115,18 @@ class ExcelPreviewDialog(ctk.CTkToplevel):
         criteria_scroll = ctk.CTkScrollableFrame(container, height=350)
         criteria_scroll.pack(fill="both", expand=True, pady=5)
 
-        # Display each criterion
-        for idx, criterion in enumerate(self.parsed_data.criteria_data, 1):
-            self._create_criterion_preview(criteria_scroll, idx, criterion)
+        # Criteria are previewed in batches as the list is scrolled, so a large
+        # rubric doesn't build thousands of widgets before the dialog appears
+        self.criteria_scroll = criteria_scroll
+        scrollbar_set = criteria_scroll._scrollbar.set
+
+        def on_scroll(first, last):
+            scrollbar_set(first, last)
+            if float(last) >= self.RENDER_AHEAD:
+                self._schedule_render()
+
+        criteria_scroll._parent_canvas.configure(yscrollcommand=on_scroll)
+        self._render_more_criteria()
 
         # Button frame
         button_frame = ctk.CTkFrame(container)
@@ -117,84 +148,101 @@ class ExcelPreviewDialog(ctk.CTkToplevel):
             fg_color="gray"
         ).pack(side="right", padx=5)
 
-    def _create_criterion_preview(self, parent, index: int, criterion_data: dict):
+    def _schedule_render(self):
+        """Build the next batch of criterion previews once Tk is idle."""
+        if self._render_pending or self._rendered_count >= len(self.parsed_data.criteria_data):
+            return
+        self._render_pending = True
+        self.after_idle(self._render_more_criteria)
+
+    def _render_more_criteria(self):
+        """Build the next batch of criterion previews."""
+        self._render_pending = False
+        criteria = self.parsed_data.criteria_data
+        start = self._rendered_count
+        end = min(start + self.CRITERIA_BATCH, len(criteria))
+        for idx in range(start, end):
+            self._create_criterion_preview(self.criteria_scroll, idx + 1, criteria[idx])
+        self._rendered_count = end
+        # The list grows, so the scroll position is reported again; if the view
+        # still reaches the end, on_scroll asks for another batch
+
+    def _create_criterion_preview(self, parent, index: int, criterion: RubricCriterion):
         """Create a preview widget for a single criterion."""
-        # Criterion container
+        # Criterion container, laid out as a grid: name and weight on the
+        # first row, content spanning the second
         crit_frame = ctk.CTkFrame(parent, fg_color=("gray90", "gray20"))
-        crit_frame.pack(fill="x", pady=5, padx=5)
-
-        # Header row
-        header_frame = ctk.CTkFrame(crit_frame, fg_color="transparent")
-        header_frame.pack(fill="x", padx=10, pady=5)
+        crit_frame.grid_columnconfigure(0, weight=1)
 
         # Criterion number and name
-        name_text = f"{index}. {criterion_data['name']}"
+        name_text = f"{index}. {criterion.name}"
         ctk.CTkLabel(
-            header_frame,
+            crit_frame,
             text=name_text,
-            font=ctk.CTkFont(weight="bold", size=13),
+            font=self._font_criterion,
             anchor="w"
-        ).pack(side="left")
+        ).grid(row=0, column=0, sticky="w", padx=(10, 0), pady=5)
 
         # Weight
-        weight_pct = criterion_data['weight'] * 100
+        weight_pct = criterion.weight * 100
         weight_text = f"Weight: {weight_pct:.0f}%"
         ctk.CTkLabel(
-            header_frame,
+            crit_frame,
             text=weight_text,
-            font=ctk.CTkFont(size=11),
+            font=self._font_detail,
             anchor="e"
-        ).pack(side="right", padx=5)
-
-        # Content
-        content_frame = ctk.CTkFrame(crit_frame, fg_color="transparent")
-        content_frame.pack(fill="x", padx=10, pady=(0, 5))
-
-        if self.parsed_data.is_analytic and criterion_data['performance_levels']:
-            # Show performance levels in a compact format
-            for pl in criterion_data['performance_levels']:
-                pl_frame = ctk.CTkFrame(content_frame, fg_color="transparent")
-                pl_frame.pack(fill="x", pady=2)
-
+        ).grid(row=0, column=1, sticky="e", padx=(0, 15), pady=5)
+
+        if self.parsed_data.is_analytic and criterion.performance_levels:
+            # Show performance levels in a compact format, all in one read-only
+            # textbox rather than a frame and two labels per level
+            levels_box = ctk.CTkTextbox(
+                crit_frame,
+                font=self._font_level_desc,
+                wrap="word",
+                fg_color="transparent",
+                activate_scrollbars=False
+            )
+            # CTkTextbox.tag_config refuses fonts, so the level font goes on the inner Text
+            levels_box._textbox.tag_config("level", font=self._font_level)
+            levels_box.tag_config("description", foreground="gray")
+
+            line_count = 0
+            for i, pl in enumerate(criterion.performance_levels):
                 # Level name and range
-                level_header = f"  • {pl['name']}"
-                if pl['score_range']:
-                    level_header += f" ({pl['score_range']})"
+                level_header = f"  • {pl.name}"
+                if pl.score_range:
+                    level_header += f" ({pl.score_range})"
                 level_header += ":"
 
-                ctk.CTkLabel(
-                    pl_frame,
-                    text=level_header,
-                    font=ctk.CTkFont(size=11, weight="bold"),
-                    anchor="w"
-                ).pack(anchor="w")
+                # Description (wrapped in full by the textbox)
+                desc_text = pl.description
 
-                # Description
-                desc_text = pl['description']
-                if len(desc_text) > 100:
-                    desc_text = desc_text[:97] + "..."
+                if i:
+                    levels_box.insert("end", "\n")
+                levels_box.insert("end", level_header + "\n", "level")
+                levels_box.insert("end", f"      {desc_text}", "description")
+                # Header line plus the description's wrapped lines
+                line_count += 2 + len(desc_text) // self.LEVEL_WRAP_CHARS
 
-                ctk.CTkLabel(
-                    pl_frame,
-                    text=f"    {desc_text}",
-                    font=ctk.CTkFont(size=10),
-                    anchor="w",
-                    wraplength=700,
-                    text_color="gray"
-                ).pack(anchor="w", padx=(10, 0))
+            levels_box.configure(height=line_count * self.LEVEL_LINE_HEIGHT + 8, state="disabled")
+            levels_box.grid(row=1, column=0, columnspan=2, sticky="ew", padx=10, pady=(2, 7))
         else:
             # Simple description
-            desc_text = criterion_data['description']
+            desc_text = criterion.description
             if desc_text:
-                if len(desc_text) > 150:
-                    desc_text = desc_text[:147] + "..."
+                # Shown in full; the label wraps it
                 ctk.CTkLabel(
-                    content_frame,
+                    crit_frame,
                     text=desc_text,
-                    font=ctk.CTkFont(size=11),
+                    font=self._font_detail,
                     anchor="w",
                     wraplength=700
-                ).pack(anchor="w", pady=2)
+                ).grid(row=1, column=0, columnspan=2, sticky="w", padx=10, pady=(2, 7))
+
+        # Place the container once its contents are laid out, so the list is
+        # only reflowed once per criterion
+        crit_frame.pack(fill="x", pady=5, padx=5)
 
     def _confirm_import(self):
         """Confirm and proceed with import."""
@@ -210,38 +258,10 @@ class ExcelPreviewDialog(ctk.CTkToplevel):
         self.confirmed = True
 
         # Build rubric object
-        from core.rubric import RubricCriterion, PerformanceLevel
-        criteria = []
-        for crit_data in self.parsed_data.criteria_data:
-            if self.parsed_data.is_analytic and crit_data['performance_levels']:
-                # Create criterion with performance levels
-                perf_levels = [
-                    PerformanceLevel(
-                        name=pl['name'],
-                        score_range=pl['score_range'],
-                        description=pl['description']
-                    )
-                    for pl in crit_data['performance_levels']
-                ]
-                criterion = RubricCriterion(
-                    name=crit_data['name'],
-                    weight=crit_data['weight'],
-                    performance_levels=perf_levels
-                )
-            else:
-                # Simple criterion
-                criterion = RubricCriterion(
-                    name=crit_data['name'],
-                    description=crit_data['description'],
-                    weight=crit_data['weight']
-                )
-
-            criteria.append(criterion)
-
         rubric = Rubric(
             name=self.parsed_data.rubric_name,
             description=self.parsed_data.rubric_description,
-            criteria=criteria
+            criteria=list(self.parsed_data.criteria_data)
         )
 
         if self.on_confirm_callback:
@@ -6,15 +6,231 @@ import customtkinter as ctk
 from tkinter import filedialog, messagebox
 from typing import Optional, Callable
 from pathlib import Path
-import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 
 from core.feedback import OrganizedFeedback, StructuredFeedback, FeedbackOrganizer
 from core.export import FeedbackExporter
 from core.rubric import Rubric, RubricManager
-from core.settings import SettingsManager
+from core.settings import AppSettings, SettingsManager
 from ui.rubric_dialog import RubricSelectorDialog
 
 
+# Provider ids (as stored in settings) and their dropdown labels
+_PROVIDER_ID_TO_DISPLAY = {
+    "ollama": "Ollama",
+    "openai": "OpenAI",
+    "anthropic": "Anthropic",
+    "openrouter": "OpenRouter",
+    "llamacpp": "llama.cpp"
+}
+_PROVIDER_DISPLAY_TO_ID = {display: id_ for id_, display in _PROVIDER_ID_TO_DISPLAY.items()}
+
+# Feedback modes and their dropdown labels
+_MODE_ID_TO_DISPLAY = {
+    "organized": "Organized",
+    "structured": "Structured"
+}
+_MODE_DISPLAY_TO_ID = {display: id_ for id_, display in _MODE_ID_TO_DISPLAY.items()}
+
+# Phrases (lowercase) that identify the kind of provider error
+_AUTH_ERROR_PHRASES = ("401", "invalid_api_key", "incorrect api key", "unauthorized", "authentication")
+_QUOTA_ERROR_PHRASES = ("429", "quota", "rate limit", "insufficient_quota")
+_NETWORK_ERROR_PHRASES = ("connection", "timeout", "network", "unreachable")
+_POLICY_ERROR_PHRASES = ("404", "data policy", "no endpoints found", "privacy")
+
+
+@lru_cache(maxsize=128)
+def _build_provider_error_message(provider_name: str, exception_msg: str) -> str:
+    """Generate helpful error message based on provider (cached; failures tend to repeat)."""
+    # Parse common error patterns
+    message = exception_msg.lower()
+    is_auth_error = any(phrase in message for phrase in _AUTH_ERROR_PHRASES)
+    is_quota_error = any(phrase in message for phrase in _QUOTA_ERROR_PHRASES)
+    is_network_error = any(phrase in message for phrase in _NETWORK_ERROR_PHRASES)
+    is_policy_error = any(phrase in message for phrase in _POLICY_ERROR_PHRASES)
+
+    if provider_name == "ollama":
+        return (
+            "❌ Ollama Connection Failed\n\n"
+            "Ollama is not running or not installed.\n\n"
+            "To fix this:\n"
+            "1. Download Ollama from: https://ollama.com/download\n"
+            "2. Install and run Ollama\n"
+            "3. Run: ollama pull llama2\n"
+            "4. Make sure Ollama is running in the background\n\n"
+            "Or switch to OpenAI/Anthropic in Settings."
+        )
+
+    elif provider_name == "openai":
+        if is_auth_error:
+            return (
+                "❌ Invalid OpenAI API Key\n\n"
+                "Your OpenAI API key is incorrect or missing.\n\n"
+                "To fix this:\n"
+                "1. Go to: https://platform.openai.com/api-keys\n"
+                "2. Create a new API key or copy your existing key\n"
+                "3. Click the ⚙ Settings button (top right)\n"
+                "4. Select 'LLM Provider' tab\n"
+                "5. Paste your API key in the OpenAI API Key field\n"
+                "6. Click Save\n\n"
+                "Note: Make sure you copy the complete key starting with 'sk-'"
+            )
+        elif is_quota_error:
+            return (
+                "❌ OpenAI Quota Exceeded\n\n"
+                "You have exceeded your OpenAI usage quota or rate limit.\n\n"
+                "To fix this:\n"
+                "1. Check your usage at: https://platform.openai.com/usage\n"
+                "2. Add credits to your account if needed\n"
+                "3. Wait a few minutes if you hit the rate limit\n\n"
+                "Or switch to Ollama (free) or Anthropic in Settings."
+            )
+        elif is_network_error:
+            return (
+                "❌ OpenAI Connection Error\n\n"
+                "Cannot connect to OpenAI servers.\n\n"
+                "To fix this:\n"
+                "1. Check your internet connection\n"
+                "2. Try again in a few moments\n"
+                "3. Check if OpenAI services are down: https://status.openai.com\n\n"
+                "Or switch to Ollama (local) in Settings."
+            )
+        else:
+            return (
+                "❌ OpenAI Error\n\n"
+                "An error occurred with OpenAI API.\n\n"
+                f"Error details: {exception_msg}\n\n"
+                "To fix this:\n"
+                "1. Click ⚙ Settings and verify your OpenAI API key\n"
+                "2. Make sure you have credits in your account\n"
+                "3. Try switching to Ollama or Anthropic"
+            )
+
+    elif provider_name == "anthropic":
+        if is_auth_error:
+            return (
+                "❌ Invalid Anthropic API Key\n\n"
+                "Your Anthropic API key is incorrect or missing.\n\n"
+                "To fix this:\n"
+                "1. Go to: https://console.anthropic.com/settings/keys\n"
+                "2. Create a new API key or copy your existing key\n"
+                "3. Click the ⚙ Settings button (top right)\n"
+                "4. Select 'LLM Provider' tab\n"
+                "5. Paste your API key in the Anthropic API Key field\n"
+                "6. Click Save\n\n"
+                "Note: Make sure you copy the complete key starting with 'sk-ant-'"
+            )
+        elif is_quota_error:
+            return (
+                "❌ Anthropic Quota Exceeded\n\n"
+                "You have exceeded your Anthropic usage quota or rate limit.\n\n"
+                "To fix this:\n"
+                "1. Check your usage at: https://console.anthropic.com\n"
+                "2. Add credits to your account if needed\n"
+                "3. Wait a few minutes if you hit the rate limit\n\n"
+                "Or switch to Ollama (free) or OpenAI in Settings."
+            )
+        elif is_network_error:
+            return (
+                "❌ Anthropic Connection Error\n\n"
+                "Cannot connect to Anthropic servers.\n\n"
+                "To fix this:\n"
+                "1. Check your internet connection\n"
+                "2. Try again in a few moments\n"
+                "3. Check if Anthropic services are down\n\n"
+                "Or switch to Ollama (local) in Settings."
+            )
+        else:
+            return (
+                "❌ Anthropic Error\n\n"
+                "An error occurred with Anthropic API.\n\n"
+                f"Error details: {exception_msg}\n\n"
+                "To fix this:\n"
+                "1. Click ⚙ Settings and verify your Anthropic API key\n"
+                "2. Make sure you have credits in your account\n"
+                "3. Try switching to Ollama or OpenAI"
+            )
+
+    elif provider_name == "openrouter":
+        if is_policy_error:
+            return (
+                "❌ OpenRouter Data Policy Configuration Required\n\n"
+                "Free models require specific privacy settings.\n\n"
+                "To fix this:\n"
+                "1. Go to: https://openrouter.ai/settings/privacy\n"
+                "2. Under 'Model Data Policies', enable:\n"
+                "   ✓ Allow free models\n"
+                "   ✓ Allow fallback to free models\n"
+                "3. Save your privacy settings\n"
+                "4. Return here and click 'Organize' again\n\n"
+                "Working free models:\n"
+                "• meta-llama/llama-3.1-8b-instruct:free\n"
+                "• google/gemma-2-9b-it:free\n"
+                "• qwen/qwen-2.5-7b-instruct:free\n\n"
+                "Note: Make sure your model name ends with ':free'"
+            )
+        elif is_auth_error:
+            return (
+                "❌ Invalid OpenRouter API Key\n\n"
+                "Your OpenRouter API key is incorrect or missing.\n\n"
+                "To fix this:\n"
+                "1. Go to: https://openrouter.ai/keys\n"
+                "2. Create a new API key or copy your existing key\n"
+                "3. Click the ⚙ Settings button (top right)\n"
+                "4. Select 'LLM Provider' tab\n"
+                "5. Select 'OpenRouter' option\n"
+                "6. Paste your API key in the API Key field\n"
+                "7. Click Save\n\n"
+                "Note: OpenRouter offers free models like Llama 3.1!"
+            )
+        elif is_quota_error:
+            return (
+                "❌ OpenRouter Quota Exceeded\n\n"
+                "You have exceeded your OpenRouter usage quota or rate limit.\n\n"
+                "To fix this:\n"
+                "1. Check your usage at: https://openrouter.ai/activity\n"
+                "2. Add credits to your account if using paid models\n"
+                "3. Switch to free models (e.g., meta-llama/llama-3.1-8b-instruct:free)\n"
+                "4. Wait a few minutes if you hit the rate limit\n\n"
+                "Or switch to Ollama (local, free) in Settings."
+            )
+        elif is_network_error:
+            return (
+                "❌ OpenRouter Connection Error\n\n"
+                "Cannot connect to OpenRouter servers.\n\n"
+                "To fix this:\n"
+                "1. Check your internet connection\n"
+                "2. Try again in a few moments\n"
+                "3. Check if OpenRouter services are down\n\n"
+                "Or switch to Ollama (local) in Settings."
+            )
+        else:
+            return (
+                "❌ OpenRouter Error\n\n"
+                "An error occurred with OpenRouter API.\n\n"
+                f"Error details: {exception_msg}\n\n"
+                "To fix this:\n"
+                "1. Click ⚙ Settings and verify your OpenRouter API key\n"
+                "2. Check that the model name is correct\n"
+                "3. See available models at: https://openrouter.ai/models\n"
+                "4. Try switching to a free model or Ollama"
+            )
+
+    elif provider_name == "llamacpp":
+        return (
+            "❌ llama.cpp Server Connection Failed\n\n"
+            "llama-server is not running or not reachable.\n\n"
+            "To fix this:\n"
+            "1. Start the server: llama-server -m model.gguf -np 4 --cache-reuse 256\n"
+            "2. Check the Base URL in ⚙ Settings (default http://localhost:8080/v1)\n\n"
+            "Or switch to Ollama/OpenAI/Anthropic in Settings."
+        )
+
+    else:
+        return f"❌ Failed to organize feedback.\n\n{exception_msg}"
+
+
 class FeedbackPanel(ctk.CTkFrame):
     """Panel for displaying and managing organized feedback."""
 
@@ -38,6 +254,17 @@ class FeedbackPanel(ctk.CTkFrame):
         self.current_transcript: str = ""
         self.selected_provider: Optional[str] = None  # Override provider
 
+        # Worker threads for LLM requests; only the latest request's result is shown
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="feedback")
+        self._organize_future: Optional[Future] = None
+        self._organize_generation = 0
+        self._streamed_generation = 0  # Request whose criteria are being shown as they stream in
+
+        # Settings snapshot shared by the panel's handlers, and the settings
+        # revision it was taken at
+        self._settings_cache: Optional[AppSettings] = None
+        self._settings_revision = -1
+
         self._create_ui()
         self._initialize_provider_dropdown()
         self._load_last_rubric()
@@ -132,12 +359,23 @@ class FeedbackPanel(ctk.CTkFrame):
         )
         self.organize_btn.pack(side="left", padx=2)
 
+        # Asks the LLM again instead of reusing a cached response
+        self.regenerate_btn = ctk.CTkButton(
+            button_container,
+            text="Regenerate",
+            command=lambda: self._organize_feedback(use_cache=False),
+            width=90,
+            height=32,
+            state="disabled"
+        )
+        self.regenerate_btn.pack(side="left", padx=2)
+
         # Feedback mode selector
         self.mode_var = ctk.StringVar(value="")
         self.mode_dropdown = ctk.CTkOptionMenu(
             button_container,
             variable=self.mode_var,
-            values=["Organized", "Structured"],
+            values=list(_MODE_ID_TO_DISPLAY.values()),
             width=110,
             height=32
         )
@@ -148,7 +386,7 @@ class FeedbackPanel(ctk.CTkFrame):
         self.provider_dropdown = ctk.CTkOptionMenu(
             button_container,
             variable=self.provider_var,
-            values=["Ollama", "OpenAI", "Anthropic", "OpenRouter"],
+            values=list(_PROVIDER_ID_TO_DISPLAY.values()),
             width=120,
             height=32,
             command=self._on_provider_changed
@@ -215,36 +453,33 @@ class FeedbackPanel(ctk.CTkFrame):
         )
         self.transcript_toggle_btn.pack(pady=2)
 
+    def _settings(self) -> AppSettings:
+        """
+        Current settings, re-read only after they have been saved.
+
+        The snapshot is shared between calls (and the worker thread), so treat
+        it as read-only; change settings through the settings manager.
+        """
+        revision = self.settings_manager.revision
+        if self._settings_cache is None or self._settings_revision != revision:
+            self._settings_cache = self.settings_manager.load_settings()
+            self._settings_revision = revision
+        return self._settings_cache
+
     def _initialize_provider_dropdown(self):
         """Initialize provider and mode with settings default."""
-        settings = self.settings_manager.load_settings()
-        provider_map = {
-            "ollama": "Ollama",
-            "openai": "OpenAI",
-            "anthropic": "Anthropic",
-            "openrouter": "OpenRouter"
-        }
-        default_provider = provider_map.get(settings.llm.provider, "Ollama")
+        settings = self._settings()
+        default_provider = _PROVIDER_ID_TO_DISPLAY.get(settings.llm.provider, "Ollama")
         self.provider_var.set(default_provider)
         self.selected_provider = settings.llm.provider
 
         # Initialize mode selector
-        mode_map = {
-            "organized": "Organized",
-            "structured": "Structured"
-        }
-        default_mode = mode_map.get(settings.feedback.feedback_mode, "Organized")
+        default_mode = _MODE_ID_TO_DISPLAY.get(settings.feedback.feedback_mode, "Organized")
         self.mode_var.set(default_mode)
 
     def _on_provider_changed(self, choice: str):
         """Handle provider selection change."""
-        provider_map = {
-            "Ollama": "ollama",
-            "OpenAI": "openai",
-            "Anthropic": "anthropic",
-            "OpenRouter": "openrouter"
-        }
-        self.selected_provider = provider_map.get(choice, "ollama")
+        self.selected_provider = _PROVIDER_DISPLAY_TO_ID.get(choice, "ollama")
 
     def _adjust_font_size(self, delta: int):
         """Adjust feedback display font size."""
@@ -358,10 +593,9 @@ class FeedbackPanel(ctk.CTkFrame):
 
     def _update_organize_button(self):
         """Update organize button state based on transcript and rubric availability."""
-        if self.current_transcript and self.current_rubric:
-            self.organize_btn.configure(state="normal")
-        else:
-            self.organize_btn.configure(state="disabled")
+        state = "normal" if self.current_transcript and self.current_rubric else "disabled"
+        self.organize_btn.configure(state=state)
+        self.regenerate_btn.configure(state=state)
 
     def _select_rubric(self):
         """Open rubric selector dialog."""
@@ -373,7 +607,7 @@ class FeedbackPanel(ctk.CTkFrame):
 
     def _load_last_rubric(self):
         """Load the last selected rubric from settings."""
-        settings = self.settings_manager.load_settings()
+        settings = self._settings()
         if settings.feedback.last_selected_rubric:
             try:
                 # Try to load the rubric
@@ -407,7 +641,7 @@ class FeedbackPanel(ctk.CTkFrame):
                 instance._sync_rubric_selection(rubric)
 
         # Auto-organize if transcript exists and auto-organize is enabled
-        settings = self.settings_manager.load_settings()
+        settings = self._settings()
         if settings.feedback.auto_organize and self.current_transcript:
             self._organize_feedback()
 
@@ -421,70 +655,117 @@ class FeedbackPanel(ctk.CTkFrame):
         self._update_organize_button()
         # Don't auto-organize or save to settings - that's already done by the originating panel
 
-    def _organize_feedback(self):
-        """Organize feedback using LLM."""
+    def _organize_feedback(self, use_cache: bool = True):
+        """
+        Organize feedback using LLM.
+
+        Args:
+            use_cache: Reuse a cached response for the same request, if there is one
+        """
         if not self.current_transcript or not self.current_rubric:
             return
 
         # Use selected provider or fall back to settings default
         provider_name = self.selected_provider
         if not provider_name:
-            settings = self.settings_manager.load_settings()
+            settings = self._settings()
             provider_name = settings.llm.provider
 
-        # Try to auto-start Ollama if selected
-        if provider_name == "ollama":
-            self._try_start_ollama()
-
         # Determine mode (from dropdown or settings)
-        mode_map = {"Organized": "organized", "Structured": "structured"}
-        selected_mode = mode_map.get(self.mode_var.get(), "organized")
+        selected_mode = _MODE_DISPLAY_TO_ID.get(self.mode_var.get(), "organized")
 
         # Disable button and show progress
         self.organize_btn.configure(state="disabled", text="Organizing...")
-        provider_display = {"ollama": "Ollama", "openai": "OpenAI", "anthropic": "Anthropic"}.get(provider_name, provider_name)
+        self.regenerate_btn.configure(state="disabled")
+        provider_display = _PROVIDER_ID_TO_DISPLAY.get(provider_name, provider_name)
         self._show_message(f"Organizing feedback using {provider_display}...\nThis may take a moment.")
 
-        def organize_thread():
-            try:
-                settings = self.settings_manager.load_settings()
-
-                # Choose between organized and structured feedback
-                if selected_mode == "structured":
-                    # Use structured feedback conversion
-                    result = self.feedback_organizer.organize_structured_feedback(
-                        transcript=self.current_transcript,
-                        rubric=self.current_rubric,
-                        instruction_prompt=settings.feedback.instruction_prompt,
-                        provider_name=provider_name
-                    )
-                else:
-                    # Use traditional organized feedback
-                    result = self.feedback_organizer.organize_feedback(
-                        transcript=self.current_transcript,
-                        rubric=self.current_rubric,
-                        detail_level=settings.feedback.feedback_detail_level,
-                        provider_name=provider_name
+        # A newer request supersedes one still waiting or running
+        if self._organize_future and not self._organize_future.done():
+            self._organize_future.cancel()
+        self._organize_generation += 1
+        self._organize_future = self._executor.submit(
+            self._run_organize, provider_name, selected_mode, self._organize_generation, use_cache
+        )
+
+    def _run_organize(self, provider_name: str, selected_mode: str, generation: int, use_cache: bool):
+        """Organize the current transcript (runs in a worker thread)."""
+        try:
+            # Try to auto-start Ollama if selected
+            if provider_name == "ollama":
+                self._try_start_ollama()
+
+            settings = self._settings()
+
+            # Choose between organized and structured feedback
+            if selected_mode == "structured":
+                # Use structured feedback conversion
+                result = self.feedback_organizer.organize_structured_feedback(
+                    transcript=self.current_transcript,
+                    rubric=self.current_rubric,
+                    instruction_prompt=settings.feedback.instruction_prompt,
+                    provider_name=provider_name
+                )
+            else:
+                # Use traditional organized feedback
+                result = self.feedback_organizer.organize_feedback(
+                    transcript=self.current_transcript,
+                    rubric=self.current_rubric,
+                    detail_level=settings.feedback.feedback_detail_level,
+                    provider_name=provider_name,
+                    use_cache=use_cache,
+                    on_criterion=lambda criterion, text: self.after(
+                        0, lambda: self._show_streamed_criterion(generation, criterion, text)
                     )
+                )
 
-                if result:
-                    # Include raw transcript if setting is enabled
-                    if not settings.feedback.include_raw_transcript:
-                        result.raw_transcript = ""
+            if generation != self._organize_generation:
+                return  # Superseded by a newer request
 
-                    self.current_feedback = result
-                    self.after(0, lambda: self._display_feedback(result))
-                else:
-                    error_msg = self._get_provider_error_message(provider_name)
-                    self.after(0, lambda: self._show_error(error_msg))
+            if result:
+                # Include raw transcript if setting is enabled
+                if not settings.feedback.include_raw_transcript:
+                    result.raw_transcript = ""
 
-            except Exception as e:
+                self.current_feedback = result
+                self.after(0, lambda: self._display_feedback(result))
+            else:
+                error_msg = self._get_provider_error_message(provider_name)
+                self.after(0, lambda: self._show_error(error_msg))
+
+        except Exception as e:
+            if generation == self._organize_generation:
                 error_msg = self._get_provider_error_message(provider_name, str(e))
                 self.after(0, lambda: self._show_error(error_msg))
-            finally:
-                self.after(0, lambda: self.organize_btn.configure(state="normal", text="Organize"))
+        finally:
+            if generation == self._organize_generation:
+                self.after(0, self._finish_organize)
+
+    def _finish_organize(self):
+        """Re-enable the organize buttons once a request is done."""
+        self.organize_btn.configure(text="Organize")
+        self._update_organize_button()
 
-        threading.Thread(target=organize_thread, daemon=True).start()
+    def _show_streamed_criterion(self, generation: int, criterion: str, text: str):
+        """Show one criterion's feedback as soon as it has streamed in."""
+        if generation != self._organize_generation:
+            return  # Superseded by a newer request
+
+        is_first = self._streamed_generation != generation
+        if is_first:
+            # The first criterion replaces the progress message
+            self._streamed_generation = generation
+            for widget in self.feedback_scroll.winfo_children():
+                widget.destroy()
+
+        self._create_feedback_section(criterion, text, is_first=is_first)
+
+    def destroy(self):
+        """Stop queued LLM requests and destroy the panel."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        if self in FeedbackPanel._all_instances:
+            FeedbackPanel._all_instances.remove(self)
+        super().destroy()
 
     def _try_start_ollama(self):
         """Attempt to start Ollama if it's not running."""
@@ -522,185 +803,7 @@ class FeedbackPanel(ctk.CTkFrame):
 
     def _get_provider_error_message(self, provider_name: str, exception_msg: str = "") -> str:
         """Generate helpful error message based on provider."""
-        # Parse common error patterns
-        is_auth_error = any(phrase in exception_msg.lower() for phrase in
-                           ["401", "invalid_api_key", "incorrect api key", "unauthorized", "authentication"])
-        is_quota_error = any(phrase in exception_msg.lower() for phrase in
-                            ["429", "quota", "rate limit", "insufficient_quota"])
-        is_network_error = any(phrase in exception_msg.lower() for phrase in
-                              ["connection", "timeout", "network", "unreachable"])
-        is_policy_error = any(phrase in exception_msg.lower() for phrase in
-                             ["404", "data policy", "no endpoints found", "privacy"])
-
-        if provider_name == "ollama":
-            return (
-                "❌ Ollama Connection Failed\n\n"
-                "Ollama is not running or not installed.\n\n"
-                "To fix this:\n"
-                "1. Download Ollama from: https://ollama.com/download\n"
-                "2. Install and run Ollama\n"
-                "3. Run: ollama pull llama2\n"
-                "4. Make sure Ollama is running in the background\n\n"
-                "Or switch to OpenAI/Anthropic in Settings."
-            )
-
-        elif provider_name == "openai":
-            if is_auth_error:
-                return (
-                    "❌ Invalid OpenAI API Key\n\n"
-                    "Your OpenAI API key is incorrect or missing.\n\n"
-                    "To fix this:\n"
-                    "1. Go to: https://platform.openai.com/api-keys\n"
-                    "2. Create a new API key or copy your existing key\n"
-                    "3. Click the ⚙ Settings button (top right)\n"
-                    "4. Select 'LLM Provider' tab\n"
-                    "5. Paste your API key in the OpenAI API Key field\n"
-                    "6. Click Save\n\n"
-                    "Note: Make sure you copy the complete key starting with 'sk-'"
-                )
-            elif is_quota_error:
-                return (
-                    "❌ OpenAI Quota Exceeded\n\n"
-                    "You have exceeded your OpenAI usage quota or rate limit.\n\n"
-                    "To fix this:\n"
-                    "1. Check your usage at: https://platform.openai.com/usage\n"
-                    "2. Add credits to your account if needed\n"
-                    "3. Wait a few minutes if you hit the rate limit\n\n"
-                    "Or switch to Ollama (free) or Anthropic in Settings."
-                )
-            elif is_network_error:
-                return (
-                    "❌ OpenAI Connection Error\n\n"
-                    "Cannot connect to OpenAI servers.\n\n"
-                    "To fix this:\n"
-                    "1. Check your internet connection\n"
-                    "2. Try again in a few moments\n"
-                    "3. Check if OpenAI services are down: https://status.openai.com\n\n"
-                    "Or switch to Ollama (local) in Settings."
-                )
-            else:
-                return (
-                    "❌ OpenAI Error\n\n"
-                    "An error occurred with OpenAI API.\n\n"
-                    f"Error details: {exception_msg}\n\n"
-                    "To fix this:\n"
-                    "1. Click ⚙ Settings and verify your OpenAI API key\n"
-                    "2. Make sure you have credits in your account\n"
-                    "3. Try switching to Ollama or Anthropic"
-                )
-
-        elif provider_name == "anthropic":
-            if is_auth_error:
-                return (
-                    "❌ Invalid Anthropic API Key\n\n"
-                    "Your Anthropic API key is incorrect or missing.\n\n"
-                    "To fix this:\n"
-                    "1. Go to: https://console.anthropic.com/settings/keys\n"
-                    "2. Create a new API key or copy your existing key\n"
-                    "3. Click the ⚙ Settings button (top right)\n"
-                    "4. Select 'LLM Provider' tab\n"
-                    "5. Paste your API key in the Anthropic API Key field\n"
-                    "6. Click Save\n\n"
-                    "Note: Make sure you copy the complete key starting with 'sk-ant-'"
-                )
-            elif is_quota_error:
-                return (
-                    "❌ Anthropic Quota Exceeded\n\n"
-                    "You have exceeded your Anthropic usage quota or rate limit.\n\n"
-                    "To fix this:\n"
-                    "1. Check your usage at: https://console.anthropic.com\n"
-                    "2. Add credits to your account if needed\n"
-                    "3. Wait a few minutes if you hit the rate limit\n\n"
-                    "Or switch to Ollama (free) or OpenAI in Settings."
-                )
-            elif is_network_error:
-                return (
-                    "❌ Anthropic Connection Error\n\n"
-                    "Cannot connect to Anthropic servers.\n\n"
-                    "To fix this:\n"
-                    "1. Check your internet connection\n"
-                    "2. Try again in a few moments\n"
-                    "3. Check if Anthropic services are down\n\n"
-                    "Or switch to Ollama (local) in Settings."
-                )
-            else:
-                return (
-                    "❌ Anthropic Error\n\n"
-                    "An error occurred with Anthropic API.\n\n"
-                    f"Error details: {exception_msg}\n\n"
-                    "To fix this:\n"
-                    "1. Click ⚙ Settings and verify your Anthropic API key\n"
-                    "2. Make sure you have credits in your account\n"
-                    "3. Try switching to Ollama or OpenAI"
-                )
-
-        elif provider_name == "openrouter":
-            if is_policy_error:
-                return (
-                    "❌ OpenRouter Data Policy Configuration Required\n\n"
-                    "Free models require specific privacy settings.\n\n"
-                    "To fix this:\n"
-                    "1. Go to: https://openrouter.ai/settings/privacy\n"
-                    "2. Under 'Model Data Policies', enable:\n"
-                    "   ✓ Allow free models\n"
-                    "   ✓ Allow fallback to free models\n"
-                    "3. Save your privacy settings\n"
-                    "4. Return here and click 'Organize' again\n\n"
-                    "Working free models:\n"
-                    "• meta-llama/llama-3.1-8b-instruct:free\n"
-                    "• google/gemma-2-9b-it:free\n"
-                    "• qwen/qwen-2.5-7b-instruct:free\n\n"
-                    "Note: Make sure your model name ends with ':free'"
-                )
-            elif is_auth_error:
-                return (
-                    "❌ Invalid OpenRouter API Key\n\n"
-                    "Your OpenRouter API key is incorrect or missing.\n\n"
-                    "To fix this:\n"
-                    "1. Go to: https://openrouter.ai/keys\n"
-                    "2. Create a new API key or copy your existing key\n"
-                    "3. Click the ⚙ Settings button (top right)\n"
-                    "4. Select 'LLM Provider' tab\n"
-                    "5. Select 'OpenRouter' option\n"
-                    "6. Paste your API key in the API Key field\n"
-                    "7. Click Save\n\n"
-                    "Note: OpenRouter offers free models like Llama 3.1!"
-                )
-            elif is_quota_error:
-                return (
-                    "❌ OpenRouter Quota Exceeded\n\n"
-                    "You have exceeded your OpenRouter usage quota or rate limit.\n\n"
-                    "To fix this:\n"
-                    "1. Check your usage at: https://openrouter.ai/activity\n"
-                    "2. Add credits to your account if using paid models\n"
-                    "3. Switch to free models (e.g., meta-llama/llama-3.1-8b-instruct:free)\n"
-                    "4. Wait a few minutes if you hit the rate limit\n\n"
-                    "Or switch to Ollama (local, free) in Settings."
-                )
-            elif is_network_error:
-                return (
-                    "❌ OpenRouter Connection Error\n\n"
-                    "Cannot connect to OpenRouter servers.\n\n"
-                    "To fix this:\n"
-                    "1. Check your internet connection\n"
-                    "2. Try again in a few moments\n"
-                    "3. Check if OpenRouter services are down\n\n"
-                    "Or switch to Ollama (local) in Settings."
-                )
-            else:
-                return (
-                    "❌ OpenRouter Error\n\n"
-                    "An error occurred with OpenRouter API.\n\n"
-                    f"Error details: {exception_msg}\n\n"
-                    "To fix this:\n"
-                    "1. Click ⚙ Settings and verify your OpenRouter API key\n"
-                    "2. Check that the model name is correct\n"
-                    "3. See available models at: https://openrouter.ai/models\n"
-                    "4. Try switching to a free model or Ollama"
-                )
-
-        else:
-            return f"❌ Failed to organize feedback.\n\n{exception_msg}"
+        return _build_provider_error_message(provider_name, exception_msg)
 
     def _display_feedback(self, feedback):
         """Display organized or structured feedback with copy buttons for each section."""
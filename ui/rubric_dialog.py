@@ -649,11 +649,15 @@ class RubricSelectorDialog(ctk.CTkToplevel):
 
     def _do_excel_import(self, file_path: Path):
         """Perform Excel import after ensuring openpyxl is available."""
-        from core.excel_import import ExcelRubricImporter
+        from core.excel_import import ExcelRubricImporter, UncalculatedFormulasError
         from ui.excel_preview_dialog import ExcelPreviewDialog
 
         # Parse Excel file
-        parsed_data = ExcelRubricImporter.parse_excel(file_path)
+        try:
+            parsed_data = ExcelRubricImporter.parse_excel(file_path)
+        except UncalculatedFormulasError as e:
+            messagebox.showerror("Error", f"Failed to parse Excel file.\n\n{e}")
+            return
         if not parsed_data:
             messagebox.showerror("Error", "Failed to parse Excel file")
             return
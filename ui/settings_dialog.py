@@ -6,6 +6,9 @@ from tkinter import messagebox
 from typing import Optional, Callable
 
 from core.settings import SettingsManager, AppSettings, LLMProvider
+from core.feedback import (
+    RESPONSE_CACHE_DIR, RESPONSE_CACHE_MAX_AGE_DAYS, RESPONSE_CACHE_MAX_ENTRIES, clear_response_cache
+)
 
 
 class SettingsDialog(ctk.CTkToplevel):
@@ -91,7 +94,8 @@ class SettingsDialog(ctk.CTkToplevel):
             ("Ollama (Local)", LLMProvider.OLLAMA.value),
             ("OpenAI", LLMProvider.OPENAI.value),
             ("Anthropic Claude", LLMProvider.ANTHROPIC.value),
-            ("OpenRouter", LLMProvider.OPENROUTER.value)
+            ("OpenRouter", LLMProvider.OPENROUTER.value),
+            ("llama.cpp Server (Local)", LLMProvider.LLAMACPP.value)
         ]
 
         for label, value in providers:
@@ -124,6 +128,10 @@ class SettingsDialog(ctk.CTkToplevel):
         self.openrouter_frame = ctk.CTkFrame(settings_scroll)
         self._create_openrouter_settings(self.openrouter_frame)
 
+        # llama.cpp settings
+        self.llamacpp_frame = ctk.CTkFrame(settings_scroll)
+        self._create_llamacpp_settings(self.llamacpp_frame)
+
     def _create_ollama_settings(self, parent):
         """Create Ollama settings section."""
         ctk.CTkLabel(
@@ -292,6 +300,40 @@ class SettingsDialog(ctk.CTkToplevel):
         )
         help_text.configure(state="disabled")
 
+    def _create_llamacpp_settings(self, parent):
+        """Create llama.cpp server settings section."""
+        ctk.CTkLabel(
+            parent,
+            text="llama.cpp Server Settings",
+            font=ctk.CTkFont(size=14, weight="bold")
+        ).pack(anchor="w", padx=10, pady=(10, 5))
+
+        # Base URL
+        url_frame = ctk.CTkFrame(parent)
+        url_frame.pack(fill="x", padx=10, pady=5)
+
+        ctk.CTkLabel(url_frame, text="Base URL:", width=120).pack(side="left", padx=5)
+        self.llamacpp_url_entry = ctk.CTkEntry(url_frame, width=300)
+        self.llamacpp_url_entry.pack(side="left", padx=5)
+
+        # Slots
+        slots_frame = ctk.CTkFrame(parent)
+        slots_frame.pack(fill="x", padx=10, pady=5)
+
+        ctk.CTkLabel(slots_frame, text="Slots:", width=120).pack(side="left", padx=5)
+        self.llamacpp_slots_entry = ctk.CTkEntry(slots_frame, width=80)
+        self.llamacpp_slots_entry.pack(side="left", padx=5)
+
+        # Help text
+        help_text = ctk.CTkTextbox(parent, height=80, fg_color="transparent")
+        help_text.pack(fill="x", padx=10, pady=10)
+        help_text.insert("1.0",
+            "Runs a GGUF model locally with llama.cpp's llama-server, e.g.:\n"
+            "llama-server -m model.gguf -np 4 --cache-reuse 256\n"
+            "Set Slots to the -np value. Each rubric is pinned to a slot so it is only processed once."
+        )
+        help_text.configure(state="disabled")
+
     def _create_feedback_tab(self):
         """Create feedback settings tab."""
         tab = self.tabview.tab("Feedback")
@@ -381,6 +423,38 @@ class SettingsDialog(ctk.CTkToplevel):
         )
         self.include_raw_check.pack(anchor="w", padx=10, pady=10)
 
+        # Response cache
+        cache_frame = ctk.CTkFrame(container)
+        cache_frame.pack(fill="x", padx=10, pady=10)
+
+        self.cache_responses_var = ctk.BooleanVar(value=True)
+        ctk.CTkCheckBox(
+            cache_frame,
+            text="Remember organized feedback on this computer",
+            variable=self.cache_responses_var
+        ).pack(anchor="w", padx=10, pady=(10, 5))
+
+        ctk.CTkLabel(
+            cache_frame,
+            text=(
+                f"Transcripts and their organized feedback are kept in {RESPONSE_CACHE_DIR} "
+                f"so re-organizing the same transcript doesn't call the LLM again. Entries are "
+                f"deleted after {RESPONSE_CACHE_MAX_AGE_DAYS} days, and at most "
+                f"{RESPONSE_CACHE_MAX_ENTRIES} are kept."
+            ),
+            font=ctk.CTkFont(size=10),
+            text_color="gray",
+            wraplength=500,
+            justify="left"
+        ).pack(anchor="w", padx=10, pady=(0, 5))
+
+        ctk.CTkButton(
+            cache_frame,
+            text="Clear Cached Feedback",
+            command=self._clear_response_cache,
+            width=180
+        ).pack(anchor="w", padx=10, pady=(0, 10))
+
         # Instruction prompt editor
         prompt_frame = ctk.CTkFrame(container)
         prompt_frame.pack(fill="both", expand=True, padx=10, pady=10)
@@ -412,6 +486,7 @@ class SettingsDialog(ctk.CTkToplevel):
         self.openai_frame.pack_forget()
         self.anthropic_frame.pack_forget()
         self.openrouter_frame.pack_forget()
+        self.llamacpp_frame.pack_forget()
 
         # Show selected
         provider = self.provider_var.get()
@@ -423,6 +498,8 @@ class SettingsDialog(ctk.CTkToplevel):
             self.anthropic_frame.pack(fill="both", expand=True, pady=10)
         elif provider == LLMProvider.OPENROUTER.value:
             self.openrouter_frame.pack(fill="both", expand=True, pady=10)
+        elif provider == LLMProvider.LLAMACPP.value:
+            self.llamacpp_frame.pack(fill="both", expand=True, pady=10)
 
     def _load_settings(self):
         """Load current settings into form."""
@@ -436,11 +513,14 @@ class SettingsDialog(ctk.CTkToplevel):
         self.anthropic_model_var.set(self.settings.llm.anthropic_model)
         self.openrouter_key_entry.insert(0, self.settings.llm.openrouter_api_key)
         self.openrouter_model_entry.insert(0, self.settings.llm.openrouter_model)
+        self.llamacpp_url_entry.insert(0, self.settings.llm.llamacpp_base_url)
+        self.llamacpp_slots_entry.insert(0, str(self.settings.llm.llamacpp_slots))
 
         # Feedback settings
         self.auto_organize_var.set(self.settings.feedback.auto_organize)
         self.detail_var.set(self.settings.feedback.feedback_detail_level)
         self.include_raw_var.set(self.settings.feedback.include_raw_transcript)
+        self.cache_responses_var.set(self.settings.llm.cache_responses)
         self.feedback_mode_var.set(self.settings.feedback.feedback_mode)
         self.instruction_prompt_text.insert("1.0", self.settings.feedback.instruction_prompt)
 
@@ -459,11 +539,17 @@ class SettingsDialog(ctk.CTkToplevel):
         self.settings.llm.anthropic_model = self.anthropic_model_var.get()
         self.settings.llm.openrouter_api_key = self.openrouter_key_entry.get()
         self.settings.llm.openrouter_model = self.openrouter_model_entry.get()
+        self.settings.llm.llamacpp_base_url = self.llamacpp_url_entry.get()
+        try:
+            self.settings.llm.llamacpp_slots = max(1, int(self.llamacpp_slots_entry.get()))
+        except ValueError:
+            pass  # Keep the previous slot count
 
         # Update feedback settings
         self.settings.feedback.auto_organize = self.auto_organize_var.get()
         self.settings.feedback.feedback_detail_level = self.detail_var.get()
         self.settings.feedback.include_raw_transcript = self.include_raw_var.get()
+        self.settings.llm.cache_responses = self.cache_responses_var.get()
         self.settings.feedback.feedback_mode = self.feedback_mode_var.get()
         self.settings.feedback.instruction_prompt = self.instruction_prompt_text.get("1.0", "end-1c")
 
@@ -476,6 +562,13 @@ class SettingsDialog(ctk.CTkToplevel):
         else:
             messagebox.showerror("Error", "Failed to save settings")
 
+    def _clear_response_cache(self):
+        """Delete all cached LLM responses."""
+        if clear_response_cache():
+            messagebox.showinfo("Success", "Cached feedback cleared")
+        else:
+            messagebox.showerror("Error", "Failed to clear cached feedback")
+
     def _reset_defaults(self):
         """Reset settings to defaults."""
         if messagebox.askyesno("Confirm", "Reset all settings to defaults?"):
@@ -488,6 +581,8 @@ class SettingsDialog(ctk.CTkToplevel):
             self.anthropic_key_entry.delete(0, "end")
             self.openrouter_key_entry.delete(0, "end")
             self.openrouter_model_entry.delete(0, "end")
+            self.llamacpp_url_entry.delete(0, "end")
+            self.llamacpp_slots_entry.delete(0, "end")
 
             self._load_settings()
             messagebox.showinfo("Success", "Settings reset to defaults")